@@ -37,6 +37,27 @@ TICKERS: dict[str, str] = {
     "CME_BTC_FUTURES": "BTC=F",
 }
 
+# 동시 수집 (FetchScheduler) — source별 token bucket (분당 요청, 버스트)
+FETCH_CONFIG: dict = {
+    "max_workers": 8,
+    "rate_limits": {
+        "fred": {"per_min": 120, "burst": 10},       # FRED API 한도 120 req/min
+        "treasury": {"per_min": 60, "burst": 4},
+        "yahoo": {"per_min": 60, "burst": 4},
+    },
+}
+
+# 증분 수집 — 만료된 캐시는 (마지막 관측일 - 수정 구간)부터만 재요청 후 병합
+#   revision_days: source별 과거 값 수정 가능 구간 (일)
+#   series_revision_days: 시리즈별 예외 (M2 등 연간 벤치마크 수정)
+#   full_refresh_days: 이 기간마다 전체 재수집 (수정 구간 밖 개정 반영)
+DELTA_FETCH: dict = {
+    "enabled": True,
+    "revision_days": {"fred": 90, "treasury": 7, "yahoo": 7},
+    "series_revision_days": {"M2SL": 400, "MYAGM2CNM189N": 400},
+    "full_refresh_days": 30,
+}
+
 # ══════════════════════════════════════════
 # Fallback APIs
 # ══════════════════════════════════════════
@@ -51,6 +72,18 @@ BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
 SOFR_THRESHOLD_BPS: int = 20       # SOFR binary 임계값 (basis points)
 MA_WINDOW_MONTHS: int = 12         # 12m MA detrend 윈도우
 
+# PipelineRunner 스테이지 캐시 (fetch/calc/ortho/zscore 입력 해시 → 출력)
+STAGE_CACHE: dict = {
+    "enabled": True,
+    "keep_per_stage": 3,     # 스테이지별 보관 항목 수 (최근 사용 순)
+}
+
+# update 모드 증분 처리 — 이전 실행 상태 + 최근 월만 재계산
+UPDATE_CONFIG: dict = {
+    "recompute_months": 3,         # 마지막 N개월 재계산 (부분 월·FRED 수정·발표 지연)
+    "lookback_margin_months": 6,   # MA 윈도우 외 추가 raw 구간 (carry-forward 한도 포함)
+}
+
 # ══════════════════════════════════════════
 # Grid Search 탐색 범위
 # ══════════════════════════════════════════
@@ -63,6 +96,33 @@ GRID_SEARCH: dict = {
     "lag_months":  {"min": 0, "max": 9, "step": 1},
 }
 
+# Grid Search 평가 엔진
+GRID_SEARCH_ENGINE: dict = {
+    "engine": "moments",     # "moments" (lag별 충분통계량) | "batch" (Z @ W 블록) | "loop"
+    "batch_size": 4096,      # 블록당 가중치 조합 수 (G)
+    "top_k": 50,             # 보고할 상위 조합 수
+    "heap_size": 200,        # 스트리밍 heap 용량 (top_k + 동률 여유분)
+    "min_obs": 20,           # lag별 최소 유효 데이터 포인트
+    "tie_tol": 1e-9,         # 상위 후보 재검증 허용 오차 (corr)
+    "workers": 1,            # 병렬 프로세스 수 (main.py optimize --workers)
+}
+
+# 예산 제한 탐색 (GridSearchOptimizer.optimize_budgeted)
+GRID_SEARCH_BUDGET: dict = {
+    "max_evals": 20000,      # 가중치 조합 평가 예산 (조합당 전체 lag)
+    "max_seconds": None,     # wall-clock 예산 (초, None = 제한 없음)
+    "initial_samples": 1024, # 라운드 0 Sobol 샘플 수 (2의 거듭제곱)
+    "eta": 4,                # successive halving: 라운드마다 elite 1/eta 유지
+    "samples_per_center": 16,
+    "seed": 42,
+}
+
+# Closed-form 제약 최적화 (ClosedFormOptimizer)
+CLOSED_FORM: dict = {
+    "min_obs": 20,                             # lag별 최소 유효 데이터 포인트
+    "snap_scales": (1.0, 0.75, 0.5, 0.25),     # grid snap 시 box 내 최대 스케일 대비 배율
+}
+
 # ══════════════════════════════════════════
 # Walk-Forward 파라미터
 # ══════════════════════════════════════════
@@ -70,6 +130,10 @@ WALK_FORWARD: dict = {
     "initial_train": 60,   # 초기 훈련 윈도우 (월)
     "test_window": 6,      # 테스트 윈도우 (월)
     "expanding": True,     # expanding window
+    "engine": "loop",      # "loop" | "moments" (충분통계량 재사용)
+    # validate(reoptimize=True): window별 train 구간 재탐색
+    "reoptimize_engine": "moments",  # "moments" | "batch" (Grid Search) | "closed_form"
+    "workers": 1,          # window 병렬 프로세스 수
 }
 
 # ══════════════════════════════════════════
@@ -150,6 +214,12 @@ INDEX_BUILDER: dict = {
     "sparse_alpha": 1.0,     # Sparse PCA L1 페널티
 }
 
+# 적합된 builder artifact (.npz + 메타데이터) — Stage 1 재적합 생략
+INDEX_ARTIFACTS: dict = {
+    "enabled": True,
+    "keep_per_method": 5,    # method별 보관 artifact 수 (오래된 것부터 삭제)
+}
+
 # ── DFM (Dynamic Factor Model) ──
 DFM_CONFIG: dict = {
     "k_factors": 1,
@@ -172,11 +242,31 @@ XCORR_CONFIG: dict = {
     "min_lag": 0,
 }
 
+# ── Wavelet Coherence ──
+WAVELET_CONFIG: dict = {
+    "dj": 1 / 12,              # scale 간격 (octave당 12개)
+    "significance_level": 0.95,
+    "engine": "cached",        # "cached" (target CWT 재사용) | "pycwt" (wct 매번)
+    "cache_size": 8,           # target CWT 캐시 항목 수 (LRU)
+}
+
 # ── Bootstrap ──
 BOOTSTRAP_CONFIG: dict = {
     "n_bootstraps": 1000,
     "block_length": 12,      # 12개월 (연간 계절성 보존)
     "confidence_level": 0.95,
+    "max_slow_lag_samples": 200,   # lag_distribution: 배치 경로 없는 builder의 표본 상한
+    "adaptive": False,       # True: 순차 early-stopping (BOOTSTRAP_SEQUENTIAL)
+}
+
+# 순차 bootstrap: 배치마다 CI 끝점·nl_max_rate의 Monte Carlo 표준오차 확인
+BOOTSTRAP_SEQUENTIAL: dict = {
+    "batch_size": 100,       # 배치당 표본 수 (= checkpoint 간격)
+    "min_bootstraps": 200,   # 수렴 판정 시작 표본 수
+    "max_bootstraps": 5000,  # 예산 상한
+    "ci_mcse_tol": 0.01,     # loading CI 끝점 MCSE 허용치
+    "rate_mcse_tol": 0.01,   # nl_max_rate MCSE 허용치
+    "lag_mcse_tol": 0.5,     # lag CI 끝점 MCSE 허용치 (월)
 }
 
 # ── CPCV ──
@@ -185,12 +275,21 @@ CPCV_CONFIG: dict = {
     "n_test_folds": 2,       # C(10,2) = 45 paths
     "purge_threshold": 9,    # lag 길이
     "embargo": 2,
+    "workers": 1,            # split 병렬 프로세스 수 (main.py analyze/run --workers)
+    "fast_pca": True,        # PCA: fold 충분통계량으로 train 공분산 조립 (refit 생략)
 }
 
 # ── Granger Causality ──
 GRANGER_CONFIG: dict = {
     "max_lag": 12,
     "alpha": 0.05,
+    "engine": "batch",       # "batch" (양방향 공유 설계행렬) | "statsmodels"
+}
+
+# ── Rolling 선행성 분석 (RollingLeadAnalyzer) ──
+ROLLING_CONFIG: dict = {
+    "window": 60,            # 윈도우 길이 (월) — Granger max_lag 12 → 최소 38
+    "refresh_every": 24,     # 충분통계량 정확 재계산 주기 (스텝)
 }
 
 # ── 성공 기준 ──
@@ -31,10 +31,14 @@ VALIDATION_DIR = DATA_DIR / "validation"    # v2.0: 검증 결과
 SCORES_DIR = DATA_DIR / "scores"
 LOG_DIR = DATA_DIR / "logs"
 CHARTS_DIR = DATA_DIR / "charts"
+MODELS_DIR = DATA_DIR / "models"            # 적합된 index builder artifact
+STAGE_CACHE_DIR = DATA_DIR / "stage_cache"  # PipelineRunner 스테이지 출력 캐시
+RAW_STORE_PATH = DATA_DIR / "raw_store.db"  # 통합 raw 시계열 저장소 (SQLite)
+UPDATE_STATE_PATH = PROCESSED_DIR / "update_state.pkl"  # update 모드 증분 상태
 
 # 디렉토리 자동 생성
 for d in [RAW_DIR, PROCESSED_DIR, INDICES_DIR, VALIDATION_DIR,
-          SCORES_DIR, LOG_DIR, CHARTS_DIR]:
+          SCORES_DIR, LOG_DIR, CHARTS_DIR, MODELS_DIR, STAGE_CACHE_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 # ── Cache ──
@@ -55,7 +55,7 @@ def cmd_fetch(args):
 
 def cmd_optimize(args):
     """전체 최적화"""
-    runner = PipelineRunner(mode="full")
+    runner = PipelineRunner(mode="full", workers=args.workers)
     result = runner.run(
         start=args.start or DATA_START,
         end=args.end or DATA_END,
@@ -153,6 +153,23 @@ def cmd_visualize(args):
         else:
             print("  No walk-forward data available")
 
+    if viz_type in ("rolling", "all"):
+        from src.validators.rolling_analysis import RollingLeadAnalyzer
+        from src.visualization.overlay_chart import plot_rolling_lead
+        dated = z_data.set_index("date")
+        try:
+            analyzer = RollingLeadAnalyzer()
+            rolling = analyzer.analyze(dated["score"], dated["log_btc"])
+        except ValueError as e:
+            print(f"  Rolling lead skipped: {e}")
+        else:
+            if len(rolling):
+                csv_path = analyzer.export(rolling)
+                plot_rolling_lead(rolling, alpha=analyzer.alpha)
+                print(f"  Rolling lead → {CHARTS_DIR / 'rolling_lead.png'} ({csv_path})")
+            else:
+                print("  Rolling lead: insufficient data")
+
     if viz_type in ("wavelet", "all"):
         try:
             from src.validators.wavelet_coherence import WaveletCoherenceAnalyzer
@@ -279,7 +296,8 @@ def cmd_validate(args):
     target.index = range(len(target))
 
     runner = PipelineRunnerV2(method=args.method, freq=args.freq)
-    stage1 = runner.run_stage1(z_matrix)
+    # 새 달이 추가됐으면 재적합 대신 최신 artifact로 transform (--refit으로 재적합)
+    stage1 = runner.run_stage1(z_matrix, reuse_latest=not args.refit)
     result = runner.run_stage2(stage1["index"], target)
 
     print(f"\n[Stage 2] Validation complete")
@@ -309,7 +327,8 @@ def cmd_analyze(args):
     target = z_data["log_btc"].copy()
     target.index = range(len(target))
 
-    runner = PipelineRunnerV2(method=args.method, freq=args.freq)
+    runner = PipelineRunnerV2(method=args.method, freq=args.freq,
+                              workers=args.workers)
     result = runner.run_stage3(z_matrix, target)
 
     bootstrap = result.get("bootstrap_loadings", {})
@@ -321,6 +340,7 @@ def cmd_analyze(args):
     if "cws_mean" in cpcv:
         print(f"  CPCV paths:    {cpcv.get('n_paths', 0)}")
         print(f"  CPCV CWS mean: {cpcv['cws_mean']:.3f}")
+        print(f"  CPCV failed:   {cpcv.get('n_failed', 0)}")
 
 
 def cmd_run_v2(args):
@@ -348,8 +368,9 @@ def cmd_run_v2(args):
     target = z_data["log_btc"].copy()
     target.index = range(len(target))
 
-    runner = PipelineRunnerV2(method=args.method, freq=args.freq)
-    runner.run_full(z_matrix, target)
+    runner = PipelineRunnerV2(method=args.method, freq=args.freq,
+                              workers=args.workers)
+    runner.run_full(z_matrix, target, reuse_latest=not args.refit)
 
 
 def cmd_compare(args):
@@ -407,12 +428,14 @@ def main():
 Examples:
   # v1.0 commands
   python main.py optimize              # Full v1.0 optimization
+  python main.py optimize --workers 4  # Parallel Grid Search
   python main.py fetch --no-cache      # Force re-fetch all data
 
   # v2.0 commands
   python main.py build-index --method pca   # Stage 1: PCA index
   python main.py validate --method pca      # Stage 2: Direction check
   python main.py analyze --method pca       # Stage 3: Robustness
+  python main.py analyze --workers 4        # Stage 3 with parallel CPCV
   python main.py run --method pca           # Full 3-Stage pipeline
   python main.py compare                    # Compare PCA/ICA/SparsePCA
         """,
@@ -440,6 +463,8 @@ Examples:
     p_opt.add_argument("--no-cache", action="store_true", help="Force re-fetch")
     p_opt.add_argument("--start", type=str, help="Start date")
     p_opt.add_argument("--end", type=str, help="End date")
+    p_opt.add_argument("--workers", type=int, default=None,
+                       help="Grid Search worker processes (default: 1)")
 
     p_run_v1 = subparsers.add_parser("score", help="[v1.0] Current score only")
 
@@ -447,14 +472,22 @@ Examples:
     subparsers.add_parser("build-index",
         help="[v2.0] Stage 1: Build liquidity index (BTC-blind)")
 
-    subparsers.add_parser("validate",
+    p_validate = subparsers.add_parser("validate",
         help="[v2.0] Stage 2: Direction validation against BTC")
+    p_validate.add_argument("--refit", action="store_true",
+                            help="Refit Stage 1 instead of reusing the latest artifact")
 
-    subparsers.add_parser("analyze",
+    p_analyze = subparsers.add_parser("analyze",
         help="[v2.0] Stage 3: Robustness analysis")
+    p_analyze.add_argument("--workers", type=int, default=None,
+                           help="CPCV worker processes (default: 1)")
 
-    subparsers.add_parser("run",
+    p_run_v2 = subparsers.add_parser("run",
         help="[v2.0] Full 3-Stage pipeline")
+    p_run_v2.add_argument("--workers", type=int, default=None,
+                          help="CPCV worker processes (default: 1)")
+    p_run_v2.add_argument("--refit", action="store_true",
+                          help="Refit Stage 1 instead of reusing the latest artifact")
 
     subparsers.add_parser("compare",
         help="[v2.0] Compare all index methods (PCA/ICA/Sparse)")
@@ -464,7 +497,7 @@ Examples:
     p_viz.add_argument(
         "--type",
         choices=["overlay", "correlation", "walkforward",
-                 "xcorr", "bootstrap", "comparison", "wavelet", "all"],
+                 "xcorr", "bootstrap", "comparison", "wavelet", "rolling", "all"],
         default="all",
         help="Chart type",
     )
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Kendall tau lag profile 벤치마크 — scipy lag별 루프 vs kendall_tau_lags 배치 경로.
+
+월간(~150) / 일간(~2,600) 길이, 동점 유무별로 같은 값인지 확인하고
+lag=0..max_lag 전체 계산 시간을 비교 (KENDALL_BATCH_MAX_N 결정 근거).
+
+Usage:
+    python scripts/bench_kendall.py
+    python scripts/bench_kendall.py --sizes 150 2600 10000 --max-lag 15 --repeat 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import kendalltau
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.validators.waveform_metrics import kendall_tau_lags  # noqa: E402
+
+
+def scipy_loop(x: np.ndarray, y: np.ndarray, max_lag: int) -> tuple[np.ndarray, np.ndarray]:
+    n = len(x)
+    res = [kendalltau(x[:n - k], y[k:]) for k in range(max_lag + 1)]
+    return (np.array([r.statistic for r in res], dtype=float),
+            np.array([r.pvalue for r in res], dtype=float))
+
+
+def best_time(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[60, 150, 500, 700, 900, 2600])
+    parser.add_argument("--max-lag", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'n':>7} {'ties':>5} {'scipy loop':>12} {'batch':>12} {'speedup':>8}  identical")
+    for n in args.sizes:
+        for ties in (False, True):
+            x = np.cumsum(rng.normal(size=n))
+            y = 0.5 * x + np.cumsum(rng.normal(size=n))
+            if ties:
+                x, y = np.round(x), np.round(y, 1)
+
+            ref = scipy_loop(x, y, args.max_lag)
+            out = kendall_tau_lags(x, y, args.max_lag, method="batch")
+            identical = all(
+                np.array_equal(a, b, equal_nan=True) for a, b in zip(ref, out)
+            )
+
+            t_ref = best_time(lambda: scipy_loop(x, y, args.max_lag), args.repeat)
+            t_new = best_time(
+                lambda: kendall_tau_lags(x, y, args.max_lag, method="batch"), args.repeat)
+            print(f"{n:>7} {str(ties):>5} {t_ref * 1e3:>10.2f}ms {t_new * 1e3:>10.2f}ms "
+                  f"{t_ref / t_new:>7.1f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
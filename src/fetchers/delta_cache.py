@@ -0,0 +1,115 @@
+"""증분(delta) 수집 — RawDataStore 시리즈 메타데이터 기반.
+
+시리즈 메타데이터 (series_meta):
+  start / end       — 저장된 요청 구간
+  last_date         — 마지막 관측일
+  revision_days     — 재요청할 수정 구간 (일)
+  fetched_at        — 마지막 수집 시각 (만료 판정)
+  full_fetched_at   — 마지막 전체 수집 시각
+  params            — 요청 조건 (frequency, interval 등; 다르면 전체 재수집)
+
+만료된 시리즈는 since = last_date - revision_days 부터만 재요청하고
+since 이전 저장 행 + 새 행으로 병합 → 수정 구간 안의 개정만 있다면
+전체 재수집과 같은 시리즈.
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from config.constants import DELTA_FETCH
+
+
+def revision_days(source: str, series_id: str | None = None) -> int:
+    """source / 시리즈별 수정 구간 (일)"""
+    overrides = DELTA_FETCH.get("series_revision_days", {})
+    if series_id is not None and series_id in overrides:
+        return int(overrides[series_id])
+    return int(DELTA_FETCH["revision_days"].get(source, 0))
+
+
+def build_meta(
+    df: pd.DataFrame,
+    start: str,
+    end: str,
+    revision: int,
+    params: dict | None = None,
+    previous: dict | None = None,
+    date_col: str = "date",
+) -> dict:
+    """
+    저장할 메타데이터. previous가 있으면 증분 갱신 — 캐시 시작일·전체 수집 시각 유지.
+    """
+    last = pd.to_datetime(df[date_col]).max() if len(df) else None
+    now = datetime.now().isoformat()
+    return {
+        "start": previous["start"] if previous else str(start),
+        "end": str(end),
+        "last_date": last.strftime("%Y-%m-%d") if last is not None else None,
+        "revision_days": int(revision),
+        "fetched_at": now,
+        "full_fetched_at": previous["full_fetched_at"] if previous else now,
+        "params": params or {},
+    }
+
+
+def delta_start(
+    meta: dict | None,
+    start: str,
+    end: str,
+    revision: int,
+    params: dict | None = None,
+) -> str | None:
+    """
+    증분 요청 시작일 (last_date - revision) 또는 None (전체 재수집 필요).
+
+    전체 재수집: 비활성 / 메타데이터 없음 / 요청 조건 변경 /
+    캐시 구간이 요청 구간을 벗어남 / full_refresh_days 경과.
+    """
+    if not DELTA_FETCH.get("enabled", False) or not meta:
+        return None
+    if not meta.get("last_date") or not meta.get("full_fetched_at"):
+        return None
+    if meta.get("params", {}) != (params or {}):
+        return None
+    if pd.Timestamp(meta["start"]) > pd.Timestamp(start):
+        return None
+    if pd.Timestamp(meta["last_date"]) > pd.Timestamp(end):
+        return None
+    full_at = datetime.fromisoformat(meta["full_fetched_at"])
+    if datetime.now() - full_at > timedelta(days=DELTA_FETCH["full_refresh_days"]):
+        return None
+    since = pd.Timestamp(meta["last_date"]) - pd.Timedelta(days=revision)
+    return max(since, pd.Timestamp(start)).strftime("%Y-%m-%d")
+
+
+def within(
+    df: pd.DataFrame,
+    start: str,
+    end: str,
+    date_col: str = "date",
+) -> pd.DataFrame:
+    """요청 구간 [start, end] 행만 — 저장소에는 요청 이전 이력까지 병합 저장"""
+    dates = pd.to_datetime(df[date_col])
+    mask = (dates >= pd.Timestamp(start)) & (dates <= pd.Timestamp(end))
+    if mask.all():
+        return df
+    return df.loc[mask].reset_index(drop=True)
+
+
+def merge_delta(
+    cached: pd.DataFrame,
+    fresh: pd.DataFrame,
+    since: str,
+    date_col: str = "date",
+) -> pd.DataFrame:
+    """since 이전 캐시 행 + 새로 받은 행 (since 이후는 새 값으로 대체)"""
+    since_ts = pd.Timestamp(since)
+    head = cached[pd.to_datetime(cached[date_col]) < since_ts]
+    tail = fresh[pd.to_datetime(fresh[date_col]) >= since_ts]
+    if head.empty:
+        return tail.reset_index(drop=True)
+    if tail.empty:
+        return head.reset_index(drop=True)
+    merged = pd.concat([head, tail], ignore_index=True)
+    return merged.sort_values(date_col, kind="stable").reset_index(drop=True)
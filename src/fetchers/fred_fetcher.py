@@ -1,13 +1,14 @@
 """FRED API를 통한 경제 데이터 수집"""
-import time
-from pathlib import Path
-from datetime import datetime, timedelta
-
 import pandas as pd
 from fredapi import Fred
 
-from config.settings import FRED_API_KEY, RAW_DIR, CACHE_EXPIRY_HOURS
+from config.settings import FRED_API_KEY, CACHE_EXPIRY_HOURS
 from config.constants import FRED_SERIES
+from src.fetchers.delta_cache import (
+    build_meta, delta_start, merge_delta, revision_days, within,
+)
+from src.fetchers.raw_store import RawDataStore
+from src.fetchers.scheduler import rate_limiter
 from src.utils.logger import setup_logger
 
 logger = setup_logger("fred_fetcher")
@@ -16,8 +17,8 @@ logger = setup_logger("fred_fetcher")
 class FredFetcher:
     """
     FRED API wrapper.
-    캐싱: data/raw/fred_{series}.csv
-    Rate limit: 120 req/min (자동 throttle)
+    캐싱: RawDataStore 시리즈 fred_{series} (만료 시 증분 수집)
+    Rate limit: 120 req/min (token bucket, 스레드 간 공유)
     """
 
     def __init__(self, api_key: str | None = None):
@@ -29,6 +30,7 @@ class FredFetcher:
                 "발급: https://fred.stlouisfed.org/docs/api/api_key.html"
             )
         self.fred = Fred(api_key=key)
+        self.store = RawDataStore()
         self._request_count = 0
 
     def fetch_series(
@@ -42,22 +44,34 @@ class FredFetcher:
         """
         단일 FRED 시리즈 수집.
 
+        캐시가 만료되었으면 (마지막 관측일 - 수정 구간)부터만 요청해 병합.
+        캐시에서는 [start, end] 구간만 읽음.
+
         Returns: DataFrame[date, value]
         """
         # 캐시 확인
+        since, stale, meta = None, None, None
+        revision = revision_days("fred", series_id)
+        params = {"frequency": frequency} if frequency else {}
         if use_cache:
-            cached = self._load_cache(series_id)
+            cached = self._load_cache(series_id, start, end)
             if cached is not None:
                 logger.info(f"[Cache Hit] {series_id}: {len(cached)} rows")
                 return cached
+            meta = self.store.meta(self._series_name(series_id))
+            since = delta_start(meta, start, end, revision, params)
+            if since is not None:
+                stale = self._load_cache(series_id, ignore_expiry=True)
+                if stale is None:
+                    since = None
 
         # API 호출 (rate limit throttle)
         self._throttle()
 
         try:
-            logger.info(f"Fetching {series_id} from FRED ({start} ~ {end})...")
+            logger.info(f"Fetching {series_id} from FRED ({since or start} ~ {end})...")
             kwargs = {
-                "observation_start": start,
+                "observation_start": since or start,
                 "observation_end": end,
             }
             if frequency:
@@ -74,19 +88,28 @@ class FredFetcher:
             df["date"] = pd.to_datetime(df["date"])
             df = df.dropna(subset=["value"])
 
+            if since is not None:
+                logger.info(f"[Delta] {series_id}: {len(df)} rows since {since}")
+                df = merge_delta(stale, df, since)
+            else:
+                meta = None
+
             logger.info(f"Fetched {series_id}: {len(df)} rows "
                         f"({df['date'].min().strftime('%Y-%m')} ~ "
                         f"{df['date'].max().strftime('%Y-%m')})")
 
             # 캐시 저장
-            self._save_cache(series_id, df)
+            self._save_cache(
+                series_id, df,
+                build_meta(df, start, end, revision, params, previous=meta),
+            )
 
-            return df
+            return within(df, start, end)
 
         except Exception as e:
             logger.error(f"Failed to fetch {series_id}: {e}")
             # 만료된 캐시라도 반환 시도
-            cached = self._load_cache(series_id, ignore_expiry=True)
+            cached = self._load_cache(series_id, start, end, ignore_expiry=True)
             if cached is not None:
                 logger.warning(f"Using expired cache for {series_id}")
                 return cached
@@ -116,36 +139,30 @@ class FredFetcher:
         return results
 
     def _throttle(self):
-        """Rate limit: 120 req/min → 0.5초 대기"""
-        if self._request_count > 0 and self._request_count % 5 == 0:
-            time.sleep(0.5)
+        """Rate limit: FRED token bucket (120 req/min) — 토큰 없으면 대기"""
+        limiter = rate_limiter("fred")
+        if limiter is not None:
+            waited = limiter.acquire()
+            if waited > 0:
+                logger.debug(f"FRED rate limit: waited {waited:.2f}s")
 
-    def _cache_path(self, series_id: str) -> Path:
-        return RAW_DIR / f"fred_{series_id}.csv"
+    def _series_name(self, series_id: str) -> str:
+        return f"fred_{series_id}"
 
-    def _save_cache(self, series_id: str, df: pd.DataFrame) -> None:
-        path = self._cache_path(series_id)
-        df.to_csv(path, index=False)
-        logger.debug(f"Cached {series_id} → {path}")
+    def _save_cache(self, series_id: str, df: pd.DataFrame, meta: dict) -> None:
+        self.store.write(self._series_name(series_id), "fred", df, meta)
+        logger.debug(f"Cached {series_id} → {self.store.db_path.name}")
 
     def _load_cache(
         self,
         series_id: str,
+        start: str | None = None,
+        end: str | None = None,
         ignore_expiry: bool = False,
     ) -> pd.DataFrame | None:
-        path = self._cache_path(series_id)
-        if not path.exists():
-            return None
-
+        name = self._series_name(series_id)
         # 캐시 만료 확인
-        if not ignore_expiry:
-            mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            if datetime.now() - mtime > timedelta(hours=CACHE_EXPIRY_HOURS):
-                logger.debug(f"Cache expired for {series_id}")
-                return None
-
-        try:
-            df = pd.read_csv(path, parse_dates=["date"])
-            return df
-        except Exception:
+        if not ignore_expiry and not self.store.is_fresh(name, CACHE_EXPIRY_HOURS):
+            logger.debug(f"Cache expired for {series_id}")
             return None
+        return self.store.read(name, start, end)
@@ -1,12 +1,17 @@
 """Yahoo Finance — DXY, BTC, CME BTC Futures 수집"""
-from datetime import datetime, timedelta
-from pathlib import Path
+import threading
+from concurrent.futures import Future
 
 import pandas as pd
 import yfinance as yf
 
-from config.settings import RAW_DIR, CACHE_EXPIRY_HOURS
+from config.settings import CACHE_EXPIRY_HOURS
 from config.constants import TICKERS
+from src.fetchers.delta_cache import (
+    build_meta, delta_start, merge_delta, revision_days, within,
+)
+from src.fetchers.raw_store import RawDataStore
+from src.fetchers.scheduler import rate_limiter
 from src.utils.logger import setup_logger
 from src.utils.date_utils import resample_to_monthly
 
@@ -16,9 +21,17 @@ logger = setup_logger("market_fetcher")
 class MarketFetcher:
     """
     yfinance 기반 시장 데이터 수집.
-    캐싱: data/raw/market_{ticker_name}.csv
+    캐싱: RawDataStore 시리즈 market_{ticker_name} (만료 시 증분 수집)
+
+    같은 인스턴스에서 동일 티커 요청(예: fetch_btc_spot / fetch_btc_daily)은
+    한 번만 수집하고 결과 공유 (스레드 동시 호출 포함).
     """
 
+    def __init__(self):
+        self.store = RawDataStore()
+        self._requests: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
     def fetch_ticker(
         self,
         ticker: str,
@@ -34,20 +47,69 @@ class MarketFetcher:
         """
         name = cache_name or ticker.replace(".", "_").replace("-", "_").replace("=", "_")
 
+        # 동일 요청 중복 제거: 첫 호출만 수집, 나머지는 결과 대기
+        key = (ticker, start, end, interval, use_cache, name)
+        with self._lock:
+            request = self._requests.get(key)
+            owner = request is None
+            if owner:
+                request = self._requests[key] = Future()
+        if not owner:
+            logger.debug(f"[Dedup] {ticker} ({name})")
+            return request.result().copy()
+
+        try:
+            df = self._fetch_ticker(ticker, start, end, interval, use_cache, name)
+        except Exception as e:
+            request.set_exception(e)
+            raise
+        request.set_result(df)
+        return df.copy()
+
+    def _fetch_ticker(
+        self,
+        ticker: str,
+        start: str,
+        end: str,
+        interval: str,
+        use_cache: bool,
+        name: str,
+    ) -> pd.DataFrame:
+        """fetch_ticker 본체 (캐시 → Yahoo 증분/전체 → 만료 캐시 순, 캐시는 [start, end]만)"""
+        since, stale, meta = None, None, None
+        revision = revision_days("yahoo")
+        params = {"ticker": ticker, "interval": interval}
         if use_cache:
-            cached = self._load_cache(name)
+            cached = self._load_cache(name, start, end)
             if cached is not None:
                 logger.info(f"[Cache Hit] {ticker}: {len(cached)} rows")
                 return cached
+            meta = self.store.meta(f"market_{name}")
+            since = delta_start(meta, start, end, revision, params)
+            if since is not None:
+                stale = self._load_cache(name, ignore_expiry=True)
+                if stale is None:
+                    since = None
 
-        logger.info(f"Fetching {ticker} from Yahoo Finance ({start} ~ {end})...")
+        logger.info(f"Fetching {ticker} from Yahoo Finance ({since or start} ~ {end})...")
+
+        limiter = rate_limiter("yahoo")
+        if limiter is not None:
+            limiter.acquire()
 
         try:
             t = yf.Ticker(ticker)
-            df = t.history(start=start, end=end, interval=interval)
+            df = t.history(start=since or start, end=end, interval=interval)
 
             if df.empty:
                 logger.warning(f"No data returned for {ticker}")
+                if since is not None:
+                    # 증분 구간에 새 행 없음 — 캐시는 최신, fetched_at만 갱신
+                    self._save_cache(
+                        name, stale,
+                        build_meta(stale, start, end, revision, params, previous=meta),
+                    )
+                    return within(stale, start, end)
                 return pd.DataFrame()
 
             df = df.reset_index()
@@ -60,14 +122,22 @@ class MarketFetcher:
             df = df[available_cols]
             df.columns = [c.lower() for c in df.columns]
 
+            if since is not None:
+                logger.info(f"[Delta] {ticker}: {len(df)} rows since {since}")
+                df = merge_delta(stale, df, since)
+            else:
+                meta = None
+
             logger.info(f"Fetched {ticker}: {len(df)} rows")
 
-            self._save_cache(name, df)
-            return df
+            self._save_cache(
+                name, df, build_meta(df, start, end, revision, params, previous=meta),
+            )
+            return within(df, start, end)
 
         except Exception as e:
             logger.error(f"Failed to fetch {ticker}: {e}")
-            cached = self._load_cache(name, ignore_expiry=True)
+            cached = self._load_cache(name, start, end, ignore_expiry=True)
             if cached is not None:
                 logger.warning(f"Using expired cache for {ticker}")
                 return cached
@@ -132,21 +202,17 @@ class MarketFetcher:
 
     # ── Cache ──
 
-    def _cache_path(self, name: str) -> Path:
-        return RAW_DIR / f"market_{name}.csv"
+    def _save_cache(self, name: str, df: pd.DataFrame, meta: dict) -> None:
+        self.store.write(f"market_{name}", "market", df, meta)
 
-    def _save_cache(self, name: str, df: pd.DataFrame) -> None:
-        df.to_csv(self._cache_path(name), index=False)
-
-    def _load_cache(self, name: str, ignore_expiry: bool = False) -> pd.DataFrame | None:
-        path = self._cache_path(name)
-        if not path.exists():
-            return None
-        if not ignore_expiry:
-            mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            if datetime.now() - mtime > timedelta(hours=CACHE_EXPIRY_HOURS):
-                return None
-        try:
-            return pd.read_csv(path, parse_dates=["date"])
-        except Exception:
+    def _load_cache(
+        self,
+        name: str,
+        start: str | None = None,
+        end: str | None = None,
+        ignore_expiry: bool = False,
+    ) -> pd.DataFrame | None:
+        series = f"market_{name}"
+        if not ignore_expiry and not self.store.is_fresh(series, CACHE_EXPIRY_HOURS):
             return None
+        return self.store.read(series, start, end)
@@ -0,0 +1,310 @@
+"""통합 raw 데이터 저장소 (SQLite, 타입 지정 컬럼) — 시리즈별 CSV 캐시 대체.
+
+data/raw_store.db 하나에 모든 raw 시리즈 저장 (열 단위):
+  columns(series, field, data)  — 열 하나 = numpy 배열 bytes 하나
+                                  (date: int64 ns, 정렬됨 → 기간은 searchsorted)
+  series_meta(series, source, ...) — fetched_at / full_fetched_at,
+                                     start / end / last_date, n_rows,
+                                     revision_days, params, dtypes
+
+쓰기는 한 트랜잭션 (BEGIN IMMEDIATE → 열 교체 → 메타 갱신 → COMMIT):
+중간에 실패하면 이전 상태 그대로. WAL 모드라 읽기는 쓰기 중에도 가능,
+읽기는 mmap + np.frombuffer (CSV 파싱 없음).
+
+시리즈 이름: "{source}_{id}" (예: fred_WALCL, market_btc_spot, treasury_tga)
+— 이전 data/raw/*.csv 파일명과 같음 (migrate_csv로 일괄 이관).
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.settings import RAW_DIR, RAW_STORE_PATH
+from src.utils.logger import setup_logger
+
+logger = setup_logger("raw_store")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS columns (
+    series TEXT NOT NULL,
+    field TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (series, field)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS series_meta (
+    series TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    start TEXT,
+    end TEXT,
+    last_date TEXT,
+    n_rows INTEGER NOT NULL,
+    revision_days INTEGER,
+    fetched_at TEXT NOT NULL,
+    full_fetched_at TEXT,
+    params TEXT,
+    dtypes TEXT NOT NULL
+);
+"""
+
+_META_COLUMNS = (
+    "series", "source", "start", "end", "last_date", "n_rows",
+    "revision_days", "fetched_at", "full_fetched_at", "params", "dtypes",
+)
+
+
+class RawDataStore:
+    """SQLite 기반 raw 시계열 저장소 (시리즈·기간 단위 조회)"""
+
+    MMAP_BYTES = 256 * 1024 * 1024
+
+    _init_lock = threading.Lock()
+    _initialized: set[str] = set()
+
+    def __init__(self, db_path: str | Path | None = None, migrate: bool = True):
+        self.db_path = Path(db_path or RAW_STORE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._init_lock:
+            if str(self.db_path) not in self._initialized:
+                conn = self._connect()
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    empty = conn.execute("SELECT COUNT(*) FROM series_meta").fetchone()[0] == 0
+                finally:
+                    conn.close()
+                # 첫 사용: 이전 CSV 캐시가 있으면 이관 (재수집 방지)
+                if migrate and empty:
+                    self.migrate_csv()
+                self._initialized.add(str(self.db_path))
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드(FetchScheduler)마다 별도 연결 — 쓰기 잠금은 SQLite가 직렬화
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_BYTES}")
+        return conn
+
+    # ── 메타데이터 ──
+
+    def meta(self, series: str) -> dict | None:
+        """시리즈 메타데이터 (없으면 None)"""
+        conn = self._connect()
+        try:
+            return self._meta(conn, series)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, series: str) -> dict | None:
+        row = conn.execute(
+            f"SELECT {', '.join(_META_COLUMNS)} FROM series_meta WHERE series = ?",
+            (series,),
+        ).fetchone()
+        if row is None:
+            return None
+        meta = dict(zip(_META_COLUMNS, row))
+        meta["params"] = json.loads(meta["params"] or "{}")
+        meta["dtypes"] = json.loads(meta["dtypes"])
+        return meta
+
+    def list_series(self, source: str | None = None) -> list[dict]:
+        """저장된 시리즈 메타데이터 목록 (source 필터)"""
+        conn = self._connect()
+        try:
+            query = "SELECT series FROM series_meta"
+            args: tuple = ()
+            if source is not None:
+                query += " WHERE source = ?"
+                args = (source,)
+            names = [r[0] for r in conn.execute(query + " ORDER BY series", args)]
+        finally:
+            conn.close()
+        return [self.meta(n) for n in names]
+
+    def is_fresh(self, series: str, expiry_hours: float) -> bool:
+        """마지막 수집(fetched_at)이 expiry_hours 이내인지"""
+        meta = self.meta(series)
+        if meta is None:
+            return False
+        fetched = datetime.fromisoformat(meta["fetched_at"])
+        return datetime.now() - fetched <= timedelta(hours=expiry_hours)
+
+    def signature(self, expiry_hours: float) -> tuple | None:
+        """
+        저장소 상태 (시리즈, fetched_at, n_rows, last_date).
+
+        하나라도 만료되었거나 비어 있으면 None — fetch 스테이지를 건너뛸 수 없음.
+        """
+        metas = self.list_series()
+        if not metas:
+            return None
+        now = datetime.now()
+        sig = []
+        for m in metas:
+            if now - datetime.fromisoformat(m["fetched_at"]) > timedelta(hours=expiry_hours):
+                return None
+            sig.append((m["series"], m["fetched_at"], m["n_rows"], m["last_date"]))
+        return tuple(sig)
+
+    # ── 조회 ──
+
+    def read(
+        self,
+        series: str,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        시리즈 → DataFrame[date, ...] (저장 시 열 순서·dtype 복원).
+
+        start / end (포함)로 기간, columns로 필드 제한. 시리즈가 없으면 None.
+        """
+        conn = self._connect()
+        try:
+            meta = self._meta(conn, series)
+            if meta is None:
+                return None
+            dtypes = meta["dtypes"]
+            fields = [c for c in dtypes if c != "date"]
+            if columns is not None:
+                fields = [c for c in fields if c in columns]
+                if not fields:
+                    raise KeyError(f"{series}: no columns {columns}")
+            blobs = dict(conn.execute(
+                f"SELECT field, data FROM columns WHERE series = ? "
+                f"AND field IN ({', '.join('?' * (len(fields) + 1))})",
+                [series, "date"] + fields,
+            ).fetchall())
+        finally:
+            conn.close()
+
+        dates = np.frombuffer(blobs["date"], dtype=np.int64)
+        lo = 0 if start is None else np.searchsorted(dates, pd.Timestamp(start).value, "left")
+        hi = len(dates) if end is None else np.searchsorted(dates, pd.Timestamp(end).value, "right")
+
+        out = {"date": pd.to_datetime(dates[lo:hi]).astype(dtypes["date"])}
+        for c in fields:
+            out[c] = np.frombuffer(blobs[c], dtype=dtypes[c])[lo:hi].copy()
+        return pd.DataFrame(out)
+
+    def read_many(
+        self,
+        names: list[str],
+        start: str | None = None,
+        end: str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """여러 시리즈 조회 (없는 시리즈는 제외)"""
+        out = {}
+        for name in names:
+            df = self.read(name, start, end)
+            if df is not None:
+                out[name] = df
+        return out
+
+    # ── 쓰기 ──
+
+    def write(self, series: str, source: str, df: pd.DataFrame, meta: dict) -> None:
+        """
+        원자적 저장 — 한 트랜잭션에서 시리즈 전체 열 교체 + 메타데이터 갱신.
+
+        숫자가 아닌 열은 float64로 변환 (raw 시리즈는 모두 수치).
+        """
+        df = df.sort_values("date", kind="stable")
+        dates = pd.to_datetime(df["date"])
+        fields = [c for c in df.columns if c != "date"]
+
+        arrays = {"date": dates.to_numpy().astype("datetime64[ns]").astype(np.int64)}
+        dtypes = {"date": str(dates.dtype)}
+        for c in fields:
+            col = df[c]
+            if not (pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col)):
+                col = pd.to_numeric(col, errors="coerce").astype(float)
+            arr = col.to_numpy()
+            arrays[c] = arr
+            dtypes[c] = arr.dtype.str
+
+        row = {
+            "series": series,
+            "source": source,
+            "start": meta.get("start"),
+            "end": meta.get("end"),
+            "last_date": meta.get("last_date"),
+            "n_rows": int(len(df)),
+            "revision_days": meta.get("revision_days"),
+            "fetched_at": meta.get("fetched_at") or datetime.now().isoformat(),
+            "full_fetched_at": meta.get("full_fetched_at"),
+            "params": json.dumps(meta.get("params") or {}),
+            "dtypes": json.dumps(dtypes),
+        }
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM columns WHERE series = ?", (series,))
+            conn.executemany(
+                "INSERT INTO columns (series, field, data) VALUES (?, ?, ?)",
+                [(series, c, np.ascontiguousarray(a).tobytes()) for c, a in arrays.items()],
+            )
+            conn.execute(
+                f"INSERT OR REPLACE INTO series_meta ({', '.join(_META_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_META_COLUMNS))})",
+                [row[c] for c in _META_COLUMNS],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        logger.debug(f"Stored {series}: {len(df)} rows")
+
+    def delete(self, series: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM columns WHERE series = ?", (series,))
+            conn.execute("DELETE FROM series_meta WHERE series = ?", (series,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    # ── 이관 ──
+
+    def migrate_csv(self, raw_dir: str | Path | None = None) -> int:
+        """
+        이전 CSV 캐시 (data/raw/{source}_{id}.csv) 일괄 이관.
+
+        이미 저장소에 있는 시리즈는 건너뜀. fetched_at은 파일 mtime
+        (만료 판정 유지). 이관한 시리즈 수 반환.
+        """
+        count = 0
+        for path in sorted(Path(raw_dir or RAW_DIR).glob("*.csv")):
+            series = path.stem
+            source = series.split("_", 1)[0]
+            if self.meta(series) is not None:
+                continue
+            try:
+                df = pd.read_csv(path, parse_dates=["date"], float_precision="round_trip")
+            except Exception as e:
+                logger.warning(f"Skipping {path.name}: {e}")
+                continue
+            fetched = datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+            last = df["date"].max() if len(df) else None
+            self.write(series, source, df, {
+                "start": df["date"].min().strftime("%Y-%m-%d") if len(df) else None,
+                "last_date": last.strftime("%Y-%m-%d") if last is not None else None,
+                "fetched_at": fetched,
+            })
+            count += 1
+        if count:
+            logger.info(f"Migrated {count} CSV caches → {self.db_path.name}")
+        return count
@@ -0,0 +1,156 @@
+"""동시 수집 레이어 — thread pool + source별 token bucket + 요청 중복 제거.
+
+FRED/Treasury/Yahoo 요청은 대부분 네트워크 대기라 thread pool로 겹쳐 실행.
+  - TokenBucket: source별 분당 요청 한도 (FRED 120 req/min 등), 버스트 허용
+  - FetchScheduler: (source, key)가 같은 작업은 한 번만 실행 (future 공유),
+    source별 호출 수·지연(평균/최대)·오류 수 집계
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from config.constants import FETCH_CONFIG
+from src.utils.logger import setup_logger
+
+logger = setup_logger("fetch_scheduler")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate_per_min` 토큰/분 충전, 최대 `burst`개 보유."""
+
+    def __init__(self, rate_per_min: float, burst: int | None = None):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_min // 12)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 1개 소비 (없으면 충전될 때까지 대기). 대기한 시간(초) 반환."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return waited
+                delay = (1.0 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_LIMITERS: dict[str, TokenBucket] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def rate_limiter(source: str) -> TokenBucket | None:
+    """source별 공유 token bucket (FETCH_CONFIG["rate_limits"]에 없으면 None)"""
+    limit = FETCH_CONFIG["rate_limits"].get(source)
+    if limit is None:
+        return None
+    with _LIMITERS_LOCK:
+        if source not in _LIMITERS:
+            _LIMITERS[source] = TokenBucket(limit["per_min"], limit.get("burst"))
+        return _LIMITERS[source]
+
+
+class FetchScheduler:
+    """
+    Thread pool 기반 수집 스케줄러.
+
+    사용:
+        with FetchScheduler() as pool:
+            f = pool.submit("fred", "WALCL", fetcher.fetch_series, "WALCL", start, end)
+        f.result(); pool.report()
+    """
+
+    def __init__(self, max_workers: int = FETCH_CONFIG["max_workers"]):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fetch",
+        )
+        self._futures: dict[tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+        self._started = time.perf_counter()
+
+    def __enter__(self) -> "FetchScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def submit(self, source: str, key: str, fn, *args, **kwargs) -> Future:
+        """
+        작업 제출. 같은 (source, key)가 이미 제출되었으면 그 future 반환
+        (동일 요청 중복 제거).
+        """
+        with self._lock:
+            fut = self._futures.get((source, key))
+            if fut is None:
+                fut = self._executor.submit(self._timed, source, fn, *args, **kwargs)
+                self._futures[(source, key)] = fut
+                return fut
+        # _record도 self._lock 사용 — 잠금 해제 후 집계
+        self._record(source, dedup=True)
+        return fut
+
+    def _timed(self, source: str, fn, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record(source, time.perf_counter() - t0, error=True)
+            raise
+        self._record(source, time.perf_counter() - t0)
+        return result
+
+    def _record(
+        self,
+        source: str,
+        elapsed: float | None = None,
+        error: bool = False,
+        dedup: bool = False,
+    ) -> None:
+        with self._lock:
+            s = self._stats.setdefault(source, {
+                "calls": 0, "errors": 0, "deduplicated": 0,
+                "total_s": 0.0, "max_s": 0.0,
+            })
+            if dedup:
+                s["deduplicated"] += 1
+                return
+            s["calls"] += 1
+            s["errors"] += int(error)
+            s["total_s"] += elapsed
+            s["max_s"] = max(s["max_s"], elapsed)
+
+    def report(self) -> dict:
+        """source별 지연 요약 (로그 출력 포함)"""
+        wall = time.perf_counter() - self._started
+        out = {}
+        with self._lock:
+            for source, s in sorted(self._stats.items()):
+                mean = s["total_s"] / s["calls"] if s["calls"] else 0.0
+                out[source] = {
+                    "calls": s["calls"],
+                    "errors": s["errors"],
+                    "deduplicated": s["deduplicated"],
+                    "mean_s": round(mean, 3),
+                    "max_s": round(s["max_s"], 3),
+                    "total_s": round(s["total_s"], 3),
+                }
+                logger.info(
+                    f"[Fetch] {source}: {s['calls']} calls "
+                    f"(dedup {s['deduplicated']}, errors {s['errors']}), "
+                    f"mean {mean:.2f}s, max {s['max_s']:.2f}s"
+                )
+        out["wall_s"] = round(wall, 3)
+        logger.info(f"[Fetch] wall time {wall:.2f}s ({self.max_workers} workers)")
+        return out
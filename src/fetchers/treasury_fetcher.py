@@ -1,11 +1,10 @@
 """Treasury Fiscal Data API — TGA(재무부 일반계정) 수집"""
-from datetime import datetime, timedelta
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import requests
 
-from config.settings import RAW_DIR, CACHE_EXPIRY_HOURS
+from config.settings import CACHE_EXPIRY_HOURS
 from config.constants import (
     TREASURY_TGA_ENDPOINT,
     TREASURY_TGA_FIELDS,
@@ -13,6 +12,11 @@ from config.constants import (
     TREASURY_TGA_FILTER_NEW,
     TREASURY_PAGE_SIZE,
 )
+from src.fetchers.delta_cache import (
+    build_meta, delta_start, merge_delta, revision_days, within,
+)
+from src.fetchers.raw_store import RawDataStore
+from src.fetchers.scheduler import rate_limiter
 from src.utils.logger import setup_logger
 
 logger = setup_logger("treasury_fetcher")
@@ -26,8 +30,17 @@ class TreasuryFetcher:
     주의: 2021-10-01 이후 account_type 명칭이 변경됨:
       - 이전: "Federal Reserve Account"
       - 이후: "Treasury General Account (TGA) Closing Balance"
+
+    캐시 만료 시 (마지막 관측일 - 수정 구간)부터만 요청해 병합 —
+    증분 구간이 2021-10-01 이후면 새 명칭 필터만 호출.
     """
 
+    FILTER_SWITCH = "2021-10-01"
+    SERIES = "treasury_tga"
+
+    def __init__(self):
+        self.store = RawDataStore()
+
     def fetch_tga(
         self,
         start: str,
@@ -38,31 +51,48 @@ class TreasuryFetcher:
         TGA 일간 잔액 수집 (두 기간 합산).
         Returns: DataFrame[date, tga_balance] (단위: $T)
         """
+        since, stale, meta = None, None, None
+        revision = revision_days("treasury")
         if use_cache:
-            cached = self._load_cache()
+            cached = self._load_cache(start, end)
             if cached is not None:
                 logger.info(f"[Cache Hit] TGA: {len(cached)} rows")
                 return cached
-
-        logger.info(f"Fetching TGA from Treasury API ({start} ~ {end})...")
-
-        # 기간 1: 이전 명칭 (~ 2021-09-30)
-        old_records = self._fetch_with_filter(
-            TREASURY_TGA_FILTER_OLD, start, "2021-09-30"
-        )
+            meta = self.store.meta(self.SERIES)
+            since = delta_start(meta, start, end, revision)
+            if since is not None:
+                stale = self._load_cache(ignore_expiry=True)
+                if stale is None:
+                    since = None
+
+        fetch_start = since or start
+        logger.info(f"Fetching TGA from Treasury API ({fetch_start} ~ {end})...")
+
+        # 기간 1: 이전 명칭 (~ 2021-09-30), 기간 2: 새 명칭 (2021-10-01 ~)
+        # 두 필터는 독립 → 동시 요청 (증분 구간이 전환일 이후면 새 명칭만)
+        old_records = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if fetch_start < self.FILTER_SWITCH:
+                old_future = pool.submit(
+                    self._fetch_with_filter, TREASURY_TGA_FILTER_OLD, fetch_start, "2021-09-30"
+                )
+            else:
+                old_future = None
+            new_future = pool.submit(
+                self._fetch_with_filter, TREASURY_TGA_FILTER_NEW,
+                max(fetch_start, self.FILTER_SWITCH), end,
+            )
+            if old_future is not None:
+                old_records = old_future.result()
+            new_records = new_future.result()
         logger.info(f"TGA (old filter): {len(old_records)} records")
-
-        # 기간 2: 새 명칭 (2021-10-01 ~)
-        new_records = self._fetch_with_filter(
-            TREASURY_TGA_FILTER_NEW, "2021-10-01", end
-        )
         logger.info(f"TGA (new filter): {len(new_records)} records")
 
         all_records = old_records + new_records
 
         if not all_records:
             logger.error("No TGA records fetched")
-            cached = self._load_cache(ignore_expiry=True)
+            cached = self._load_cache(start, end, ignore_expiry=True)
             if cached is not None:
                 return cached
             return pd.DataFrame(columns=["date", "tga_balance"])
@@ -72,12 +102,18 @@ class TreasuryFetcher:
         df = df.drop_duplicates(subset="date", keep="last")
         df = df.sort_values("date").reset_index(drop=True)
 
+        if since is not None:
+            logger.info(f"[Delta] TGA: {len(df)} rows since {since}")
+            df = merge_delta(stale, df, since)
+        else:
+            meta = None
+
         logger.info(f"Fetched TGA: {len(df)} rows "
                     f"({df['date'].min().strftime('%Y-%m')} ~ "
                     f"{df['date'].max().strftime('%Y-%m')})")
 
-        self._save_cache(df)
-        return df
+        self._save_cache(df, build_meta(df, start, end, revision, previous=meta))
+        return within(df, start, end)
 
     def _fetch_with_filter(
         self,
@@ -100,6 +136,10 @@ class TreasuryFetcher:
                 "page[size]": TREASURY_PAGE_SIZE,
             }
 
+            limiter = rate_limiter("treasury")
+            if limiter is not None:
+                limiter.acquire()
+
             try:
                 resp = requests.get(TREASURY_TGA_ENDPOINT, params=params, timeout=30)
                 resp.raise_for_status()
@@ -143,21 +183,15 @@ class TreasuryFetcher:
         df = df.sort_values("date").reset_index(drop=True)
         return df
 
-    def _cache_path(self) -> Path:
-        return RAW_DIR / "treasury_tga.csv"
+    def _save_cache(self, df: pd.DataFrame, meta: dict) -> None:
+        self.store.write(self.SERIES, "treasury", df, meta)
 
-    def _save_cache(self, df: pd.DataFrame) -> None:
-        df.to_csv(self._cache_path(), index=False)
-
-    def _load_cache(self, ignore_expiry: bool = False) -> pd.DataFrame | None:
-        path = self._cache_path()
-        if not path.exists():
-            return None
-        if not ignore_expiry:
-            mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            if datetime.now() - mtime > timedelta(hours=CACHE_EXPIRY_HOURS):
-                return None
-        try:
-            return pd.read_csv(path, parse_dates=["date"])
-        except Exception:
+    def _load_cache(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        ignore_expiry: bool = False,
+    ) -> pd.DataFrame | None:
+        if not ignore_expiry and not self.store.is_fresh(self.SERIES, CACHE_EXPIRY_HOURS):
             return None
+        return self.store.read(self.SERIES, start, end)
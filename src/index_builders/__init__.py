@@ -12,10 +12,12 @@ from .pca_builder import PCAIndexBuilder
 from .ica_builder import ICAIndexBuilder
 from .dfm_builder import DFMIndexBuilder
 from .sparse_pca_builder import SparsePCAIndexBuilder
+from .artifact_store import ModelArtifactStore
 
 __all__ = [
     "PCAIndexBuilder",
     "ICAIndexBuilder",
     "DFMIndexBuilder",
     "SparsePCAIndexBuilder",
+    "ModelArtifactStore",
 ]
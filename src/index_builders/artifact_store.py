@@ -0,0 +1,196 @@
+"""적합된 index builder artifact 저장소.
+
+method + clip_map + 입력 데이터 지문 + builder 지문(코드·hyperparameter)으로
+키를 만들어
+  {method}_{key}.npz   — 적합 배열 (PCA components/mean, ICA unmixing,
+                         SparsePCA components, DFM state-space params)
+  {method}_{key}.json  — 메타데이터 (builder 파라미터, clip_map, 지문,
+                         build() 결과 요약, 부호 보정)
+로 저장. 같은 입력·같은 builder면 Stage 1 재적합 없이 로드.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.constants import DFM_CONFIG, INDEX_ARTIFACTS, INDEX_BUILDER
+from config.settings import MODELS_DIR
+from src.pipeline.stage_cache import StageCache
+
+logger = logging.getLogger(__name__)
+
+
+def _builder_class(method: str):
+    """method 이름 → builder 클래스 (PipelineRunnerV2.METHOD_MAP과 같은 키)"""
+    if method == "pca":
+        from .pca_builder import PCAIndexBuilder
+        return PCAIndexBuilder
+    elif method == "ica":
+        from .ica_builder import ICAIndexBuilder
+        return ICAIndexBuilder
+    elif method == "dfm":
+        from .dfm_builder import DFMIndexBuilder
+        return DFMIndexBuilder
+    elif method == "sparse":
+        from .sparse_pca_builder import SparsePCAIndexBuilder
+        return SparsePCAIndexBuilder
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+
+class ModelArtifactStore:
+    """Persist fitted index builders as compact .npz + JSON metadata."""
+
+    def __init__(
+        self,
+        base_dir: str | Path | None = None,
+        keep_per_method: int = INDEX_ARTIFACTS["keep_per_method"],
+    ):
+        self.base_dir = Path(base_dir or MODELS_DIR)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_per_method = keep_per_method
+
+    @staticmethod
+    def fingerprint(data: pd.DataFrame) -> str:
+        """입력 행렬 지문 (값 + index + 열 이름)"""
+        h = hashlib.sha1()
+        h.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        h.update(repr(list(data.columns)).encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def builder_digest(method: str) -> str:
+        """
+        builder 지문 — builder 모듈 코드 + hyperparameter 기본값
+        (INDEX_BUILDER / DFM_CONFIG). 하나라도 바뀌면 이전 artifact 무효.
+        """
+        module = sys.modules[_builder_class(method).__module__]
+        return StageCache.key(
+            "index_builder", StageCache.source_digest(module),
+            INDEX_BUILDER, DFM_CONFIG,
+        )
+
+    @staticmethod
+    def _key(method: str, clip_map: dict | None, fingerprint: str, builder: str) -> str:
+        payload = json.dumps(
+            [method, sorted((clip_map or {}).items()), fingerprint, builder],
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+    def save(
+        self,
+        method: str,
+        builder,
+        clip_map: dict | None,
+        fingerprint: str,
+        summary: dict | None = None,
+        sign: float = 1.0,
+    ) -> Path:
+        """
+        적합된 builder 저장.
+
+        Args:
+            method: "pca" | "ica" | "sparse" | "dfm"
+            builder: to_artifact()가 있는 적합된 builder
+            clip_map: Stage 1 winsorize 설정
+            fingerprint: fingerprint(입력 행렬)
+            summary: build() 결과 중 JSON 직렬화 가능한 항목 (loadings 등)
+            sign: Stage 1 부호 보정 (-1이면 transform 결과 반전)
+
+        Returns:
+            .npz 경로
+        """
+        arrays, params = builder.to_artifact()
+        digest = self.builder_digest(method)
+        key = self._key(method, clip_map, fingerprint, digest)
+        npz_path = self.base_dir / f"{method}_{key}.npz"
+        meta_path = npz_path.with_suffix(".json")
+
+        meta = {
+            "method": method,
+            "builder": type(builder).__name__,
+            "params": params,
+            "clip_map": clip_map or {},
+            "fingerprint": fingerprint,
+            "builder_digest": digest,
+            "sign": float(sign),
+            "summary": summary or {},
+            "created_at": datetime.now().isoformat(),
+        }
+
+        # 원자적 저장 (임시 파일 → rename), 메타데이터를 마지막에 — 로드 기준
+        tmp = npz_path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp, npz_path)
+        tmp = meta_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, default=float, ensure_ascii=False)
+        os.replace(tmp, meta_path)
+
+        logger.info("Artifact saved: %s (%s)", npz_path.name, meta["builder"])
+        self._prune(method)
+        return npz_path
+
+    def load(
+        self,
+        method: str,
+        clip_map: dict | None,
+        fingerprint: str | None = None,
+    ) -> tuple[object, dict] | None:
+        """
+        artifact → (적합된 builder, 메타데이터).
+
+        fingerprint=None이면 같은 method·clip_map의 최신 artifact.
+        현재 builder 코드·hyperparameter로 저장된 것만 (builder_digest).
+        없으면 None.
+        """
+        digest = self.builder_digest(method)
+        if fingerprint is not None:
+            key = self._key(method, clip_map, fingerprint, digest)
+            meta_path = self.base_dir / f"{method}_{key}.json"
+            candidates = [meta_path] if meta_path.exists() else []
+        else:
+            candidates = [
+                p for p, m in self._list(method)
+                if m.get("clip_map", {}) == (clip_map or {})
+                and m.get("builder_digest") == digest
+            ]
+
+        for meta_path in candidates:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with np.load(meta_path.with_suffix(".npz")) as npz:
+                    arrays = {k: npz[k] for k in npz.files}
+                builder = _builder_class(method).from_artifact(arrays, meta["params"])
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning("Artifact %s unreadable: %s", meta_path.name, e)
+                continue
+            logger.info("Artifact loaded: %s", meta_path.name)
+            return builder, meta
+        return None
+
+    def _list(self, method: str) -> list[tuple[Path, dict]]:
+        """method의 (메타데이터 경로, 메타데이터) — 최신순"""
+        entries = []
+        for p in self.base_dir.glob(f"{method}_*.json"):
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    entries.append((p, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        return sorted(entries, key=lambda e: e[1].get("created_at", ""), reverse=True)
+
+    def _prune(self, method: str) -> None:
+        """method별 최신 keep_per_method개만 유지"""
+        for p, _ in self._list(method)[self.keep_per_method:]:
+            for f in (p, p.with_suffix(".npz")):
+                f.unlink(missing_ok=True)
@@ -26,6 +26,11 @@ class DFMIndexBuilder:
         self.model = None
         self.result = None
         self.is_fitted = False
+        # transform()용: 열 이름, 표준화 (mean, std), 적합 파라미터
+        self._feature_names: list[str] = []
+        self._col_mean: np.ndarray | None = None
+        self._col_std: np.ndarray | None = None
+        self._params: np.ndarray | None = None
 
     def build(self, daily_matrix: pd.DataFrame) -> dict:
         """
@@ -57,11 +62,14 @@ class DFMIndexBuilder:
         data = daily_matrix[numeric_cols].copy()
 
         # Standardize each column (handle NaN)
-        for col in numeric_cols:
+        col_mean = np.zeros(len(numeric_cols))
+        col_std = np.ones(len(numeric_cols))
+        for i, col in enumerate(numeric_cols):
             mean = data[col].mean()
             std = data[col].std()
             if std > 1e-10:
                 data[col] = (data[col] - mean) / std
+                col_mean[i], col_std[i] = mean, std
 
         # Fit DFM with multiple attempts
         best_result = None
@@ -94,6 +102,9 @@ class DFMIndexBuilder:
 
         self.result = best_result
         self.is_fitted = True
+        self._feature_names = numeric_cols
+        self._col_mean, self._col_std = col_mean, col_std
+        self._params = np.asarray(best_result.params)
 
         # Extract factors
         filtered = best_result.factors.filtered[0]
@@ -130,6 +141,66 @@ class DFMIndexBuilder:
             "method": "DFM",
         }
 
+    def transform(self, daily_matrix: pd.DataFrame) -> pd.Series:
+        """
+        적합된 state-space 파라미터로 Kalman smoother만 실행 (EM 재적합 없음).
+
+        build()와 같은 열 표준화 (적합 시 mean/std) 후 smoothed factor 반환.
+        """
+        _, smoothed = self.transform_factors(daily_matrix)
+        return smoothed.rename("liquidity_index")
+
+    def transform_factors(self, daily_matrix: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+        """transform()과 같은 smoother 1회 → (filtered, smoothed) factor"""
+        if not self.is_fitted:
+            raise ValueError("DFM not fitted. Call build() first.")
+
+        from statsmodels.tsa.statespace.dynamic_factor import DynamicFactor
+
+        data = (daily_matrix[self._feature_names] - self._col_mean) / self._col_std
+        model = DynamicFactor(
+            data,
+            k_factors=self.k_factors,
+            factor_order=self.factor_order,
+        )
+        factors = model.smooth(self._params).factors
+        return (
+            pd.Series(factors.filtered[0], index=data.index, name="filtered"),
+            pd.Series(factors.smoothed[0], index=data.index, name="smoothed"),
+        )
+
+    def to_artifact(self) -> tuple[dict[str, np.ndarray], dict]:
+        """적합 상태 → (배열, 파라미터) — ModelArtifactStore 저장용"""
+        if not self.is_fitted:
+            raise ValueError("DFM not fitted. Call build() first.")
+        arrays = {
+            "params": self._params,
+            "col_mean": self._col_mean,
+            "col_std": self._col_std,
+        }
+        params = {
+            "k_factors": self.k_factors,
+            "factor_order": self.factor_order,
+            "feature_names": list(self._feature_names),
+        }
+        if self.result is not None:
+            params["param_names"] = list(self.result.model.param_names)
+        return arrays, params
+
+    @classmethod
+    def from_artifact(cls, arrays: dict, params: dict) -> "DFMIndexBuilder":
+        """to_artifact() 결과로 적합된 builder 복원 (재적합 없음)"""
+        builder = cls(
+            k_factors=params["k_factors"],
+            factor_order=params["factor_order"],
+        )
+        builder._params = np.asarray(arrays["params"])
+        builder._col_mean = np.asarray(arrays["col_mean"])
+        builder._col_std = np.asarray(arrays["col_std"])
+        builder._feature_names = list(params["feature_names"])
+        builder.is_fitted = True
+        return builder
+
     def resample_to_freq(
         self,
         daily_factor: pd.Series,
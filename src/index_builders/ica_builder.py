@@ -32,6 +32,9 @@ class ICAIndexBuilder:
         )
         self.is_fitted = False
         self._feature_names: list[str] = []
+        # select_liquidity_ic() 결과 (transform 시 같은 IC·부호)
+        self._selected_ic = 0
+        self._ic_sign = 1.0
 
     def build(self, z_matrix: pd.DataFrame) -> dict:
         """
@@ -119,6 +122,9 @@ class ICAIndexBuilder:
                 best_idx = i
                 best_series = components[col].copy()
 
+        self._selected_ic = best_idx
+        self._ic_sign = -1.0 if best_corr < 0 else 1.0
+
         # Sign correction: positive corr with NL
         if best_corr < 0:
             best_series = -best_series
@@ -129,3 +135,51 @@ class ICAIndexBuilder:
         logger.info("ICA selected IC_%d, |corr| with NL = %.3f",
                      best_idx, abs(best_corr))
         return best_series, best_idx
+
+    def transform(self, z_matrix: pd.DataFrame) -> pd.Series:
+        """Transform new data with the fitted unmixing matrix (selected IC)."""
+        if not self.is_fitted:
+            raise ValueError("ICA not fitted. Call build() first.")
+
+        X = z_matrix[self._feature_names].dropna()
+        S = self.ica.transform(X.values)
+        return pd.Series(
+            self._ic_sign * S[:, self._selected_ic],
+            index=X.index, name="liquidity_index",
+        )
+
+    def to_artifact(self) -> tuple[dict[str, np.ndarray], dict]:
+        """적합 상태 → (배열, 파라미터) — ModelArtifactStore 저장용"""
+        if not self.is_fitted:
+            raise ValueError("ICA not fitted. Call build() first.")
+        arrays = {
+            "unmixing": self.ica.components_,
+            "mixing": self.ica.mixing_,
+            "mean": self.ica.mean_,
+        }
+        params = {
+            "n_components": int(self.ica.n_components),
+            "random_state": self.random_state,
+            "feature_names": list(self._feature_names),
+            "selected_ic": int(self._selected_ic),
+            "ic_sign": float(self._ic_sign),
+        }
+        return arrays, params
+
+    @classmethod
+    def from_artifact(cls, arrays: dict, params: dict) -> "ICAIndexBuilder":
+        """to_artifact() 결과로 적합된 builder 복원 (재적합 없음)"""
+        builder = cls(
+            n_components=params["n_components"],
+            random_state=params["random_state"],
+        )
+        ica = builder.ica
+        ica.components_ = np.asarray(arrays["unmixing"])
+        ica.mixing_ = np.asarray(arrays["mixing"])
+        ica.mean_ = np.asarray(arrays["mean"])
+        ica.n_features_in_ = len(ica.mean_)
+        builder._feature_names = list(params["feature_names"])
+        builder._selected_ic = params["selected_ic"]
+        builder._ic_sign = params["ic_sign"]
+        builder.is_fitted = True
+        return builder
@@ -83,6 +83,65 @@ class PCAIndexBuilder:
             "method": "PCA",
         }
 
+    def build_from_moments(
+        self,
+        n: int,
+        mean: np.ndarray,
+        scatter: np.ndarray,
+        feature_names: list[str],
+    ) -> dict:
+        """
+        충분통계량으로 PCA 적합 (데이터 행렬 없이 p×p 고유분해만 수행).
+
+        CPCV처럼 같은 데이터의 여러 부분집합에 반복 적합할 때 사용:
+        부분집합의 (count, Σx, ΣxxT)를 prefix sum으로 조립 → 여기서 적합.
+        sklearn PCA와 동일한 규약:
+          - 공분산 = scatter / (n - 1)
+          - 부호: 각 component의 절댓값 최대 원소가 양수 (svd_flip, v 기준)
+
+        Args:
+            n: 관측치 수
+            mean: (p,) 열 평균
+            scatter: (p, p) 중심화 교차곱 Σ(x-μ)(x-μ)ᵀ
+            feature_names: 열 이름 (transform 시 사용)
+
+        Returns:
+            dict with keys: loadings, explained_variance, n_observations, method
+            (build()와 달리 index 없음 — transform()으로 계산)
+        """
+        mean = np.asarray(mean, dtype=float)
+        cov = np.asarray(scatter, dtype=float) / (n - 1)
+
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        eigvals = np.clip(eigvals[::-1], 0.0, None)
+        components = eigvecs[:, ::-1].T
+
+        # svd_flip(u_based_decision=False): 절댓값 최대 원소를 양수로
+        max_abs = np.argmax(np.abs(components), axis=1)
+        signs = np.sign(components[np.arange(len(components)), max_abs])
+        components *= signs[:, None]
+
+        k = self.n_components
+        self.pca.components_ = components[:k]
+        self.pca.mean_ = mean
+        self.pca.explained_variance_ = eigvals[:k]
+        self.pca.explained_variance_ratio_ = eigvals[:k] / eigvals.sum()
+        self.pca.singular_values_ = np.sqrt(eigvals[:k] * (n - 1))
+        self.pca.noise_variance_ = float(eigvals[k:].mean()) if len(eigvals) > k else 0.0
+        self.pca.n_components_ = k
+        self.pca.n_samples_ = n
+        self.pca.n_features_in_ = len(mean)
+        self.is_fitted = True
+        self._feature_names = list(feature_names)
+
+        loadings = dict(zip(self._feature_names, components[0]))
+        return {
+            "loadings": loadings,
+            "explained_variance": float(self.pca.explained_variance_ratio_[0]),
+            "n_observations": int(n),
+            "method": "PCA",
+        }
+
     def transform(self, z_matrix: pd.DataFrame) -> pd.Series:
         """Transform new data using fitted PCA (for weekly updates)."""
         if not self.is_fitted:
@@ -92,6 +151,41 @@ class PCAIndexBuilder:
         pc1 = self.pca.transform(X.values)[:, 0]
         return pd.Series(pc1, index=X.index, name="liquidity_index")
 
+    def to_artifact(self) -> tuple[dict[str, np.ndarray], dict]:
+        """적합 상태 → (배열, 파라미터) — ModelArtifactStore 저장용"""
+        if not self.is_fitted:
+            raise ValueError("PCA not fitted. Call build() first.")
+        arrays = {
+            "components": self.pca.components_,
+            "mean": self.pca.mean_,
+            "explained_variance": self.pca.explained_variance_,
+            "explained_variance_ratio": self.pca.explained_variance_ratio_,
+        }
+        params = {
+            "n_components": self.n_components,
+            "random_state": self.random_state,
+            "feature_names": list(self._feature_names),
+        }
+        return arrays, params
+
+    @classmethod
+    def from_artifact(cls, arrays: dict, params: dict) -> "PCAIndexBuilder":
+        """to_artifact() 결과로 적합된 builder 복원 (재적합 없음)"""
+        builder = cls(
+            n_components=params["n_components"],
+            random_state=params["random_state"],
+        )
+        pca = builder.pca
+        pca.components_ = np.asarray(arrays["components"])
+        pca.mean_ = np.asarray(arrays["mean"])
+        pca.explained_variance_ = np.asarray(arrays["explained_variance"])
+        pca.explained_variance_ratio_ = np.asarray(arrays["explained_variance_ratio"])
+        pca.n_components_ = len(pca.components_)
+        pca.n_features_in_ = len(pca.mean_)
+        builder._feature_names = list(params["feature_names"])
+        builder.is_fitted = True
+        return builder
+
     def get_loadings_dict(self) -> dict[str, float]:
         """Return current fitted PCA loadings as {variable: loading}."""
         if not self.is_fitted:
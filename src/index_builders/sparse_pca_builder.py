@@ -76,6 +76,50 @@ class SparsePCAIndexBuilder:
             "method": "SparsePCA",
         }
 
+    def transform(self, z_matrix: pd.DataFrame) -> pd.Series:
+        """Transform new data using fitted Sparse PCA components."""
+        if not self.is_fitted:
+            raise ValueError("SparsePCA not fitted. Call build() first.")
+
+        X = z_matrix[self._feature_names].dropna()
+        transformed = self.spca.transform(X.values)
+        return pd.Series(
+            transformed[:, 0], index=X.index, name="liquidity_index"
+        )
+
+    def to_artifact(self) -> tuple[dict[str, np.ndarray], dict]:
+        """적합 상태 → (배열, 파라미터) — ModelArtifactStore 저장용"""
+        if not self.is_fitted:
+            raise ValueError("SparsePCA not fitted. Call build() first.")
+        arrays = {
+            "components": self.spca.components_,
+            "mean": self.spca.mean_,
+        }
+        params = {
+            "n_components": int(self.spca.n_components),
+            "alpha": self.alpha,
+            "random_state": self.random_state,
+            "feature_names": list(self._feature_names),
+        }
+        return arrays, params
+
+    @classmethod
+    def from_artifact(cls, arrays: dict, params: dict) -> "SparsePCAIndexBuilder":
+        """to_artifact() 결과로 적합된 builder 복원 (재적합 없음)"""
+        builder = cls(
+            n_components=params["n_components"],
+            alpha=params["alpha"],
+            random_state=params["random_state"],
+        )
+        spca = builder.spca
+        spca.components_ = np.asarray(arrays["components"])
+        spca.mean_ = np.asarray(arrays["mean"])
+        spca.n_components_ = len(spca.components_)
+        spca.n_features_in_ = len(spca.mean_)
+        builder._feature_names = list(params["feature_names"])
+        builder.is_fitted = True
+        return builder
+
     def alpha_sensitivity(
         self,
         z_matrix: pd.DataFrame,
@@ -1,8 +1,13 @@
-from src.optimizers.orthogonalize import check_and_orthogonalize, ols_residual
+from src.optimizers.orthogonalize import (
+    apply_orthogonalization, check_and_orthogonalize, ols_residual,
+)
+from src.optimizers.sufficient_stats import LagSufficientStats
 from src.optimizers.grid_search import GridSearchOptimizer
+from src.optimizers.closed_form import ClosedFormOptimizer
 from src.optimizers.walk_forward import WalkForwardValidator
 
 __all__ = [
-    "check_and_orthogonalize", "ols_residual",
-    "GridSearchOptimizer", "WalkForwardValidator",
+    "apply_orthogonalization", "check_and_orthogonalize", "ols_residual",
+    "LagSufficientStats",
+    "GridSearchOptimizer", "ClosedFormOptimizer", "WalkForwardValidator",
 ]
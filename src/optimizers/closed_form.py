@@ -0,0 +1,243 @@
+"""lag별 closed-form 제약 상관 최대화 — Grid Search 대체/검증용"""
+import itertools
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+from config.constants import CLOSED_FORM, GRID_SEARCH, VARIABLE_ORDER
+from src.optimizers.grid_search import GridSearchOptimizer
+from src.optimizers.sufficient_stats import LagSufficientStats
+from src.utils.logger import setup_logger
+
+logger = setup_logger("closed_form")
+
+
+class ClosedFormOptimizer:
+    """
+    고정 lag k에서 corr(Z·w, t_k) = wᵀc / √(wᵀCw) 는 일반화 Rayleigh 몫:
+      - 제약 없음: 최적 방향 w* ∝ C⁻¹c (C = 중심화 ZᵀZ, c = 중심화 Zᵀt_k)
+      - GRID_SEARCH 부호/범위 제약 (SOFR_binary ≤ 0, HY_level ≤ 0 등):
+        corr은 스케일 불변이므로 αw*가 box 안에 들어가는 α > 0가 있으면
+        제약 비활성 → analytic 해, 없으면 L-BFGS-B bounded 최적화.
+    연속 최적해를 0.5 grid로 snap (floor/ceil 꼭짓점 × 스케일 후보 중 최대 corr)
+    하여 Grid Search 결과와 직접 비교 가능하게 한다.
+
+    lag당 p×p 선형계 1회 (+ 필요 시 소형 bounded solve) → 전체 ~10회 풀이.
+    """
+
+    def __init__(self, search_config: dict | None = None):
+        self.config = search_config or GRID_SEARCH
+        self.min_obs = CLOSED_FORM["min_obs"]
+        self.snap_scales = CLOSED_FORM["snap_scales"]
+        self._grid = GridSearchOptimizer(self.config, engine="moments")
+
+    def optimize(
+        self,
+        z_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        variable_names: list[str] | None = None,
+    ) -> dict:
+        """
+        lag별 연속 제약 최적해 + grid snap 결과.
+
+        Returns: {
+            "weights": {...},          # snap된 best (grid 값)
+            "optimal_lag": 5,
+            "correlation": 0.45,       # snap된 가중치의 corr (모든 lag 중 최대)
+            "continuous": {"weights": {...}, "lag": 5, "correlation": 0.47},
+            "per_lag": [{"lag", "status", "continuous_corr", "snapped_corr", ...}],
+            "method": "closed_form",
+        }
+        """
+        var_names = variable_names or VARIABLE_ORDER
+        stats = LagSufficientStats(
+            z_matrix[var_names].values, log_btc.values, self.lag_range(),
+            nan_policy="zero", min_obs=self.min_obs,
+        )
+        result = self.solve(stats, var_names)
+
+        if result["weights"]:
+            cont = result["continuous"]
+            logger.info(
+                f"Closed-form: continuous corr={cont['correlation']:.4f} "
+                f"(lag={cont['lag']}m), snapped corr={result['correlation']:.4f} "
+                f"(lag={result['optimal_lag']}m), weights={result['weights']}"
+            )
+        else:
+            logger.error("Closed-form optimizer produced no valid lag")
+        return result
+
+    def lag_range(self) -> range:
+        return range(
+            int(self.config["lag_months"]["min"]),
+            int(self.config["lag_months"]["max"]) + 1,
+        )
+
+    def solve(
+        self,
+        stats: LagSufficientStats,
+        var_names: list[str],
+        start: int = 0,
+        stop: int | None = None,
+    ) -> dict:
+        """
+        충분통계량의 score 구간 [start, stop)에서 lag별 최적화.
+        (Walk-Forward 재최적화처럼 window마다 호출 가능)
+        """
+        lo, hi = self._bounds(var_names)
+        axes = self._grid._grid_axes(var_names)
+
+        per_lag = []
+        snap_pool = []
+        for k in stats.lags:
+            mom = stats.moments(k, start, stop)
+            if mom is None or mom["ctt"] <= 0:
+                continue
+
+            w, status = self._solve_lag(mom["czz"], mom["czt"], lo, hi)
+            if w is None:
+                continue
+            r = self._corr(w, mom)
+            per_lag.append({
+                "lag": k,
+                "status": status,
+                "continuous_weights": dict(zip(var_names, (float(v) for v in w))),
+                "continuous_corr": r,
+            })
+            snap_pool.append(self._snap_candidates(w, lo, hi, axes))
+
+        if not per_lag:
+            return {"weights": {}, "optimal_lag": 0, "correlation": 0.0,
+                    "continuous": {}, "per_lag": [], "method": "closed_form"}
+
+        # snap 후보 전체를 모든 lag에서 평가 → grid 목적함수 기준 best
+        owner = np.concatenate([np.full(len(s), i) for i, s in enumerate(snap_pool)])
+        W = np.vstack(snap_pool).T
+        corr = stats.correlations(W, start, stop)
+        filled = np.where(np.isnan(corr), -np.inf, corr)
+
+        for i, row in enumerate(per_lag):
+            j = stats.lags.index(row["lag"])
+            own = np.flatnonzero(owner == i)
+            g = own[np.argmax(filled[own, j])]
+            row["snapped_weights"] = dict(zip(var_names, (float(v) for v in W[:, g])))
+            row["snapped_corr"] = float(corr[g, j])
+
+        g_best, j_best = np.unravel_index(np.argmax(filled), filled.shape)
+        best_cont = max(per_lag, key=lambda r: r["continuous_corr"])
+
+        return {
+            "weights": dict(zip(var_names, (float(v) for v in W[:, g_best]))),
+            "optimal_lag": int(stats.lags[j_best]),
+            "correlation": float(corr[g_best, j_best]),
+            "continuous": {
+                "weights": best_cont["continuous_weights"],
+                "lag": best_cont["lag"],
+                "correlation": best_cont["continuous_corr"],
+            },
+            "per_lag": per_lag,
+            "method": "closed_form",
+        }
+
+    def _bounds(self, var_names: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """GRID_SEARCH box (설정 없는 변수는 0 고정)"""
+        lo = np.array([self.config[v]["min"] if v in self.config else 0.0 for v in var_names])
+        hi = np.array([self.config[v]["max"] if v in self.config else 0.0 for v in var_names])
+        return lo.astype(float), hi.astype(float)
+
+    @staticmethod
+    def _corr(w: np.ndarray, mom: dict) -> float:
+        var = float(w @ mom["czz"] @ w)
+        if var <= 0:
+            return np.nan
+        return float(w @ mom["czt"] / np.sqrt(var * mom["ctt"]))
+
+    @staticmethod
+    def _scale_interval(
+        w: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+    ) -> tuple[float, float] | None:
+        """αw ∈ [lo, hi]를 만족하는 α > 0 구간 (없으면 None)"""
+        a_lo, a_hi = 0.0, np.inf
+        for wj, l, h in zip(w, lo, hi):
+            if abs(wj) < 1e-12:
+                if l > 0 or h < 0:
+                    return None
+                continue
+            b1, b2 = l / wj, h / wj
+            a_lo = max(a_lo, min(b1, b2))
+            a_hi = min(a_hi, max(b1, b2))
+        if a_hi <= 0 or a_lo > a_hi:
+            return None
+        return a_lo, a_hi
+
+    def _solve_lag(
+        self,
+        C: np.ndarray,
+        c: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+    ) -> tuple[np.ndarray | None, str]:
+        """(최적 w — box 내 최대 스케일, "analytic" | "bounded")"""
+        w_star = np.linalg.lstsq(C, c, rcond=None)[0]
+
+        interval = self._scale_interval(w_star, lo, hi)
+        if interval is not None and w_star @ c > 0:
+            return w_star * interval[1], "analytic"
+
+        def neg_corr(w):
+            var = w @ C @ w
+            if var <= 1e-18:
+                return 0.0, np.zeros_like(w)
+            b = np.sqrt(var)
+            a = w @ c
+            f = a / b
+            grad = c / b - a * (C @ w) / b ** 3
+            return -f, -grad
+
+        mid = (lo + hi) / 2
+        starts = [mid, np.clip(w_star, lo, hi), np.clip(w_star * np.max(np.abs(hi - lo)), lo, hi)]
+
+        best_w, best_f = None, np.inf
+        for x0 in starts:
+            res = minimize(
+                neg_corr, x0, jac=True, method="L-BFGS-B",
+                bounds=list(zip(lo, hi)),
+            )
+            if res.fun < best_f:
+                best_f, best_w = res.fun, res.x
+
+        if best_w is None or not np.isfinite(best_f):
+            return None, "failed"
+
+        interval = self._scale_interval(best_w, lo, hi)
+        if interval is not None:
+            best_w = best_w * interval[1]
+        return best_w, "bounded"
+
+    def _snap_candidates(
+        self,
+        w: np.ndarray,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        axes: list[np.ndarray],
+    ) -> np.ndarray:
+        """스케일 후보 × grid floor/ceil 꼭짓점 (n × p)"""
+        interval = self._scale_interval(w, lo, hi)
+        a_lo, a_hi = interval if interval is not None else (1.0, 1.0)
+
+        rows = []
+        for frac in self.snap_scales:
+            alpha = max(a_lo, frac * a_hi) / a_hi if a_hi > 0 else 1.0
+            v = np.clip(w * alpha, lo, hi)
+            choices = []
+            for x, ax in zip(v, axes):
+                pos = np.searchsorted(ax, x)
+                near = {ax[min(pos, len(ax) - 1)], ax[max(pos - 1, 0)]}
+                choices.append(sorted(near))
+            rows.extend(itertools.product(*choices))
+
+        W = np.unique(np.array(rows, dtype=float), axis=0)
+        return W[~np.all(W == 0, axis=1)]
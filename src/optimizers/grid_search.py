@@ -1,26 +1,98 @@
 """5변수 파형 매칭 Grid Search"""
 import itertools
+import multiprocessing as mp
+import time
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr
+from scipy.stats import pearsonr, qmc
 from tqdm import tqdm
 
-from config.constants import GRID_SEARCH, VARIABLE_ORDER
+from config.constants import (
+    GRID_SEARCH, GRID_SEARCH_BUDGET, GRID_SEARCH_ENGINE, VARIABLE_ORDER,
+)
+from src.optimizers.result_collector import StreamingResultCollector
+from src.optimizers.sufficient_stats import LagSufficientStats
 from src.utils.logger import setup_logger
 
 logger = setup_logger("grid_search")
 
+# 병렬 worker 상태 — fork 시 부모 메모리(Z, target)를 복사 없이 상속
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(state: dict | None = None) -> None:
+    """Pool initializer — spawn 환경에서는 state를 인자로 전달받음"""
+    if state is not None:
+        _WORKER_STATE.clear()
+        _WORKER_STATE.update(state)
+    _WORKER_STATE.pop("evaluate", None)
+
+
+def _run_chunk(bounds: tuple[int, int]) -> tuple[int, StreamingResultCollector]:
+    """grid 구간 [start, stop) 평가 → (조합 수, 구간 collector)"""
+    start, stop = bounds
+    st = _WORKER_STATE
+    opt: GridSearchOptimizer = st["optimizer"]
+
+    if "evaluate" not in st:
+        st["evaluate"] = opt._block_evaluator(st["Z"], st["target"], st["lag_range"])
+
+    collector = StreamingResultCollector(
+        top_k=opt.top_k,
+        lags=st["lag_range"],
+        capacity=opt.heap_size,
+        tie_tol=opt.tie_tol,
+        dump_path=opt.results_path,
+        dump_mode="r+",
+    )
+    for s, W in opt._iter_weight_blocks(st["axes"], opt.batch_size, start, stop):
+        collector.add(s, W, st["evaluate"](W))
+    collector.close(quiet=True)
+
+    return stop - start, collector
+
 
 class GridSearchOptimizer:
     """
     Grid Search: 5변수 가중치 + lag(0-9m) 동시 탐색
     목적함수: maximize corr(score(t), log₁₀(BTC)(t+k))
+
+    엔진:
+      - "moments": lag별 충분통계량(ZᵀZ, Zᵀt_k) 1회 계산 → 조합·lag당 O(p²)
+      - "batch": 가중치 조합을 (5 × G) 블록으로 쌓아 Z @ W 한 번에 평가
+      - "loop": 조합별 _compute_score + pearsonr (v1.0 방식)
     """
 
-    def __init__(self, search_config: dict | None = None):
+    ENGINES = ("moments", "batch", "loop")
+
+    def __init__(
+        self,
+        search_config: dict | None = None,
+        engine: str | None = None,
+        batch_size: int | None = None,
+        results_path: str | Path | None = None,
+        workers: int | None = None,
+        progress: bool = True,
+    ):
         self.config = search_config or GRID_SEARCH
+        self.engine = engine or GRID_SEARCH_ENGINE["engine"]
+        self.batch_size = batch_size or GRID_SEARCH_ENGINE["batch_size"]
+        self.top_k = GRID_SEARCH_ENGINE["top_k"]
+        self.min_obs = GRID_SEARCH_ENGINE["min_obs"]
+        self.tie_tol = GRID_SEARCH_ENGINE["tie_tol"]
+        self.heap_size = GRID_SEARCH_ENGINE["heap_size"]
+        # 전체 grid 결과 .npy 덤프 경로 (민감도 분석용, batch/moments 엔진)
+        self.results_path = results_path
+        # 프로세스 수 (1 = 직렬, batch/moments 엔진만 병렬 지원)
+        self.workers = max(1, workers or GRID_SEARCH_ENGINE["workers"])
+        # tqdm 진행 표시 (Walk-Forward 재최적화처럼 반복 호출 시 끔)
+        self.progress = progress
+
+        if self.engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {self.engine} (choose from {self.ENGINES})")
 
     def optimize(
         self,
@@ -50,38 +122,208 @@ class GridSearchOptimizer:
         Z = z_matrix[var_names].values
         target = log_btc.values
 
-        # 가중치 그리드 생성
-        grid = self._generate_grid(var_names)
         lag_range = range(
             int(self.config["lag_months"]["min"]),
             int(self.config["lag_months"]["max"]) + 1,
         )
 
-        logger.info(f"Grid Search: {len(grid)} weight combos × "
-                    f"{len(lag_range)} lags = {len(grid) * len(lag_range)} evaluations")
+        axes = self._grid_axes(var_names)
+        n_grid = int(np.prod([len(a) for a in axes]))
+
+        logger.info(f"Grid Search ({self.engine}): {n_grid} weight combos × "
+                    f"{len(lag_range)} lags = {n_grid * len(lag_range)} evaluations")
+
+        results_path = None
+        if self.engine == "loop":
+            results = self._optimize_loop(Z, target, var_names, lag_range)
+            total_evaluated = len(results)
+            lag_hist = {}
+            for r in results:
+                lag_hist[r["lag"]] = lag_hist.get(r["lag"], 0) + 1
+            lag_hist = dict(sorted(lag_hist.items()))
+        else:
+            results, collector = self._optimize_batch(
+                Z, target, var_names, axes, lag_range,
+            )
+            total_evaluated = collector.n_valid
+            lag_hist = collector.lag_histogram()
+            results_path = collector.close()
+
+        result = self._summarize(results, total_evaluated, lag_hist)
+        if results_path and result["top_50"]:
+            result["results_path"] = results_path
+        return result
+
+    def optimize_budgeted(
+        self,
+        z_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        variable_names: list[str] | None = None,
+        max_evals: int | None = None,
+        max_seconds: float | None = None,
+        reference: dict | None = None,
+    ) -> dict:
+        """
+        예산 제한 탐색 (anytime): Sobol 샘플링 → elite 주변 successive halving.
 
-        results = []
+        전체 grid 대신 max_evals개 조합 또는 max_seconds 안에서 탐색하고,
+        예산이 소진되는 시점의 best-so-far를 반환한다. 변수가 늘어 grid가
+        지수적으로 커질 때 (SOFR_smooth, DXY 등 8–10변수) 대안.
 
-        for weights_dict in tqdm(grid, desc="Grid Search", disable=False):
-            w = np.array([weights_dict.get(v, 0.0) for v in var_names])
+        라운드 구조 (grid 좌표 공간):
+          0. 전체 box에서 Sobol initial_samples개
+          1. 상위 elite(이전 elite의 1/eta) 중심, 반경 절반 box에서 Sobol 재샘플
+          2. 반경이 grid step 1까지 줄고 개선이 없으면 전체 box Sobol 재시작
 
-            # 최소 1개 변수 활성 체크
-            if np.all(w == 0):
-                continue
+        Args:
+            max_evals: 가중치 조합 평가 예산 (각 조합은 모든 lag 평가)
+            max_seconds: wall-clock 예산 (초)
+            reference: optimize() 결과 — 주면 exhaustive 최적 대비 차이 보고
 
-            # Score 계산
-            score = self._compute_score(Z, w)
+        Returns: optimize()와 같은 형식 + {
+            "n_evaluated", "grid_size", "elapsed_sec", "rounds",
+            "exhaustive_gap" (reference가 있을 때)
+        }
+        """
+        cfg = GRID_SEARCH_BUDGET
+        max_evals = max_evals or cfg["max_evals"]
+        max_seconds = max_seconds if max_seconds is not None else cfg["max_seconds"]
+        var_names = variable_names or VARIABLE_ORDER
 
-            # 각 lag에서 corr 계산
-            best_corr, best_lag = self._evaluate(score, target, lag_range)
+        Z = z_matrix[var_names].values
+        target = log_btc.values
+        lag_range = range(
+            int(self.config["lag_months"]["min"]),
+            int(self.config["lag_months"]["max"]) + 1,
+        )
+        axes = self._grid_axes(var_names)
+        shape = np.array([len(a) for a in axes])
+        n_grid = int(np.prod(shape))
+
+        evaluate = self._block_evaluator(Z, target, lag_range)
+        collector = StreamingResultCollector(
+            top_k=self.top_k, lags=lag_range,
+            capacity=self.heap_size, tie_tol=self.tie_tol,
+        )
+        rng = np.random.default_rng(cfg["seed"])
+        seen: set[int] = set()
+        t0 = time.perf_counter()
+
+        def exhausted() -> bool:
+            if len(seen) >= min(max_evals, n_grid):
+                return True
+            return max_seconds is not None and time.perf_counter() - t0 >= max_seconds
+
+        def run_batch(coords: np.ndarray) -> None:
+            """grid 좌표 배치 → 중복 제거 후 평가 (남은 예산만큼, Sobol 순서 유지)"""
+            flat = np.ravel_multi_index(coords.T, shape)
+            _, first = np.unique(flat, return_index=True)
+            flat = flat[np.sort(first)]  # 첫 등장 순 — 잘라도 low-discrepancy 앞부분
+            flat = np.array([i for i in flat if i not in seen], dtype=np.int64)
+            flat = flat[:max(0, max_evals - len(seen))]
+            if len(flat) == 0:
+                return
+            seen.update(flat.tolist())
+            for s in range(0, len(flat), self.batch_size):
+                part = flat[s:s + self.batch_size]
+                W = self._weights_at(axes, part).T
+                collector.add(0, W, evaluate(W), index=part)
+
+        full_lo = np.zeros(len(shape))
+        full_hi = (shape - 1).astype(float)
+        n_elite = max(1, cfg["initial_samples"] // cfg["eta"])
+        radius = full_hi / 2
+        best_prev = -np.inf
+        rounds = 0
+
+        run_batch(self._sobol_coords(full_lo, full_hi, cfg["initial_samples"], rng))
+        rounds += 1
+
+        while not exhausted():
+            top = collector.top(n_elite)
+            if not top:
+                break
+            best_now = top[0][0]
+
+            if np.all(radius <= 1) and best_now <= best_prev:
+                # 수렴 → 전체 box 재시작
+                run_batch(self._sobol_coords(full_lo, full_hi, cfg["initial_samples"], rng))
+                radius = full_hi / 2
+                n_elite = max(1, cfg["initial_samples"] // cfg["eta"])
+            else:
+                radius = np.maximum(radius / 2, 1.0)
+                centers = np.column_stack(np.unravel_index(
+                    np.array([gi for _, gi in top]), shape,
+                ))
+                m = cfg["samples_per_center"]
+                run_batch(np.vstack([
+                    self._sobol_coords(
+                        np.maximum(c - radius, full_lo),
+                        np.minimum(c + radius, full_hi),
+                        m, rng,
+                    )
+                    for c in centers
+                ]))
+                n_elite = max(1, n_elite // cfg["eta"])
+
+            best_prev = max(best_prev, best_now)
+            rounds += 1
+
+        elapsed = time.perf_counter() - t0
+        results = self._refine(Z, target, var_names, axes, lag_range, collector)
+        result = self._summarize(results, collector.n_valid, collector.lag_histogram())
+        result.update({
+            "n_evaluated": len(seen),
+            "grid_size": n_grid,
+            "elapsed_sec": round(elapsed, 3),
+            "rounds": rounds,
+        })
 
-            if not np.isnan(best_corr):
-                results.append({
-                    "weights": weights_dict.copy(),
-                    "lag": best_lag,
-                    "correlation": best_corr,
-                })
+        logger.info(
+            f"Budgeted search: {len(seen)}/{n_grid} combos "
+            f"({len(seen) / n_grid:.1%}), {rounds} rounds, {elapsed:.2f}s"
+        )
 
+        if reference and reference.get("top_50") and result["top_50"]:
+            gap = float(reference["correlation"]) - float(result["correlation"])
+            result["exhaustive_gap"] = {
+                "exhaustive_correlation": float(reference["correlation"]),
+                "correlation_gap": gap,
+                "same_weights": result["weights"] == reference["weights"],
+                "same_lag": result["optimal_lag"] == reference["optimal_lag"],
+                "top_50_overlap": len(
+                    {tuple(r["weights"].values()) for r in result["top_50"]}
+                    & {tuple(r["weights"].values()) for r in reference["top_50"]}
+                ),
+            }
+            logger.info(
+                f"vs exhaustive: gap={gap:.5f}, "
+                f"same_weights={result['exhaustive_gap']['same_weights']}"
+            )
+
+        return result
+
+    @staticmethod
+    def _sobol_coords(
+        lo: np.ndarray,
+        hi: np.ndarray,
+        n: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """[lo, hi] box의 Sobol 점 n개(2의 거듭제곱으로 올림) → 정수 grid 좌표"""
+        m = int(np.ceil(np.log2(max(n, 1))))
+        sampler = qmc.Sobol(d=len(lo), scramble=True, seed=rng)
+        u = sampler.random_base2(m)
+        pts = lo + u * (hi - lo)
+        return np.clip(np.rint(pts), lo, hi).astype(np.int64)
+
+    def _summarize(
+        self,
+        results: list[dict],
+        total_evaluated: int,
+        lag_hist: dict,
+    ) -> dict:
+        """재검증된 결과 → best / top_50 / lag 분포"""
         if not results:
             logger.error("Grid Search produced no valid results")
             return {"weights": {}, "optimal_lag": 0, "correlation": 0.0, "top_50": []}
@@ -90,7 +332,7 @@ class GridSearchOptimizer:
         results.sort(key=lambda x: x["correlation"], reverse=True)
 
         best = results[0]
-        top_50 = results[:50]
+        top_50 = results[:self.top_k]
 
         # 안정성 분석: top 50의 lag 분포
         lag_dist = {}
@@ -103,6 +345,7 @@ class GridSearchOptimizer:
             f"lag={best['lag']}m, weights={best['weights']}"
         )
         logger.info(f"Top 50 lag distribution: {lag_dist}")
+        logger.info(f"All-combo lag histogram: {lag_hist}")
 
         return {
             "weights": best["weights"],
@@ -110,9 +353,262 @@ class GridSearchOptimizer:
             "correlation": best["correlation"],
             "top_50": top_50,
             "lag_distribution": lag_dist,
-            "total_evaluated": len(results),
+            "lag_histogram": lag_hist,
+            "total_evaluated": total_evaluated,
+        }
+
+    def _optimize_loop(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        var_names: list[str],
+        lag_range: range,
+    ) -> list[dict]:
+        """조합별 루프 평가 (v1.0 방식) — 유효 조합 전체를 grid 순서로 반환"""
+        grid = self._generate_grid(var_names)
+        results = []
+
+        for weights_dict in tqdm(grid, desc="Grid Search", disable=not self.progress):
+            w = np.array([weights_dict.get(v, 0.0) for v in var_names])
+
+            # 최소 1개 변수 활성 체크
+            if np.all(w == 0):
+                continue
+
+            # Score 계산
+            score = self._compute_score(Z, w)
+
+            # 각 lag에서 corr 계산
+            best_corr, best_lag = self._evaluate(score, target, lag_range)
+
+            if not np.isnan(best_corr):
+                results.append({
+                    "weights": weights_dict.copy(),
+                    "lag": best_lag,
+                    "correlation": best_corr,
+                })
+
+        return results
+
+    def _optimize_batch(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        var_names: list[str],
+        axes: list[np.ndarray],
+        lag_range: range,
+    ) -> tuple[list[dict], StreamingResultCollector]:
+        """
+        블록 평가 → 상위 후보만 루프 방식으로 재검증.
+
+        블록 corr은 pearsonr과 부동소수점 오차 수준에서만 다르므로,
+        top_k 경계에서 tie_tol 이내인 후보까지 _evaluate로 재계산하면
+        loop 엔진과 동일한 best/top_50 (동률 시 grid 순서 유지)을 얻는다.
+        """
+        n_grid = int(np.prod([len(a) for a in axes]))
+        collector = self._new_collector(lag_range, n_grid, len(var_names))
+
+        if self.workers > 1:
+            collector.close(quiet=True)
+            self._run_parallel(Z, target, axes, lag_range, n_grid, collector)
+        else:
+            evaluate = self._block_evaluator(Z, target, lag_range)
+            with tqdm(total=n_grid, desc="Grid Search", disable=not self.progress) as pbar:
+                for start, W in self._iter_weight_blocks(axes, self.batch_size):
+                    collector.add(start, W, evaluate(W))
+                    pbar.update(W.shape[1])
+
+        return self._refine(Z, target, var_names, axes, lag_range, collector), collector
+
+    def _run_parallel(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        axes: list[np.ndarray],
+        lag_range: range,
+        n_grid: int,
+        collector: StreamingResultCollector,
+    ) -> None:
+        """
+        grid 인덱스 구간을 worker에 분배 → 구간별 collector를 병합.
+
+        heap 순서는 (corr, grid 순서)의 전순서이므로 병합 순서와 무관하게
+        직렬 실행과 동일한 후보 집합이 남는다.
+        """
+        chunks = self._chunk_bounds(n_grid)
+        state = {
+            "optimizer": self,
+            "Z": Z,
+            "target": target,
+            "axes": axes,
+            "lag_range": lag_range,
         }
 
+        if "fork" in mp.get_all_start_methods():
+            ctx = mp.get_context("fork")
+            _WORKER_STATE.clear()
+            _WORKER_STATE.update(state)
+            init_args = (None,)
+        else:
+            ctx = mp.get_context("spawn")
+            init_args = (state,)
+
+        logger.info(f"Parallel grid search: {self.workers} workers, {len(chunks)} chunks "
+                    f"({ctx.get_start_method()})")
+
+        try:
+            with ctx.Pool(self.workers, initializer=_init_worker, initargs=init_args) as pool, \
+                    tqdm(total=n_grid, desc=f"Grid Search ×{self.workers}", disable=not self.progress) as pbar:
+                for n_done, part in pool.imap_unordered(_run_chunk, chunks):
+                    collector.merge(part)
+                    pbar.update(n_done)
+        finally:
+            _WORKER_STATE.clear()
+
+    def _chunk_bounds(self, n_grid: int) -> list[tuple[int, int]]:
+        """worker당 ~4개 구간, batch_size 배수로 정렬"""
+        n_chunks = self.workers * 4
+        size = -(-n_grid // n_chunks)
+        size = max(self.batch_size, -(-size // self.batch_size) * self.batch_size)
+        return [(s, min(s + size, n_grid)) for s in range(0, n_grid, size)]
+
+    def _new_collector(
+        self,
+        lag_range: range,
+        n_grid: int,
+        n_vars: int,
+    ) -> StreamingResultCollector:
+        return StreamingResultCollector(
+            top_k=self.top_k,
+            lags=lag_range,
+            capacity=self.heap_size,
+            tie_tol=self.tie_tol,
+            dump_path=self.results_path,
+            n_total=n_grid,
+            n_vars=n_vars,
+        )
+
+    def _refine(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        var_names: list[str],
+        axes: list[np.ndarray],
+        lag_range: range,
+        collector: StreamingResultCollector,
+    ) -> list[dict]:
+        """heap 후보를 _compute_score + _evaluate로 재계산 (grid 순서)"""
+        candidates = collector.candidates()
+        if len(candidates) == 0:
+            return []
+
+        results = []
+        for w in self._weights_at(axes, candidates):
+            score = self._compute_score(Z, w)
+            corr, lag = self._evaluate(score, target, lag_range)
+            if np.isnan(corr):
+                continue
+            results.append({
+                "weights": dict(zip(var_names, (float(v) for v in w))),
+                "lag": lag,
+                "correlation": corr,
+            })
+        return results
+
+    def _block_evaluator(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        lag_range: range,
+    ):
+        """엔진별 W[p × G] → corr[G × L] 함수"""
+        if self.engine == "moments":
+            stats = LagSufficientStats(
+                Z, target, lag_range, nan_policy="zero", min_obs=self.min_obs,
+            )
+            return stats.correlations
+        return lambda W: self._evaluate_batch(Z, W, target, lag_range)
+
+    def _grid_axes(self, var_names: list[str]) -> list[np.ndarray]:
+        """변수별 탐색 값 배열 (_generate_grid와 동일한 반올림)"""
+        axes = []
+        for var in var_names:
+            if var in self.config:
+                cfg = self.config[var]
+                values = np.arange(cfg["min"], cfg["max"] + cfg["step"] / 2, cfg["step"])
+                axes.append(np.array([round(float(v), 2) for v in values]))
+            else:
+                axes.append(np.array([0.0]))
+        return axes
+
+    @staticmethod
+    def _weights_at(axes: list[np.ndarray], flat_idx: np.ndarray) -> np.ndarray:
+        """itertools.product 순서의 flat 인덱스 → (n × p) 가중치 행렬"""
+        shape = tuple(len(a) for a in axes)
+        coords = np.unravel_index(np.asarray(flat_idx), shape)
+        return np.column_stack([a[c] for a, c in zip(axes, coords)])
+
+    def _iter_weight_blocks(
+        self,
+        axes: list[np.ndarray],
+        batch_size: int,
+        start: int = 0,
+        stop: int | None = None,
+    ):
+        """(start, W[p × G]) 블록 생성 — 전체 grid를 메모리에 올리지 않음"""
+        n_grid = int(np.prod([len(a) for a in axes]))
+        stop = n_grid if stop is None else min(stop, n_grid)
+
+        for s in range(start, stop, batch_size):
+            e = min(s + batch_size, stop)
+            yield s, self._weights_at(axes, np.arange(s, e)).T
+
+    def _evaluate_batch(
+        self,
+        Z: np.ndarray,
+        W: np.ndarray,
+        target: np.ndarray,
+        lag_range: range,
+    ) -> np.ndarray:
+        """
+        (5 × G) 가중치 블록의 모든 lag corr → (G × L) 행렬.
+
+        _compute_score와 동일하게 NaN 변수는 가중치 0 처리 (score는 NaN 없음),
+        유효 행은 target NaN 여부로만 결정된다.
+        전부 0인 가중치 열·유효 포인트 부족 lag·상수 score는 NaN.
+        """
+        Z0 = np.where(np.isnan(Z), 0.0, Z)
+        S = Z0 @ W
+        T, G = S.shape
+
+        corr = np.full((G, len(lag_range)), np.nan)
+
+        for j, k in enumerate(lag_range):
+            s = S[:max(T - k, 0)]
+            t = target[k:]
+
+            valid = ~np.isnan(t)
+            n = int(valid.sum())
+            if n < self.min_obs:
+                continue
+
+            sv = s[valid]
+            tv = t[valid]
+            sc = sv - sv.mean(axis=0)
+            tc = tv - tv.mean()
+
+            ss = np.einsum("ij,ij->j", sc, sc)
+            tt = float(tc @ tc)
+            num = tc @ sc
+
+            ok = (ss > 1e-20 * n) & (tt > 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = num / np.sqrt(ss * tt)
+            corr[:, j] = np.where(ok, np.clip(r, -1.0, 1.0), np.nan)
+
+        corr[np.all(W == 0, axis=0)] = np.nan
+        return corr
+
     def _generate_grid(self, var_names: list[str]) -> list[dict]:
         """탐색 범위에서 모든 가중치 조합 생성"""
         ranges = {}
@@ -174,7 +670,7 @@ class GridSearchOptimizer:
 
             # NaN 제거
             valid = ~np.isnan(s) & ~np.isnan(t)
-            if valid.sum() < 20:  # 최소 데이터 포인트
+            if valid.sum() < self.min_obs:  # 최소 데이터 포인트
                 continue
 
             try:
@@ -115,6 +115,8 @@ def check_and_orthogonalize(
                     "corr_after": round(corr_after, 4),
                     "beta": round(beta, 4),
                     "alpha": round(alpha, 4),
+                    "beta_exact": beta,
+                    "alpha_exact": alpha,
                 }
                 logs.append(log_entry)
 
@@ -128,3 +130,24 @@ def check_and_orthogonalize(
         logger.info("No orthogonalization needed (all |corr| < threshold)")
 
     return result, logs
+
+
+def apply_orthogonalization(
+    variables: dict[str, pd.Series],
+    logs: list[dict],
+) -> dict[str, pd.Series]:
+    """
+    저장된 직교화 로그를 새 데이터에 그대로 적용 (β, α 고정 — 재추정 없음).
+
+    check_and_orthogonalize와 같은 순서로 target -= β*reference + α.
+    로그에 beta_exact가 없으면 (이전 결과) 반올림된 beta/alpha 사용.
+    """
+    result = {k: v.copy() for k, v in variables.items()}
+    for entry in logs:
+        target, reference = entry["target"], entry["reference"]
+        if target not in result or reference not in result:
+            continue
+        beta = entry.get("beta_exact", entry["beta"])
+        alpha = entry.get("alpha_exact", entry["alpha"])
+        result[target] = result[target] - (beta * result[reference] + alpha)
+    return result
@@ -0,0 +1,171 @@
+"""Grid Search 결과 스트리밍 수집 — 상위 K heap + lag 히스토그램 + .npy 덤프"""
+import heapq
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger("result_collector")
+
+
+class StreamingResultCollector:
+    """
+    블록 단위 평가 결과를 조합별 dict 없이 누적.
+
+      - heap: 상위 capacity개 (corr, grid_index) — 동률은 grid 순서 우선
+      - lag_counts: 유효 조합 전체의 best lag 히스토그램
+      - dump_path: (선택) 전체 grid 구조화 배열을 .npy memmap으로 기록
+        dtype = [weights float32 (p,), lag int8, corr float32], 무효 조합 corr=NaN
+        (dump_mode="r+": 이미 생성된 파일에 구간만 기록 — 병렬 worker용)
+
+    메모리는 grid 크기와 무관하게 O(capacity + L).
+    """
+
+    def __init__(
+        self,
+        top_k: int,
+        lags: list[int] | range,
+        capacity: int | None = None,
+        tie_tol: float = 1e-9,
+        dump_path: str | Path | None = None,
+        n_total: int | None = None,
+        n_vars: int | None = None,
+        dump_mode: str = "w+",
+    ):
+        self.top_k = top_k
+        self.lags = np.asarray(list(lags))
+        self.capacity = max(capacity or top_k, top_k)
+        self.tie_tol = tie_tol
+
+        self._heap: list[tuple[float, int]] = []
+        self.lag_counts = np.zeros(len(self.lags), dtype=np.int64)
+        self.n_valid = 0
+
+        self.dump_path = Path(dump_path) if dump_path else None
+        self._dump = None
+        if self.dump_path is not None and dump_mode == "r+":
+            self._dump = np.lib.format.open_memmap(self.dump_path, mode="r+")
+        elif self.dump_path is not None:
+            if n_total is None or n_vars is None:
+                raise ValueError("dump_path requires n_total and n_vars")
+            self.dump_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dump = np.lib.format.open_memmap(
+                self.dump_path, mode=dump_mode,
+                dtype=self.record_dtype(n_vars), shape=(n_total,),
+            )
+
+    @staticmethod
+    def record_dtype(n_vars: int) -> np.dtype:
+        """.npy 덤프 레코드 타입"""
+        return np.dtype([
+            ("weights", np.float32, (n_vars,)),
+            ("lag", np.int8),
+            ("corr", np.float32),
+        ])
+
+    def add(
+        self,
+        start: int,
+        W: np.ndarray,
+        corr: np.ndarray,
+        index: np.ndarray | None = None,
+    ) -> None:
+        """
+        블록 결과 누적.
+
+        Args:
+            start: 블록 첫 조합의 grid 인덱스
+            W: (p × G) 가중치 블록
+            corr: (G × L) lag별 corr (NaN = 무효)
+            index: 연속 구간이 아닐 때 열별 grid 인덱스 (start 무시, 덤프 불가)
+        """
+        filled = np.where(np.isnan(corr), -np.inf, corr)
+        lag_pos = filled.argmax(axis=1)
+        best = filled[np.arange(len(filled)), lag_pos]
+        valid = np.isfinite(best)
+
+        self.n_valid += int(valid.sum())
+        self.lag_counts += np.bincount(lag_pos[valid], minlength=len(self.lags))
+
+        if index is not None:
+            self._push(np.asarray(index, dtype=np.int64), best, valid)
+            return
+
+        if self._dump is not None:
+            block = self._dump[start:start + len(best)]
+            block["weights"] = W.T
+            block["lag"] = self.lags[lag_pos]
+            block["corr"] = np.where(valid, best, np.nan)
+
+        self._push(start + np.arange(len(best)), best, valid)
+
+    def _push(self, grid_idx: np.ndarray, best: np.ndarray, valid: np.ndarray) -> None:
+        """블록 내 상위 capacity개만 heap 후보로 전달"""
+        idx = np.flatnonzero(valid)
+        if len(idx) == 0:
+            return
+
+        if len(self._heap) >= self.capacity:
+            idx = idx[best[idx] >= self._heap[0][0]]
+        if len(idx) > self.capacity:
+            # (corr 내림차순, grid 순서) — 블록 분할과 무관하게 동일한 후보
+            keep = np.lexsort((grid_idx[idx], -best[idx]))[:self.capacity]
+            idx = np.sort(idx[keep])
+
+        for i in idx:
+            item = (float(best[i]), -int(grid_idx[i]))
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, item)
+            elif item > self._heap[0]:
+                heapq.heapreplace(self._heap, item)
+
+    def merge(self, other: "StreamingResultCollector") -> None:
+        """다른 collector(예: worker별 결과)를 합산"""
+        self.n_valid += other.n_valid
+        self.lag_counts += other.lag_counts
+        for item in other._heap:
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, item)
+            elif item > self._heap[0]:
+                heapq.heapreplace(self._heap, item)
+
+    def top(self, n: int) -> list[tuple[float, int]]:
+        """상위 n개 [(corr, grid_index)] — corr 내림차순, 동률은 grid 순서"""
+        ranked = sorted(self._heap, reverse=True)[:n]
+        return [(corr, -neg_idx) for corr, neg_idx in ranked]
+
+    def candidates(self) -> np.ndarray:
+        """
+        top_k 경계(- tie_tol) 이상인 grid 인덱스 (오름차순).
+        재검증(loop 경로)용 후보 집합.
+        """
+        if not self._heap:
+            return np.array([], dtype=np.int64)
+
+        ranked = sorted(self._heap, reverse=True)
+        kth = ranked[min(self.top_k, len(ranked)) - 1][0]
+        cand = [-neg_idx for corr, neg_idx in ranked if corr >= kth - self.tie_tol]
+
+        if len(ranked) == self.capacity and ranked[-1][0] >= kth - self.tie_tol:
+            logger.warning(
+                f"Top-K heap full at tie boundary (capacity={self.capacity}); "
+                "some tied candidates may be missing"
+            )
+        return np.sort(np.asarray(cand, dtype=np.int64))
+
+    def lag_histogram(self) -> dict[int, int]:
+        """유효 조합 전체의 best lag 분포 {lag: count}"""
+        return {
+            int(lag): int(c) for lag, c in zip(self.lags, self.lag_counts) if c > 0
+        }
+
+    def close(self, quiet: bool = False) -> str | None:
+        """덤프 flush → 경로 반환"""
+        if self._dump is None:
+            return str(self.dump_path) if self.dump_path else None
+        self._dump.flush()
+        self._dump = None
+        if not quiet:
+            logger.info(f"Grid results saved → {self.dump_path}")
+        return str(self.dump_path)
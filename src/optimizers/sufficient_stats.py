@@ -0,0 +1,207 @@
+"""Lag별 충분통계량 — corr(Z·w, target(t+k)) O(p²) 평가"""
+import numpy as np
+from scipy.stats import beta
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger("sufficient_stats")
+
+
+class LagSufficientStats:
+    """
+    corr(Z·w, target(t+k))는 lag k마다 아래 통계량만으로 결정된다:
+      n, Σz, Σt, Σt², ZᵀZ, Zᵀt  (유효 행 기준)
+
+    각 lag의 통계량을 행 방향 prefix sum으로 한 번 누적해 두면
+    임의의 score 구간 [start, stop)과 가중치 w에 대해 corr을 O(p²)에 계산.
+    (Grid Search 전체 구간, Walk-Forward test 구간 모두 재사용)
+
+    NaN 처리 (nan_policy):
+      - "zero": NaN 변수는 가중치 0 (GridSearchOptimizer._compute_score와 동일)
+      - "drop": NaN 변수가 있는 행 제외 (WalkForwardValidator와 동일)
+    target이 NaN인 (i, i+k) 쌍은 항상 제외 — CME_basis처럼 2017-12 이전
+    NaN이 있는 변수도 lag별 마스크에 그대로 반영된다.
+    """
+
+    NAN_POLICIES = ("zero", "drop")
+
+    def __init__(
+        self,
+        Z: np.ndarray,
+        target: np.ndarray,
+        lag_range: range,
+        nan_policy: str = "zero",
+        min_obs: int = 20,
+    ):
+        if nan_policy not in self.NAN_POLICIES:
+            raise ValueError(f"Unknown nan_policy: {nan_policy}")
+
+        Z = np.asarray(Z, dtype=float)
+        target = np.asarray(target, dtype=float)
+
+        self.lag_range = lag_range
+        self.lags = list(lag_range)
+        self.nan_policy = nan_policy
+        self.min_obs = min_obs
+        self.n_rows, self.n_vars = Z.shape
+
+        self._col_prefix = self._column_prefix(Z)
+
+        row_ok = ~np.isnan(Z).any(axis=1) if nan_policy == "drop" \
+            else np.ones(self.n_rows, dtype=bool)
+        Z0 = np.where(np.isnan(Z), 0.0, Z)
+
+        # 정밀도: 전역 평균으로 평행이동 (corr은 평행이동 불변)
+        t_ok = ~np.isnan(target)
+        mu_z = Z0[row_ok].mean(axis=0) if row_ok.any() else np.zeros(self.n_vars)
+        mu_t = target[t_ok].mean() if t_ok.any() else 0.0
+        Zc = Z0 - mu_z
+        tc = np.where(t_ok, target - mu_t, 0.0)
+
+        self._prefix = {}
+        for k in self.lags:
+            m = self.n_rows - k
+            if m <= 0:
+                self._prefix[k] = None
+                continue
+
+            valid = row_ok[:m] & t_ok[k:]
+            z = np.where(valid[:, None], Zc[:m], 0.0)
+            t = np.where(valid, tc[k:], 0.0)
+
+            self._prefix[k] = {
+                "n": self._cumsum(valid.astype(float)),
+                "z": self._cumsum(z),
+                "t": self._cumsum(t),
+                "tt": self._cumsum(t * t),
+                "zz": self._cumsum(z[:, :, None] * z[:, None, :]),
+                "zt": self._cumsum(z * t[:, None]),
+            }
+
+        logger.debug(
+            f"Sufficient stats: T={self.n_rows}, p={self.n_vars}, "
+            f"lags={self.lags[0]}-{self.lags[-1]}, nan_policy={nan_policy}"
+        )
+
+    @staticmethod
+    def _cumsum(a: np.ndarray) -> np.ndarray:
+        """앞에 0 행을 붙인 누적합 — P[stop] - P[start] = Σ a[start:stop]"""
+        out = np.zeros((len(a) + 1,) + a.shape[1:])
+        np.cumsum(a, axis=0, out=out[1:])
+        return out
+
+    @staticmethod
+    def _column_prefix(Z: np.ndarray) -> dict:
+        """열별 (NaN 제외) count, Σx, Σx² 누적합"""
+        ok = ~np.isnan(Z)
+        x = np.where(ok, Z, 0.0)
+        # 열 평균으로 평행이동하여 분산 계산 정밀도 확보
+        with np.errstate(invalid="ignore"):
+            shift = np.where(ok.any(axis=0), np.nanmean(np.where(ok, Z, np.nan), axis=0), 0.0)
+        x = np.where(ok, x - shift, 0.0)
+        return {
+            "n": LagSufficientStats._cumsum(ok.astype(float)),
+            "s": LagSufficientStats._cumsum(x),
+            "ss": LagSufficientStats._cumsum(x * x),
+            "shift": shift,
+        }
+
+    def column_moments(self, start: int = 0, stop: int | None = None) -> dict:
+        """
+        구간 [start, stop)의 열별 mean, std (NaN 제외, ddof=1).
+        compute_zscore_params와 동일한 정의 — expanding z-score 파라미터용.
+        """
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        p = self._col_prefix
+        n = p["n"][stop] - p["n"][start]
+        s = p["s"][stop] - p["s"][start]
+        ss = p["ss"][stop] - p["ss"][start]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = s / n
+            var = (ss - n * mean * mean) / (n - 1)
+        std = np.sqrt(np.maximum(var, 0.0))
+        std = np.where(n > 1, std, np.nan)
+        return {"mean": mean + p["shift"], "std": std, "n": n}
+
+    def moments(self, lag: int, start: int = 0, stop: int | None = None) -> dict | None:
+        """
+        lag k, score 구간 [start, stop)의 중심화 통계량.
+
+        Returns: {"n", "czz" (p×p), "czt" (p), "ctt"} — 편차 곱의 합
+                 (유효 쌍이 min_obs 미만이면 None)
+        """
+        P = self._prefix.get(lag)
+        if P is None:
+            return None
+
+        m = self.n_rows - lag
+        stop = m if stop is None else min(stop, m)
+        if stop <= start:
+            return None
+
+        n = P["n"][stop] - P["n"][start]
+        if n < self.min_obs:
+            return None
+
+        sz = P["z"][stop] - P["z"][start]
+        st = P["t"][stop] - P["t"][start]
+
+        return {
+            "n": int(round(n)),
+            "czz": (P["zz"][stop] - P["zz"][start]) - np.outer(sz, sz) / n,
+            "czt": (P["zt"][stop] - P["zt"][start]) - sz * st / n,
+            "ctt": float((P["tt"][stop] - P["tt"][start]) - st * st / n),
+        }
+
+    def correlations(
+        self,
+        W: np.ndarray,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> np.ndarray:
+        """
+        (p × G) 가중치 블록 → (G × L) corr 행렬 (조합·lag당 O(p²)).
+        전부 0인 가중치·유효 포인트 부족·상수 score는 NaN.
+        """
+        W = np.asarray(W, dtype=float)
+        if W.ndim == 1:
+            W = W[:, None]
+
+        corr = np.full((W.shape[1], len(self.lags)), np.nan)
+
+        for j, k in enumerate(self.lags):
+            mom = self.moments(k, start, stop)
+            if mom is None or mom["ctt"] <= 0:
+                continue
+
+            ss = np.einsum("pg,pq,qg->g", W, mom["czz"], W)
+            num = mom["czt"] @ W
+            scale = np.einsum("pg,p->g", W * W, np.diag(mom["czz"]))
+
+            ok = ss > 1e-12 * scale
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = num / np.sqrt(ss * mom["ctt"])
+            corr[:, j] = np.where(ok, np.clip(r, -1.0, 1.0), np.nan)
+
+        corr[np.all(W == 0, axis=0)] = np.nan
+        return corr
+
+    def n_obs(self, lag: int, start: int = 0, stop: int | None = None) -> int:
+        """lag k, 구간 [start, stop)의 유효 (score, target) 쌍 수"""
+        P = self._prefix.get(lag)
+        if P is None:
+            return 0
+        m = self.n_rows - lag
+        stop = m if stop is None else min(stop, m)
+        if stop <= start:
+            return 0
+        return int(round(P["n"][stop] - P["n"][start]))
+
+    @staticmethod
+    def p_value(r: float, n: int) -> float:
+        """양측 검정 p-value (scipy.stats.pearsonr와 동일한 beta 분포)"""
+        if n < 3 or np.isnan(r):
+            return np.nan
+        ab = n / 2 - 1
+        return float(2 * beta.sf(abs(r), ab, ab, loc=-1, scale=2))
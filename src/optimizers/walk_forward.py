@@ -1,19 +1,93 @@
 """Walk-Forward 검증"""
+import multiprocessing as mp
+import time
+
 import numpy as np
 import pandas as pd
 from scipy.stats import pearsonr
 
 from config.constants import WALK_FORWARD, VARIABLE_ORDER
 from src.calculators.detrend import zscore, compute_zscore_params
+from src.optimizers.sufficient_stats import LagSufficientStats
 from src.utils.logger import setup_logger
 
 logger = setup_logger("walk_forward")
 
 
+def _reoptimize_window(task: tuple) -> dict | None:
+    """
+    window 1개 재최적화 (Pool worker — 모듈 레벨 함수여야 pickle 가능).
+
+    train 구간만으로 z-score 파라미터 + 가중치/lag 탐색 (target도 train 내부로
+    한정 → look-ahead 없음) → 다음 test 구간에서 OOS corr.
+    """
+    (i, raw_matrix, log_btc, var_names, train_idx, test_idx, search_engine) = task
+    t0 = time.perf_counter()
+
+    train = raw_matrix.iloc[train_idx]
+    z_train = pd.DataFrame(index=train.index)
+    for var in var_names:
+        if var not in train.columns:
+            z_train[var] = np.nan   # Grid Search에서 가중치 0으로 처리
+            continue
+        params = compute_zscore_params(train[var])
+        z_train[var] = zscore(train[var], mean=params["mean"], std=params["std"])
+    btc_train = log_btc.iloc[train_idx]
+
+    if search_engine == "closed_form":
+        from src.optimizers.closed_form import ClosedFormOptimizer
+        found = ClosedFormOptimizer().optimize(z_train, btc_train, var_names)
+    else:
+        from src.optimizers.grid_search import GridSearchOptimizer
+        found = GridSearchOptimizer(
+            engine=search_engine, workers=1, progress=False,
+        ).optimize(z_train, btc_train, var_names)
+
+    if not found["weights"]:
+        return None
+
+    weights = found["weights"]
+    lag = int(found["optimal_lag"])
+    w_array = np.array([weights.get(v, 0.0) for v in var_names])
+    test_start, test_end = test_idx.start, test_idx.stop
+
+    window_eval = WalkForwardValidator._window_loop(
+        raw_matrix, log_btc, w_array, lag, var_names,
+        train_idx, test_idx, test_start, test_end,
+    )
+    if window_eval is None:
+        return None
+    r, p_val, n_test = window_eval
+
+    return {
+        "window": i + 1,
+        "train_range": f"{train_idx.start}-{train_idx.stop - 1}",
+        "test_range": f"{test_start}-{test_end - 1}",
+        "n_test": int(n_test),
+        "correlation": round(float(r), 4),
+        "p_value": round(float(p_val), 4),
+        "weights": weights,
+        "lag": lag,
+        "train_correlation": round(float(found["correlation"]), 4),
+        "elapsed_sec": round(time.perf_counter() - t0, 3),
+    }
+
+
 class WalkForwardValidator:
     """
     Walk-Forward OOS 검증.
     expanding window (60m train) + rolling test (6m).
+
+    engine:
+      - "loop": window마다 z-score 재계산 + pearsonr
+      - "moments": LagSufficientStats prefix sum으로 train 파라미터·test corr 조회
+
+    reoptimize=True (nested walk-forward):
+      전체 표본에서 고른 가중치/lag 대신 window마다 train 구간에서 재탐색
+      (reoptimize_engine: "moments"/"batch" Grid Search 또는 "closed_form")
+      → 가중치 선택의 look-ahead가 없는 OOS corr. window는 병렬 실행.
+
+    validate_candidates: 후보 K개 × window를 한 번에 평가 → (K × windows) OOS corr
     """
 
     def __init__(
@@ -21,19 +95,26 @@ class WalkForwardValidator:
         initial_train: int | None = None,
         test_window: int | None = None,
         expanding: bool = True,
+        engine: str | None = None,
+        reoptimize_engine: str | None = None,
+        workers: int | None = None,
     ):
         cfg = WALK_FORWARD
         self.initial_train = initial_train or cfg["initial_train"]
         self.test_window = test_window or cfg["test_window"]
         self.expanding = expanding
+        self.engine = engine or cfg.get("engine", "loop")
+        self.reoptimize_engine = reoptimize_engine or cfg.get("reoptimize_engine", "moments")
+        self.workers = max(1, workers or cfg.get("workers", 1))
 
     def validate(
         self,
         raw_matrix: pd.DataFrame,
         log_btc: pd.Series,
-        weights: dict,
-        lag: int,
+        weights: dict | None = None,
+        lag: int | None = None,
         variable_names: list[str] | None = None,
+        reoptimize: bool = False,
     ) -> dict:
         """
         Walk-Forward OOS 검증.
@@ -41,9 +122,10 @@ class WalkForwardValidator:
         Args:
             raw_matrix: detrended (z-score 전) 변수 DataFrame
             log_btc: log₁₀(BTC) 월간
-            weights: 최적 가중치
-            lag: 최적 lag
+            weights: 최적 가중치 (reoptimize=True면 무시)
+            lag: 최적 lag (reoptimize=True면 무시)
             variable_names: 변수명 리스트
+            reoptimize: window별 train 구간에서 가중치/lag 재탐색
 
         Returns: {
             "n_windows": 8,
@@ -62,76 +144,52 @@ class WalkForwardValidator:
         if len(windows) < 3:
             logger.warning(f"Only {len(windows)} windows available (min 3 recommended)")
 
+        if reoptimize:
+            return self._validate_reoptimize(raw_matrix, log_btc, var_names, windows)
+        if weights is None or lag is None:
+            raise ValueError("weights and lag are required unless reoptimize=True")
+
         w_array = np.array([weights.get(v, 0.0) for v in var_names])
         oos_results = []
 
+        stats = None
+        if self.engine == "moments" and all(v in raw_matrix.columns for v in var_names):
+            stats = self.build_stats(raw_matrix, log_btc, [lag], var_names)
+
         for i, (train_idx, test_idx) in enumerate(windows):
-            train_data = raw_matrix.iloc[train_idx]
-            test_data = raw_matrix.iloc[test_idx]
-
-            # Train에서 z-score 파라미터 계산
-            z_params = {}
-            for var in var_names:
-                if var in train_data.columns:
-                    z_params[var] = compute_zscore_params(train_data[var])
-
-            # Test 데이터를 train 파라미터로 z-score 변환
-            Z_test = np.zeros((len(test_data), len(var_names)))
-            for j, var in enumerate(var_names):
-                if var in test_data.columns and var in z_params:
-                    p = z_params[var]
-                    Z_test[:, j] = zscore(
-                        test_data[var], mean=p["mean"], std=p["std"]
-                    ).values
-                else:
-                    Z_test[:, j] = 0.0
-
-            # Score
-            score = Z_test @ w_array
-
-            # Target (lag 적용)
             test_start = test_idx.start if hasattr(test_idx, 'start') else test_idx[0]
             test_end = test_idx.stop if hasattr(test_idx, 'stop') else test_idx[-1] + 1
 
-            target_start = test_start + lag
-            target_end = test_end + lag
-
-            if target_end > total:
-                # 데이터 부족 시 가능한 만큼만
-                target_end = total
-                usable = target_end - target_start
-                if usable < 3:
-                    continue
-                score = score[:usable]
-
-            target_slice = log_btc.iloc[target_start:target_end].values
-
-            if len(score) != len(target_slice):
-                min_len = min(len(score), len(target_slice))
-                score = score[:min_len]
-                target_slice = target_slice[:min_len]
-
-            # NaN 제거
-            valid = ~np.isnan(score) & ~np.isnan(target_slice)
-            if valid.sum() < 3:
+            window_eval = None
+            if stats is not None:
+                window_eval = self._window_moments(
+                    stats, w_array, lag, train_idx, test_start, test_end,
+                )
+            if window_eval is None:
+                window_eval = self._window_loop(
+                    raw_matrix, log_btc, w_array, lag, var_names,
+                    train_idx, test_idx, test_start, test_end,
+                )
+            if window_eval is None:
                 continue
 
-            try:
-                r, p_val = pearsonr(score[valid], target_slice[valid])
-            except Exception:
-                continue
+            r, p_val, n_test = window_eval
 
             window_result = {
                 "window": i + 1,
                 "train_range": f"{train_idx.start}-{train_idx.stop - 1}",
                 "test_range": f"{test_start}-{test_end - 1}",
-                "n_test": int(valid.sum()),
+                "n_test": int(n_test),
                 "correlation": round(float(r), 4),
                 "p_value": round(float(p_val), 4),
             }
             oos_results.append(window_result)
 
-        # 집계
+        return self._aggregate(oos_results)
+
+    @staticmethod
+    def _aggregate(oos_results: list[dict]) -> dict:
+        """window 결과 → 요약"""
         if not oos_results:
             logger.warning("Walk-Forward produced no valid results")
             return {
@@ -162,6 +220,295 @@ class WalkForwardValidator:
 
         return result
 
+    def _validate_reoptimize(
+        self,
+        raw_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        var_names: list[str],
+        windows: list[tuple[range, range]],
+    ) -> dict:
+        """
+        Nested walk-forward: window별 재탐색 → OOS 평가.
+
+        Returns: validate() 결과 + {
+            "reoptimized": True,
+            "lag_stability": {"lags": [...], "counts": {...}, "modal_lag", "modal_share", "std"},
+            "weight_stability": {var: {"mean", "std", "min", "max"}},
+            "elapsed_sec": 3.2,
+        }
+        windows[i]에는 "weights", "lag", "train_correlation", "elapsed_sec" 추가.
+        """
+        t0 = time.perf_counter()
+        tasks = [
+            (i, raw_matrix, log_btc, var_names, train_idx, test_idx, self.reoptimize_engine)
+            for i, (train_idx, test_idx) in enumerate(windows)
+        ]
+
+        workers = min(self.workers, len(tasks))
+        logger.info(
+            f"Walk-Forward re-optimization: {len(tasks)} windows, "
+            f"engine={self.reoptimize_engine}, workers={workers}"
+        )
+
+        if workers > 1:
+            method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+            with mp.get_context(method).Pool(workers) as pool:
+                window_results = pool.map(_reoptimize_window, tasks)
+        else:
+            window_results = [_reoptimize_window(t) for t in tasks]
+
+        oos_results = [r for r in window_results if r is not None]
+        result = self._aggregate(oos_results)
+        result["reoptimized"] = True
+        result["elapsed_sec"] = round(time.perf_counter() - t0, 3)
+
+        if oos_results:
+            result["lag_stability"] = self._lag_stability([r["lag"] for r in oos_results])
+            result["weight_stability"] = {
+                var: {
+                    "mean": round(float(np.mean(vals)), 4),
+                    "std": round(float(np.std(vals)), 4),
+                    "min": float(np.min(vals)),
+                    "max": float(np.max(vals)),
+                }
+                for var in var_names
+                for vals in [[r["weights"].get(var, 0.0) for r in oos_results]]
+            }
+            logger.info(
+                f"Re-optimized lags: {result['lag_stability']['lags']} "
+                f"(modal={result['lag_stability']['modal_lag']}m, "
+                f"share={result['lag_stability']['modal_share']:.0%}), "
+                f"runtime={result['elapsed_sec']:.1f}s"
+            )
+
+        return result
+
+    @staticmethod
+    def _lag_stability(lags: list[int]) -> dict:
+        """window별 선택 lag 분포"""
+        counts = {}
+        for lag in lags:
+            counts[lag] = counts.get(lag, 0) + 1
+        modal = max(counts, key=lambda k: (counts[k], -k))
+        return {
+            "lags": lags,
+            "counts": dict(sorted(counts.items())),
+            "modal_lag": modal,
+            "modal_share": round(counts[modal] / len(lags), 4),
+            "std": round(float(np.std(lags)), 4),
+        }
+
+    def validate_candidates(
+        self,
+        raw_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        candidates: list[dict],
+        variable_names: list[str] | None = None,
+    ) -> dict:
+        """
+        다수 후보 (예: Grid Search top_50)를 모든 window에서 한 번에 OOS 평가.
+
+        window마다 train z-score 파라미터는 prefix sum (expanding mean/std)에서
+        조회하고, test 구간 score는 (T_test × p) · (p × K) 한 번으로 계산.
+        후보별 결과는 validate(weights, lag)의 window corr과 동일.
+
+        Args:
+            candidates: [{"weights": {...}, "lag": 5}, ...] (top_50 형식)
+
+        Returns: {
+            "oos_matrix": (K × n_windows) ndarray — 무효 window는 NaN,
+            "windows": [{"window", "train_range", "test_range"}],
+            "mean_oos_corr": [...],   # 후보별 (NaN 제외)
+            "std_oos_corr": [...],
+            "all_positive": [...],
+            "ranking": [...],         # mean OOS corr 내림차순 후보 인덱스
+        }
+        """
+        var_names = variable_names or VARIABLE_ORDER
+        total = len(raw_matrix)
+        windows = self._split_windows(total)
+
+        X = raw_matrix.reindex(columns=var_names).values.astype(float)
+        target = log_btc.values.astype(float)
+        W = np.array([[c["weights"].get(v, 0.0) for v in var_names] for c in candidates]).T
+        lags = np.array([int(c["lag"]) for c in candidates])
+
+        stats = self.build_stats(raw_matrix.reindex(columns=var_names), log_btc,
+                                 [int(lags.min())], var_names)
+        oos = np.full((len(candidates), len(windows)), np.nan)
+
+        for i, (train_idx, test_idx) in enumerate(windows):
+            params = stats.column_moments(train_idx.start, train_idx.stop)
+            # zscore(): σ가 0/NaN이면 열 전체 0
+            ok = np.isfinite(params["std"]) & (params["std"] != 0)
+            with np.errstate(invalid="ignore"):
+                Z_test = (X[test_idx.start:test_idx.stop] - params["mean"]) / params["std"]
+            Z_test[:, ~ok] = 0.0
+
+            scores = Z_test @ W   # (T_test × K), NaN 변수가 있는 행은 NaN
+
+            for lag in np.unique(lags):
+                cols = np.flatnonzero(lags == lag)
+                t = target[test_idx.start + lag:min(test_idx.stop + lag, total)]
+                if len(t) < 3:
+                    continue
+                oos[cols, i] = self._columnwise_corr(scores[:len(t), cols], t)
+
+        with np.errstate(invalid="ignore"):
+            mean = np.array([np.nanmean(r) if np.isfinite(r).any() else np.nan for r in oos])
+            std = np.array([np.nanstd(r) if np.isfinite(r).any() else np.nan for r in oos])
+        all_pos = [bool(np.isfinite(r).any() and np.all(r[np.isfinite(r)] > 0)) for r in oos]
+        ranking = np.argsort(-np.where(np.isnan(mean), -np.inf, mean), kind="stable")
+
+        if len(candidates):
+            logger.info(
+                f"Walk-Forward candidates: {len(candidates)} × {len(windows)} windows, "
+                f"best mean OOS corr={mean[ranking[0]]:.4f} (candidate {ranking[0]})"
+            )
+
+        return {
+            "oos_matrix": oos,
+            "windows": [
+                {
+                    "window": i + 1,
+                    "train_range": f"{tr.start}-{tr.stop - 1}",
+                    "test_range": f"{te.start}-{te.stop - 1}",
+                }
+                for i, (tr, te) in enumerate(windows)
+            ],
+            "mean_oos_corr": [round(float(m), 4) for m in mean],
+            "std_oos_corr": [round(float(s), 4) for s in std],
+            "all_positive": all_pos,
+            "ranking": [int(k) for k in ranking],
+        }
+
+    @staticmethod
+    def _columnwise_corr(S: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """(n × K) score 각 열과 target의 Pearson r (NaN 행 제외, 최소 3 포인트)"""
+        valid = ~np.isnan(S).any(axis=1) & ~np.isnan(t)
+        if valid.sum() < 3:
+            return np.full(S.shape[1], np.nan)
+        s = S[valid] - S[valid].mean(axis=0)
+        tc = t[valid] - t[valid].mean()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = (tc @ s) / np.sqrt((s * s).sum(axis=0) * (tc @ tc))
+        return np.clip(r, -1.0, 1.0)
+
+    @staticmethod
+    def build_stats(
+        raw_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        lags: list[int] | range,
+        variable_names: list[str] | None = None,
+    ) -> LagSufficientStats:
+        """
+        Walk-Forward용 충분통계량 (NaN 행 제외, 최소 3 포인트).
+        Grid Search와 같은 LagSufficientStats를 raw 변수 기준으로 구성.
+        """
+        var_names = variable_names or VARIABLE_ORDER
+        lag_range = range(min(lags), max(lags) + 1)
+        return LagSufficientStats(
+            raw_matrix[var_names].values, log_btc.values, lag_range,
+            nan_policy="drop", min_obs=3,
+        )
+
+    @staticmethod
+    def _window_moments(
+        stats: LagSufficientStats,
+        w_array: np.ndarray,
+        lag: int,
+        train_idx: range,
+        test_start: int,
+        test_end: int,
+    ) -> tuple[float, float, int] | None:
+        """
+        충분통계량으로 window OOS corr 계산.
+
+        test score = Σ w_j (x_j - μ_j) / σ_j 는 raw 변수의 affine 변환이므로
+        corr(score, target) = corr(X · (w / σ_train), target).
+        σ가 0/NaN인 변수가 있으면 None (loop 경로로 위임).
+        """
+        params = stats.column_moments(train_idx.start, train_idx.stop)
+        std = params["std"]
+        if np.any(~np.isfinite(std) | (std == 0)):
+            return None
+
+        corr = stats.correlations(w_array / std, test_start, test_end)
+        r = corr[0, stats.lags.index(lag)]
+        if np.isnan(r):
+            return None
+
+        n = stats.n_obs(lag, test_start, test_end)
+        return float(r), stats.p_value(r, n), n
+
+    @staticmethod
+    def _window_loop(
+        raw_matrix: pd.DataFrame,
+        log_btc: pd.Series,
+        w_array: np.ndarray,
+        lag: int,
+        var_names: list[str],
+        train_idx: range,
+        test_idx: range,
+        test_start: int,
+        test_end: int,
+    ) -> tuple[float, float, int] | None:
+        """window별 z-score 재계산 + pearsonr (기본 경로)"""
+        total = len(raw_matrix)
+        train_data = raw_matrix.iloc[train_idx]
+        test_data = raw_matrix.iloc[test_idx]
+
+        # Train에서 z-score 파라미터 계산
+        z_params = {}
+        for var in var_names:
+            if var in train_data.columns:
+                z_params[var] = compute_zscore_params(train_data[var])
+
+        # Test 데이터를 train 파라미터로 z-score 변환
+        Z_test = np.zeros((len(test_data), len(var_names)))
+        for j, var in enumerate(var_names):
+            if var in test_data.columns and var in z_params:
+                p = z_params[var]
+                Z_test[:, j] = zscore(
+                    test_data[var], mean=p["mean"], std=p["std"]
+                ).values
+            else:
+                Z_test[:, j] = 0.0
+
+        # Score
+        score = Z_test @ w_array
+
+        # Target (lag 적용)
+        target_start = test_start + lag
+        target_end = test_end + lag
+
+        if target_end > total:
+            # 데이터 부족 시 가능한 만큼만
+            target_end = total
+            usable = target_end - target_start
+            if usable < 3:
+                return None
+            score = score[:usable]
+
+        target_slice = log_btc.iloc[target_start:target_end].values
+
+        if len(score) != len(target_slice):
+            min_len = min(len(score), len(target_slice))
+            score = score[:min_len]
+            target_slice = target_slice[:min_len]
+
+        # NaN 제거
+        valid = ~np.isnan(score) & ~np.isnan(target_slice)
+        if valid.sum() < 3:
+            return None
+
+        try:
+            r, p_val = pearsonr(score[valid], target_slice[valid])
+        except Exception:
+            return None
+
+        return float(r), float(p_val), int(valid.sum())
+
     def _split_windows(self, total_months: int) -> list[tuple[range, range]]:
         """(train_indices, test_indices) 리스트 생성"""
         windows = []
@@ -1,24 +1,38 @@
 """주간 파이프라인 오케스트레이터"""
+import json
+import os
+import pickle
+import sys
 import numpy as np
 import pandas as pd
 from datetime import datetime
 
-from config.settings import DATA_START, DATA_END, FRED_API_KEY
-from config.constants import VARIABLE_ORDER, SIGNAL_THRESHOLDS
+from config.settings import (
+    DATA_START, DATA_END, FRED_API_KEY, CACHE_EXPIRY_HOURS, UPDATE_STATE_PATH,
+)
+from config.constants import (
+    FRED_SERIES, VARIABLE_ORDER, SIGNAL_THRESHOLDS, STAGE_CACHE, UPDATE_CONFIG,
+    SOFR_THRESHOLD_BPS, MA_WINDOW_MONTHS, ORTHO_CORR_THRESHOLD,
+)
 from src.fetchers.fred_fetcher import FredFetcher
 from src.fetchers.treasury_fetcher import TreasuryFetcher
 from src.fetchers.market_fetcher import MarketFetcher
 from src.fetchers.fallback_fetcher import FallbackFetcher
+from src.fetchers.raw_store import RawDataStore
+from src.fetchers.scheduler import FetchScheduler
 from src.calculators.net_liquidity import NetLiquidityCalculator
 from src.calculators.global_m2 import GlobalM2Calculator
 from src.calculators.sofr_binary import SofrBinaryCalculator
 from src.calculators.hy_spread import HySpreadCalculator
 from src.calculators.cme_basis import CmeBasisCalculator
 from src.calculators.detrend import zscore, compute_zscore_params
-from src.optimizers.orthogonalize import check_and_orthogonalize
+from src.calculators import detrend as detrend_module
+from src.optimizers.orthogonalize import apply_orthogonalization, check_and_orthogonalize
+from src.optimizers import orthogonalize as orthogonalize_module
 from src.optimizers.grid_search import GridSearchOptimizer
 from src.optimizers.walk_forward import WalkForwardValidator
 from src.pipeline.storage import StorageManager
+from src.pipeline.stage_cache import StageCache
 from src.utils.logger import setup_logger
 
 logger = setup_logger("pipeline")
@@ -28,14 +42,24 @@ class PipelineRunner:
     """
     모드:
       - "full": 전체 백테스트 (fetch + calc + optimize)
-      - "update": 최신 데이터만 추가 (주간 실행용)
+      - "update": 최신 데이터만 추가 (주간 실행용) — 이전 실행 상태에
+                  최근 월만 재계산해 이어 붙이고, 저장된 zscore_params 고정 적용
       - "score_only": 저장된 가중치로 현재 Score만 계산
     """
 
-    def __init__(self, mode: str = "full"):
+    def __init__(
+        self,
+        mode: str = "full",
+        workers: int | None = None,
+        use_stage_cache: bool = STAGE_CACHE["enabled"],
+    ):
         self.mode = mode
+        self.workers = workers  # Grid Search 병렬 프로세스 수 (None = 설정값)
         self.storage = StorageManager()
         self.storage.init_db()
+        # Step 1~4 출력 캐시 (입력 내용이 같으면 로드만)
+        self.stage_cache = StageCache() if use_stage_cache else None
+        self.fetch_stats: dict = {}  # 마지막 _fetch_all의 source별 지연
 
     def run(
         self,
@@ -50,21 +74,16 @@ class PipelineRunner:
         logger.info(f"═══ Pipeline Start (mode={self.mode}) ═══")
         logger.info(f"Period: {start} ~ {end}")
 
-        # Step 1: Fetch
-        logger.info("── Step 1: Fetching data ──")
-        raw_data = self._fetch_all(start, end, use_cache)
-
-        # Step 2: Calculate
-        logger.info("── Step 2: Calculating variables ──")
-        variables, log_btc = self._calculate_all(raw_data)
-
-        # Step 3: Orthogonalize
-        logger.info("── Step 3: Orthogonalization check ──")
-        ortho_vars, ortho_log = self._orthogonalize(variables)
-
-        # Step 4: Z-score
-        logger.info("── Step 4: Z-score standardization ──")
-        z_matrix, z_params = self._zscore_all(ortho_vars)
+        processed = None
+        frozen_z = None
+        if self.mode == "update":
+            opt = self.storage.load_latest_optimization()
+            frozen_z = (opt or {}).get("zscore_params")
+            logger.info("── Steps 1-4: Incremental update ──")
+            processed = self._incremental_update(start, end, use_cache, frozen_z)
+        if processed is None:
+            processed = self._process_all(start, end, use_cache, frozen_z)
+        variables, log_btc, ortho_vars, ortho_log, z_matrix, z_params = processed
 
         if self.mode == "full":
             # Step 5: Optimize
@@ -112,6 +131,10 @@ class PipelineRunner:
 
         # Save processed data
         self._save_processed(variables, ortho_vars, z_matrix, log_btc)
+        if self.mode in ("full", "update"):
+            self._save_update_state(
+                start, variables, log_btc, ortho_vars, ortho_log, z_matrix, z_params,
+            )
 
         logger.info(f"═══ Pipeline Complete ═══")
         logger.info(f"Score: {score_result['score']:.4f} → {score_result['signal']}")
@@ -119,28 +142,297 @@ class PipelineRunner:
 
         return score_result
 
+    def _process_all(
+        self,
+        start: str,
+        end: str,
+        use_cache: bool,
+        frozen_z: dict | None = None,
+    ) -> tuple:
+        """
+        Steps 1-4 전체 이력 처리.
+
+        frozen_z가 있으면 (update 모드) z-score는 저장된 파라미터로 변환.
+        """
+        # Step 1: Fetch
+        logger.info("── Step 1: Fetching data ──")
+        raw_data = self._fetch_stage(start, end, use_cache)
+
+        # Step 2: Calculate
+        logger.info("── Step 2: Calculating variables ──")
+        variables, log_btc = self._stage(
+            "variables", (raw_data, SOFR_THRESHOLD_BPS, MA_WINDOW_MONTHS),
+            self._calc_modules(), lambda: self._calculate_all(raw_data),
+        )
+
+        # Step 3: Orthogonalize
+        logger.info("── Step 3: Orthogonalization check ──")
+        ortho_vars, ortho_log = self._stage(
+            "ortho_vars", (variables, ORTHO_CORR_THRESHOLD, VARIABLE_ORDER),
+            (orthogonalize_module,), lambda: self._orthogonalize(variables),
+        )
+
+        # Step 4: Z-score
+        logger.info("── Step 4: Z-score standardization ──")
+        if frozen_z:
+            z_matrix, z_params = self._zscore_all(ortho_vars, frozen_z)
+        else:
+            z_matrix, z_params = self._stage(
+                "z_matrix", (ortho_vars, VARIABLE_ORDER),
+                (detrend_module,), lambda: self._zscore_all(ortho_vars),
+            )
+        return variables, log_btc, ortho_vars, ortho_log, z_matrix, z_params
+
+    def _incremental_update(
+        self,
+        start: str,
+        end: str,
+        use_cache: bool,
+        frozen_z: dict | None,
+    ) -> tuple | None:
+        """
+        Steps 1-4 증분 처리 — 이전 상태 + 마지막 recompute_months개월만 재계산.
+
+        재계산 월의 12m MA / diff / carry-forward에 필요한 raw 꼬리
+        (MA_WINDOW_MONTHS + lookback_margin_months)만 계산기에 넣고,
+        직교화는 저장된 β·α, z-score는 저장된 zscore_params로 변환.
+        상태가 없거나 코드·상수·파라미터가 바뀌었으면 None (전체 처리).
+        """
+        state = self._load_update_state()
+        if state is None:
+            logger.info("No incremental state — processing full history")
+            return None
+        if state["start"] != start or state["digest"] != self._update_digest():
+            logger.info("Incremental state outdated (period/code/constants changed) "
+                        "— processing full history")
+            return None
+        if frozen_z is not None and self._params_key(frozen_z) != self._params_key(state["z_params"]):
+            logger.info("zscore_params changed since last run — processing full history")
+            return None
+
+        prev_vars = state["variables"]
+        last = prev_vars["date"].max()
+        recompute_from = last - pd.offsets.MonthEnd(UPDATE_CONFIG["recompute_months"] - 1)
+        tail_start = (
+            recompute_from
+            - pd.offsets.MonthEnd(MA_WINDOW_MONTHS + UPDATE_CONFIG["lookback_margin_months"])
+            + pd.Timedelta(days=1)
+        )
+
+        # Step 1: 만료된 시리즈만 증분 수집 → 꼬리 구간만 저장소에서 읽어 계산
+        new_vars, new_btc = self._calculate_all(
+            self._fetch_tail(start, end, tail_start, use_cache))
+        if list(new_vars.columns) != list(prev_vars.columns):
+            logger.info("Variable columns changed — processing full history")
+            return None
+        recent = (new_vars["date"] >= recompute_from).to_numpy()
+        new_vars = new_vars.loc[recent].reset_index(drop=True)
+        new_btc = new_btc.loc[recent].reset_index(drop=True)
+
+        # Step 3-4: 고정 파라미터로 새 행만 변환
+        new_ortho, _ = self._orthogonalize(new_vars, logs=state["ortho_log"])
+        new_z, _ = self._zscore_all(new_ortho, state["z_params"])
+
+        keep = (prev_vars["date"] < recompute_from).to_numpy()
+
+        def splice(old: pd.DataFrame | pd.Series, new):
+            return pd.concat([old.loc[keep], new], ignore_index=True)
+
+        variables = splice(prev_vars, new_vars)
+        log_btc = splice(state["log_btc"].reset_index(drop=True), new_btc)
+        ortho_vars = splice(state["ortho_vars"], new_ortho)
+        z_matrix = splice(state["z_matrix"], new_z)
+
+        logger.info(f"Incremental update: {len(new_vars)} months recomputed "
+                    f"(from {recompute_from:%Y-%m}), {int(keep.sum())} months kept")
+        return (variables, log_btc, ortho_vars, state["ortho_log"],
+                z_matrix, state["z_params"])
+
+    @staticmethod
+    def _params_key(params: dict) -> str:
+        # NaN ≠ NaN이므로 JSON 문자열로 비교 (저장된 optimization 결과와 같은 표현)
+        return json.dumps(params, sort_keys=True, default=float)
+
+    def _fetch_tail(
+        self,
+        start: str,
+        end: str,
+        tail_start: pd.Timestamp,
+        use_cache: bool,
+    ) -> dict:
+        """
+        update 모드 Step 1: raw 저장소 갱신 후 tail_start ~ end 구간만 조회.
+
+        저장소가 모두 만료 전이면 수집 없이, 아니면 전체 구간으로 수집
+        (fetcher 내부 증분 병합)한 뒤 — fetcher 캐시 hit는 RawDataStore
+        기간 조회라 꼬리만 읽음. 수집 후에도 만료된 시리즈가 남으면
+        (수집 실패) 전체 결과를 잘라 사용.
+        """
+        store = RawDataStore()
+        raw_data = None
+        if not use_cache or store.signature(CACHE_EXPIRY_HOURS) is None:
+            raw_data = self._fetch_stage(start, end, use_cache)
+            if store.signature(CACHE_EXPIRY_HOURS) is None:
+                return self._slice_raw(raw_data, tail_start)
+        return self._fetch_all(tail_start.strftime("%Y-%m-%d"), end, use_cache=True)
+
+    @staticmethod
+    def _slice_raw(raw, since: pd.Timestamp):
+        """raw_data (중첩 dict 포함)의 각 DataFrame을 date >= since로 자름"""
+        if isinstance(raw, dict):
+            return {k: PipelineRunner._slice_raw(v, since) for k, v in raw.items()}
+        if isinstance(raw, pd.DataFrame) and "date" in raw.columns and len(raw):
+            dates = raw["date"]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates)
+            return raw.loc[dates >= since].reset_index(drop=True)
+        return raw
+
+    def _update_digest(self) -> str:
+        """증분 상태 유효성 키 — Step 2-4 코드 + 관련 상수"""
+        code = StageCache.source_digest(
+            sys.modules[__name__], *self._calc_modules(), orthogonalize_module,
+        )
+        return StageCache.key(
+            "update_state", code, SOFR_THRESHOLD_BPS, MA_WINDOW_MONTHS,
+            ORTHO_CORR_THRESHOLD, VARIABLE_ORDER, UPDATE_CONFIG,
+        )
+
+    def _load_update_state(self) -> dict | None:
+        if not UPDATE_STATE_PATH.exists():
+            return None
+        try:
+            with open(UPDATE_STATE_PATH, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Incremental state unreadable: {e}")
+            return None
+
+    def _save_update_state(
+        self, start, variables, log_btc, ortho_vars, ortho_log, z_matrix, z_params,
+    ) -> None:
+        """다음 update 실행용 처리 상태 저장 (원자적: 임시 파일 → rename)"""
+        state = {
+            "start": start,
+            "digest": self._update_digest(),
+            "variables": variables,
+            "log_btc": log_btc,
+            "ortho_vars": ortho_vars,
+            "ortho_log": ortho_log,
+            "z_matrix": z_matrix,
+            "z_params": z_params,
+            "saved_at": datetime.now().isoformat(),
+        }
+        try:
+            tmp = UPDATE_STATE_PATH.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, UPDATE_STATE_PATH)
+        except Exception as e:
+            logger.warning(f"Failed to save incremental state: {e}")
+
+    def _stage(self, name: str, inputs: tuple, modules: tuple, compute):
+        """
+        스테이지 캐시 경유 실행 — 키 = 입력 내용 + 상수 + 스테이지 코드
+        (runner 포함) 해시. 캐시 비활성이면 compute() 그대로.
+        """
+        if self.stage_cache is None:
+            return compute()
+        code = StageCache.source_digest(sys.modules[__name__], *modules)
+        key = StageCache.key(name, code, *inputs)
+        return self.stage_cache.cached(name, key, compute)
+
+    def _fetch_stage(self, start: str, end: str, use_cache: bool) -> dict:
+        """
+        Step 1 + 캐시: raw 시리즈가 모두 만료 전이고 마지막 실행 이후 그대로면
+        fetcher를 만들지 않고 저장된 raw_data 로드.
+
+        use_cache=False (--no-cache)면 항상 재수집, 결과는 새 키로 저장.
+        """
+        if self.stage_cache is None:
+            return self._fetch_all(start, end, use_cache)
+
+        store = RawDataStore()
+        sig = store.signature(CACHE_EXPIRY_HOURS) if use_cache else None
+        if sig is not None:
+            raw = self.stage_cache.get("raw_data", StageCache.key("raw_data", start, end, sig))
+            if raw is not None:
+                logger.info("[Stage Cache Hit] raw_data (raw store unchanged)")
+                return raw
+
+        raw = self._fetch_all(start, end, use_cache)
+        # fetch 후 저장소 상태로 키 생성 → 다음 실행에서 히트
+        sig = store.signature(CACHE_EXPIRY_HOURS)
+        if sig is not None:
+            self.stage_cache.put("raw_data", StageCache.key("raw_data", start, end, sig), raw)
+        return raw
+
+    @staticmethod
+    def _calc_modules() -> tuple:
+        """Step 2 계산 로직 모듈 (코드 해시용)"""
+        return tuple(
+            sys.modules[c.__module__] for c in (
+                NetLiquidityCalculator, GlobalM2Calculator, SofrBinaryCalculator,
+                HySpreadCalculator, CmeBasisCalculator,
+            )
+        ) + (detrend_module, sys.modules["src.utils.date_utils"])
+
     def _fetch_all(self, start: str, end: str, use_cache: bool) -> dict:
-        """모든 데이터 소스에서 수집"""
+        """
+        모든 데이터 소스에서 수집 — FetchScheduler로 동시 실행.
+
+        FRED 시리즈별 / TGA / Yahoo 티커를 thread pool에 제출
+        (source별 token bucket, 동일 티커 요청은 MarketFetcher에서 1회).
+        source별 지연은 self.fetch_stats에 기록.
+        """
         data = {}
 
-        # FRED
         fred = FredFetcher()
-        fred_data = fred.fetch_all_fred_series(start, end, use_cache=use_cache)
-        data["fred"] = fred_data
-
-        # Treasury TGA
         treasury = TreasuryFetcher()
-        data["tga"] = treasury.fetch_tga(start, end, use_cache=use_cache)
-
-        # Market
         market = MarketFetcher()
-        data["dxy"] = market.fetch_dxy(start, end, use_cache=use_cache)
-        data["btc_spot"] = market.fetch_btc_spot(start, end, use_cache=use_cache)
-        data["cme_futures_monthly"] = market.fetch_cme_futures(start, end, use_cache=use_cache)
 
-        # CME Basis 일간 데이터
-        data["btc_daily"] = market.fetch_btc_daily(start, end, use_cache=use_cache)
-        data["cme_daily"] = market.fetch_cme_daily(start, end, use_cache=use_cache)
+        with FetchScheduler() as pool:
+            # FRED
+            fred_futures = {
+                name: pool.submit(
+                    "fred", series_id, fred.fetch_series,
+                    series_id, start, end, use_cache=use_cache,
+                )
+                for name, series_id in FRED_SERIES.items()
+            }
+
+            # Treasury TGA
+            tga_future = pool.submit(
+                "treasury", "tga", treasury.fetch_tga, start, end, use_cache=use_cache)
+
+            # Market (CME Basis 일간 데이터 포함)
+            market_futures = {
+                key: pool.submit("yahoo", key, fn, start, end, use_cache=use_cache)
+                for key, fn in (
+                    ("dxy", market.fetch_dxy),
+                    ("btc_spot", market.fetch_btc_spot),
+                    ("cme_futures_monthly", market.fetch_cme_futures),
+                    ("btc_daily", market.fetch_btc_daily),
+                    ("cme_daily", market.fetch_cme_daily),
+                )
+            }
+
+            fred_data = {}
+            for name, future in fred_futures.items():
+                try:
+                    fred_data[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Skipping {name} ({FRED_SERIES[name]}): {e}")
+                    fred_data[name] = pd.DataFrame(columns=["date", "value"])
+            data["fred"] = fred_data
+            logger.info(f"Fetched {len(fred_data)} FRED series "
+                        f"({sum(len(v) for v in fred_data.values())} total rows)")
+
+            data["tga"] = tga_future.result()
+            for key, future in market_futures.items():
+                data[key] = future.result()
+
+        self.fetch_stats = pool.report()
 
         # BTC fallback (필요 시)
         if data["btc_spot"].empty:
@@ -225,8 +517,10 @@ class PipelineRunner:
                     f"columns: {list(variables.columns)}")
         return variables, log_btc
 
-    def _orthogonalize(self, variables: pd.DataFrame) -> tuple[pd.DataFrame, list]:
-        """직교화 체크 및 수행"""
+    def _orthogonalize(
+        self, variables: pd.DataFrame, logs: list | None = None,
+    ) -> tuple[pd.DataFrame, list]:
+        """직교화 체크 및 수행 (logs가 있으면 저장된 β·α 그대로 적용)"""
         var_series = {}
         for col in VARIABLE_ORDER:
             if col in variables.columns:
@@ -236,9 +530,12 @@ class PipelineRunner:
         if "GM2_level" in variables.columns and "GM2_resid" not in var_series:
             var_series["GM2_resid"] = variables["GM2_level"]
 
-        ortho_vars, ortho_log = check_and_orthogonalize(
-            var_series, protected=["NL_level"]
-        )
+        if logs is None:
+            ortho_vars, ortho_log = check_and_orthogonalize(
+                var_series, protected=["NL_level"]
+            )
+        else:
+            ortho_vars, ortho_log = apply_orthogonalization(var_series, logs), logs
 
         # DataFrame 재구성
         result = variables[["date"]].copy()
@@ -251,16 +548,19 @@ class PipelineRunner:
         return result, ortho_log
 
     def _zscore_all(
-        self, variables: pd.DataFrame,
+        self, variables: pd.DataFrame, frozen: dict | None = None,
     ) -> tuple[pd.DataFrame, dict]:
-        """모든 변수 z-score 변환"""
+        """모든 변수 z-score 변환 (frozen이 있으면 저장된 mean/std 사용)"""
         z_df = variables[["date"]].copy()
         z_params = {}
 
         for col in VARIABLE_ORDER:
             if col in variables.columns:
                 series = variables[col]
-                params = compute_zscore_params(series)
+                if frozen and col in frozen:
+                    params = frozen[col]
+                else:
+                    params = compute_zscore_params(series)
                 z_df[col] = zscore(series, mean=params["mean"], std=params["std"])
                 z_params[col] = params
 
@@ -268,7 +568,7 @@ class PipelineRunner:
 
     def _optimize(self, z_matrix: pd.DataFrame, log_btc: pd.Series) -> dict:
         """Grid Search 최적화"""
-        optimizer = GridSearchOptimizer()
+        optimizer = GridSearchOptimizer(workers=self.workers)
         return optimizer.optimize(z_matrix, log_btc)
 
     def _walk_forward(
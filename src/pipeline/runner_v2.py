@@ -14,7 +14,7 @@ import numpy as np
 import pandas as pd
 
 from config.constants import (
-    SUCCESS_CRITERIA, VARIABLE_ORDER_V2, XCORR_CONFIG,
+    INDEX_ARTIFACTS, SUCCESS_CRITERIA, VARIABLE_ORDER_V2, XCORR_CONFIG,
 )
 from config.settings import INDICES_DIR, VALIDATION_DIR
 
@@ -49,10 +49,19 @@ class PipelineRunnerV2:
         method: str = "pca",
         freq: str = "monthly",
         clip_map: dict | None = None,
+        workers: int | None = None,
+        use_artifacts: bool = INDEX_ARTIFACTS["enabled"],
     ):
         self.method = method
         self.freq = freq
         self.clip_map = clip_map if clip_map is not None else self.DEFAULT_CLIP
+        # Stage 3 CPCV split worker processes (None → CPCV_CONFIG)
+        self.workers = workers
+        # Stage 1: 같은 입력·clip_map이면 저장된 builder 로드 (재적합 생략)
+        self.artifacts = None
+        if use_artifacts:
+            from src.index_builders.artifact_store import ModelArtifactStore
+            self.artifacts = ModelArtifactStore()
 
     def _get_builder_class(self, method: str):
         """Lazy import of builder class."""
@@ -76,6 +85,7 @@ class PipelineRunnerV2:
         z_matrix: pd.DataFrame,
         method: str | None = None,
         daily_matrix: pd.DataFrame | None = None,
+        reuse_latest: bool = False,
     ) -> dict:
         """
         Stage 1: Build liquidity index (BTC-blind).
@@ -84,6 +94,8 @@ class PipelineRunnerV2:
             z_matrix: z-scored variable matrix (no BTC columns)
             method: override self.method if provided
             daily_matrix: daily frequency matrix for DFM (optional)
+            reuse_latest: 입력 지문이 같은 artifact가 없으면 재적합 대신
+                최신 artifact로 transform (score/update 경로 — 새 달 추가)
 
         Returns:
             dict with index, loadings, method info
@@ -92,42 +104,44 @@ class PipelineRunnerV2:
         logger.info("=== STAGE 1: Independent Index Construction (%s) ===",
                      method.upper())
 
-        # Variable-specific winsorize: NL±3, HY±2.5, GM2±2, CME±2
-        # NL dominant (structural liquidity) + HY responsive (credit risk)
-        if self.clip_map:
-            z_matrix = z_matrix.copy()
-            total_clipped = 0
-            for col, clip_val in self.clip_map.items():
-                if col in z_matrix.columns:
-                    n_clip = (z_matrix[col].abs() > clip_val).sum()
-                    if n_clip > 0:
-                        z_matrix[col] = z_matrix[col].clip(-clip_val, clip_val)
-                        total_clipped += n_clip
-                        logger.info(
-                            "  %s: clipped %d values at ±%.1fσ",
-                            col, n_clip, clip_val,
-                        )
-            if total_clipped > 0:
-                logger.info(
-                    "Winsorized %d total values (variable-specific)", total_clipped
-                )
+        # artifact 키: clip 전 입력 (DFM은 daily_matrix 우선)
+        fingerprint = None
+        if self.artifacts is not None:
+            fit_input = daily_matrix if method == "dfm" and daily_matrix is not None else z_matrix
+            fingerprint = self.artifacts.fingerprint(fit_input)
+
+        z_matrix = self._winsorize(z_matrix)
 
         # Fallback chain: method → PCA on failure
         fallback_used = False
         original_method = method
 
-        try:
-            result = self._build_index(z_matrix, method, daily_matrix)
-        except Exception as e:
-            if method in ("ica", "sparse", "dfm"):
-                logger.warning(
-                    "%s failed (%s), falling back to PCA", method.upper(), e
-                )
-                result = self._build_index(z_matrix, "pca")
-                fallback_used = True
-                method = "pca"
-            else:
-                raise
+        cached = latest = None
+        if self.artifacts is not None:
+            cached = self.artifacts.load(method, self.clip_map, fingerprint)
+            if cached is None and reuse_latest:
+                latest = self._latest_result(method, z_matrix, daily_matrix)
+
+        if latest is not None:
+            result = latest
+        elif cached is not None:
+            builder, meta = cached
+            result = self._result_from_artifact(
+                method, builder, meta, z_matrix, daily_matrix)
+        else:
+            try:
+                result, builder = self._build_index(z_matrix, method, daily_matrix)
+            except Exception as e:
+                if method in ("ica", "sparse", "dfm"):
+                    logger.warning(
+                        "%s failed (%s), falling back to PCA", method.upper(), e
+                    )
+                    result, builder = self._build_index(z_matrix, "pca")
+                    fallback_used = True
+                    method = "pca"
+                else:
+                    raise
+        raw_index = result.get("index")
 
         # Sign correction: ensure NEGATIVE correlation with HY spread
         # Economic logic: higher HY spread = risk-off = bearish for BTC
@@ -136,11 +150,12 @@ class PipelineRunnerV2:
             (c for c in z_matrix.columns if "HY" in c.upper()),
             None,
         )
-        if hy_col and hasattr(result.get("index", None), "index"):
+        # 최신 artifact transform은 저장된 부호를 이미 적용 (방향 고정)
+        if latest is None and hy_col and hasattr(result.get("index", None), "index"):
             BuilderClass = self._get_builder_class(method)
-            builder = BuilderClass()
-            if hasattr(builder, "sign_correction"):
-                result["index"] = builder.sign_correction(
+            corrector = BuilderClass()
+            if hasattr(corrector, "sign_correction"):
+                result["index"] = corrector.sign_correction(
                     result["index"],
                     z_matrix[hy_col].dropna(),
                     positive=False,  # enforce negative corr with HY
@@ -152,6 +167,15 @@ class PipelineRunnerV2:
             result["fallback_from"] = original_method
             result["fallback_reason"] = "builder failure"
 
+        if (self.artifacts is not None and cached is None and latest is None
+                and not fallback_used):
+            # 부호 보정 결과도 저장 → transform_latest()가 같은 방향 유지
+            sign = -1.0 if result.get("index") is not raw_index else 1.0
+            self.artifacts.save(
+                method, builder, self.clip_map, fingerprint,
+                summary=self._artifact_summary(result), sign=sign,
+            )
+
         # Save index
         self._save_result(INDICES_DIR, f"index_{method}", result)
 
@@ -162,13 +186,75 @@ class PipelineRunnerV2:
         )
         return result
 
+    def _winsorize(self, z_matrix: pd.DataFrame) -> pd.DataFrame:
+        """clip_map 변수별 winsorize (Stage 1 적합·transform 공통)"""
+        # Variable-specific winsorize: NL±3, HY±2.5, GM2±2, CME±2
+        # NL dominant (structural liquidity) + HY responsive (credit risk)
+        if self.clip_map:
+            z_matrix = z_matrix.copy()
+            total_clipped = 0
+            for col, clip_val in self.clip_map.items():
+                if col in z_matrix.columns:
+                    n_clip = (z_matrix[col].abs() > clip_val).sum()
+                    if n_clip > 0:
+                        z_matrix[col] = z_matrix[col].clip(-clip_val, clip_val)
+                        total_clipped += n_clip
+                        logger.info(
+                            "  %s: clipped %d values at ±%.1fσ",
+                            col, n_clip, clip_val,
+                        )
+            if total_clipped > 0:
+                logger.info(
+                    "Winsorized %d total values (variable-specific)", total_clipped
+                )
+        return z_matrix
+
+    def transform_latest(
+        self,
+        z_matrix: pd.DataFrame,
+        method: str | None = None,
+        daily_matrix: pd.DataFrame | None = None,
+    ) -> dict | None:
+        """
+        최신 artifact로 새 데이터 transform (재적합 없음, 저장된 부호 적용).
+
+        새 달이 추가되어 입력 지문이 바뀐 score/update 경로용
+        (run_stage1(reuse_latest=True)도 같은 경로). 같은 method·clip_map·
+        builder 지문의 artifact가 없으면 None.
+        """
+        method = method or self.method
+        if self.artifacts is None:
+            return None
+        return self._latest_result(method, self._winsorize(z_matrix), daily_matrix)
+
+    def _latest_result(
+        self,
+        method: str,
+        z_matrix: pd.DataFrame,
+        daily_matrix: pd.DataFrame | None = None,
+    ) -> dict | None:
+        """winsorize된 입력 → 최신 artifact의 build() 형태 결과 (없으면 None)"""
+        cached = self.artifacts.load(method, self.clip_map)
+        if cached is None:
+            return None
+        builder, meta = cached
+        result = self._result_from_artifact(
+            method, builder, meta, z_matrix, daily_matrix)
+        if "index" in result:
+            result["index"] = meta["sign"] * result["index"]
+        # 요약은 적합 시점 값 — 관측 수만 새 입력 기준
+        factor = result.get("index", result.get("daily_factor"))
+        if factor is not None:
+            result["n_observations"] = len(factor)
+        return result
+
     def _build_index(
         self,
         z_matrix: pd.DataFrame,
         method: str,
         daily_matrix: pd.DataFrame | None = None,
-    ) -> dict:
-        """Build index with the specified method."""
+    ) -> tuple[dict, object]:
+        """Build index with the specified method → (result, fitted builder)."""
         BuilderClass = self._get_builder_class(method)
         builder = BuilderClass()
 
@@ -182,6 +268,42 @@ class PipelineRunnerV2:
         else:
             result = builder.build(z_matrix)
 
+        return result, builder
+
+    @staticmethod
+    def _artifact_summary(result: dict) -> dict:
+        """build() 결과 중 JSON 직렬화 가능한 항목 (Series/DataFrame/배열 제외)"""
+        return {
+            k: v for k, v in result.items()
+            if not isinstance(v, (pd.Series, pd.DataFrame, np.ndarray))
+        }
+
+    @staticmethod
+    def _result_from_artifact(
+        method: str,
+        builder,
+        meta: dict,
+        z_matrix: pd.DataFrame,
+        daily_matrix: pd.DataFrame | None = None,
+    ) -> dict:
+        """저장된 builder의 transform으로 build()와 같은 형태의 결과 구성"""
+        result = dict(meta["summary"])
+        if method == "dfm":
+            data = daily_matrix if daily_matrix is not None else z_matrix
+            filtered, smoothed = builder.transform_factors(data)
+            result["daily_factor"] = smoothed.rename("liquidity_index")
+            result["filtered_factor"] = filtered
+            result["smoothed_factor"] = smoothed
+        else:
+            result["index"] = builder.transform(z_matrix)
+        if method == "ica":
+            X = z_matrix[builder._feature_names].dropna()
+            S = builder.ica.transform(X.values)
+            result["components"] = pd.DataFrame(
+                S, index=X.index, columns=[f"IC_{i}" for i in range(S.shape[1])])
+            result["mixing_matrix"] = builder.ica.mixing_
+        result["artifact"] = meta["fingerprint"][:16]
+        logger.info("Stage 1: %s loaded from artifact (no refit)", method.upper())
         return result
 
     def run_stage2(
@@ -286,7 +408,9 @@ class PipelineRunnerV2:
         from src.robustness.bootstrap_analysis import BootstrapAnalyzer
         from src.validators.composite_score import CompositeWaveformScore
 
-        bootstrap = BootstrapAnalyzer()
+        bootstrap = BootstrapAnalyzer(
+            checkpoint_dir=VALIDATION_DIR / "bootstrap_checkpoints",
+        )
         scorer = CompositeWaveformScore()
 
         # Bootstrap loading stability
@@ -305,7 +429,8 @@ class PipelineRunnerV2:
         if n_obs >= 60:
             try:
                 from src.robustness.cpcv import CPCVValidator
-                cpcv = CPCVValidator()
+                cpcv = (CPCVValidator(workers=self.workers)
+                        if self.workers else CPCVValidator())
                 cpcv_result = cpcv.validate(
                     z_matrix, target, BuilderClass, scorer
                 )
@@ -337,6 +462,7 @@ class PipelineRunnerV2:
         self,
         z_matrix: pd.DataFrame,
         target: pd.Series,
+        reuse_latest: bool = False,
     ) -> dict:
         """
         Run complete 3-Stage pipeline.
@@ -344,6 +470,7 @@ class PipelineRunnerV2:
         Args:
             z_matrix: z-scored variable matrix (no BTC)
             target: log10(BTC)
+            reuse_latest: Stage 1에서 최신 artifact transform 허용 (run_stage1 참고)
 
         Returns:
             dict with stage1, stage2, stage3 results + success check
@@ -354,7 +481,7 @@ class PipelineRunnerV2:
         logger.info("=" * 60)
 
         # Stage 1
-        stage1 = self.run_stage1(z_matrix)
+        stage1 = self.run_stage1(z_matrix, reuse_latest=reuse_latest)
 
         # Stage 2
         stage2 = self.run_stage2(stage1["index"], target)
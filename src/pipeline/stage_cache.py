@@ -0,0 +1,124 @@
+"""Content-addressed 스테이지 캐시 — PipelineRunner fetch/calc/ortho/zscore.
+
+각 스테이지 출력을 (입력 내용 해시 + 관련 상수 + 스테이지 코드 해시) 키로
+data/stage_cache/{stage}_{key}.pkl 에 저장. 입력이 그대로면 다음 실행에서
+로드만 하고 계산 생략:
+
+  raw_data   ← RawDataStore.signature() (시리즈·수집 시각·행 수) + 기간
+               — 모든 시리즈가 만료 전일 때만
+  variables  ← raw_data 내용 + SOFR_THRESHOLD_BPS, MA_WINDOW_MONTHS
+  ortho_vars ← variables 내용 + ORTHO_CORR_THRESHOLD, VARIABLE_ORDER
+  z_matrix   ← ortho_vars 내용 + VARIABLE_ORDER
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.constants import STAGE_CACHE
+from config.settings import STAGE_CACHE_DIR
+from src.utils.logger import setup_logger
+
+logger = setup_logger("stage_cache")
+
+
+def _update_digest(h, obj) -> None:
+    """DataFrame / Series / dict / list / 스칼라 → 해시에 내용 반영 (재귀)"""
+    if isinstance(obj, pd.DataFrame):
+        h.update(b"df")
+        h.update(repr([(str(c), str(t)) for c, t in obj.dtypes.items()]).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b"s" + repr((obj.name, str(obj.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(b"a" + repr((obj.dtype.str, obj.shape)).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"d")
+        for k in sorted(obj, key=repr):
+            h.update(repr(k).encode())
+            _update_digest(h, obj[k])
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"l%d" % len(obj))
+        for v in obj:
+            _update_digest(h, v)
+    else:
+        h.update(repr(obj).encode())
+
+
+class StageCache:
+    """Binary on-disk cache for pipeline stage outputs, keyed by input content."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        keep_per_stage: int = STAGE_CACHE["keep_per_stage"],
+    ):
+        self.cache_dir = Path(cache_dir or STAGE_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_per_stage = keep_per_stage
+
+    @staticmethod
+    def key(stage: str, *parts) -> str:
+        """스테이지 이름 + 입력 (DataFrame/dict/상수 등) → 캐시 키"""
+        h = hashlib.sha1(stage.encode())
+        for p in parts:
+            _update_digest(h, p)
+        return h.hexdigest()[:20]
+
+    @staticmethod
+    def source_digest(*modules) -> str:
+        """스테이지 코드 해시 — 계산 로직이 바뀌면 키도 바뀜"""
+        h = hashlib.sha1()
+        for m in modules:
+            h.update(Path(m.__file__).read_bytes())
+        return h.hexdigest()
+
+    def get(self, stage: str, key: str):
+        """저장된 출력 또는 miss 시 None (스테이지 출력은 None이 아님)"""
+        path = self._path(stage, key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Stage cache unreadable ({path.name}): {e}")
+            return None
+        os.utime(path)  # 최근 사용 → prune 대상에서 제외
+        return value
+
+    def put(self, stage: str, key: str, value) -> None:
+        """원자적 저장 (임시 파일 → rename) 후 오래된 항목 정리"""
+        path = self._path(stage, key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._prune(stage)
+
+    def cached(self, stage: str, key: str, compute):
+        """key 히트면 로드, 아니면 compute() 실행 후 저장"""
+        value = self.get(stage, key)
+        if value is not None:
+            logger.info(f"[Stage Cache Hit] {stage} ({key})")
+            return value
+        value = compute()
+        self.put(stage, key, value)
+        return value
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / f"{stage}_{key}.pkl"
+
+    def _prune(self, stage: str) -> None:
+        files = sorted(
+            self.cache_dir.glob(f"{stage}_*.pkl"),
+            key=lambda p: p.stat().st_mtime, reverse=True,
+        )
+        for p in files[self.keep_per_stage:]:
+            p.unlink(missing_ok=True)
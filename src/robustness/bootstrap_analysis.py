@@ -3,7 +3,12 @@
 PC1 loadings, 최적 lag, MDA의 통계적 안정성을 검증.
 """
 
+import hashlib
+import json
 import logging
+import os
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 try:
@@ -11,7 +16,7 @@ try:
 except ImportError:
     from scipy.stats import binom_test as binomtest
 
-from config.constants import BOOTSTRAP_CONFIG
+from config.constants import BOOTSTRAP_CONFIG, BOOTSTRAP_SEQUENTIAL
 
 logger = logging.getLogger(__name__)
 
@@ -30,18 +35,114 @@ def _block_bootstrap_indices(
     return indices[:n]
 
 
+def _block_bootstrap_index_matrix(
+    n: int,
+    block_length: int,
+    rng: np.random.Generator,
+    n_samples: int,
+) -> np.ndarray:
+    """
+    (n_samples × n) block bootstrap 인덱스를 한 번에 생성.
+
+    블록 시작점은 샘플마다 rng.integers를 호출해 뽑는다 — 한 번에
+    (n_samples × n_blocks)로 뽑으면 난수 스트림이 달라져 같은 seed에서
+    _block_bootstrap_indices 반복 호출과 결과가 달라진다.
+    """
+    n_blocks = int(np.ceil(n / block_length))
+    starts = np.empty((n_samples, n_blocks), dtype=np.int64)
+    for b in range(n_samples):
+        starts[b] = rng.integers(0, n - block_length + 1, size=n_blocks)
+    idx = starts[:, :, None] + np.arange(block_length)
+    return idx.reshape(n_samples, -1)[:, :n]
+
+
+def _pc1_batch(xb: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (b × n × p) 표본 묶음 → (중심화 표본, 공분산 b×p×p, PC1 loadings b×p).
+
+    공분산 b개를 einsum으로 쌓고 batched eigh 1회 — sklearn PCA와 같은
+    부호 규약 (절댓값 최대 원소 양수) 적용.
+    """
+    xc = xb - xb.mean(axis=1, keepdims=True)
+    cov = np.einsum("bnp,bnq->bpq", xc, xc) / (xb.shape[1] - 1)
+    _, vecs = np.linalg.eigh(cov)
+    v = vecs[:, :, -1]                                    # 최대 고유값
+    pick = np.argmax(np.abs(v), axis=1)
+    v = v * np.sign(v[np.arange(len(v)), pick])[:, None]
+    return xc, cov, v
+
+
+def _pc1_loadings_batch(
+    x: np.ndarray,
+    boot_idx: np.ndarray,
+    chunk: int = 256,
+) -> np.ndarray:
+    """bootstrap 표본별 PC1 loadings (B × p)"""
+    out = np.empty((len(boot_idx), x.shape[1]))
+    for s in range(0, len(boot_idx), chunk):
+        _, _, out[s:s + chunk] = _pc1_batch(x[boot_idx[s:s + chunk]])
+    return out
+
+
+def _pc1_scores_batch(
+    x: np.ndarray,
+    boot_idx: np.ndarray,
+    nl_idx: int,
+) -> np.ndarray:
+    """
+    bootstrap 표본별 PC1 index (b × n) — PCAIndexBuilder.build()["index"]와 동일,
+    corr(index, NL) < 0이면 부호 반전 (= v · cov[:, NL] < 0).
+    """
+    xc, cov, v = _pc1_batch(x[boot_idx])
+    scores = np.einsum("bnp,bp->bn", xc, v)
+    flip = np.einsum("bp,bp->b", v, cov[:, :, nl_idx]) < 0
+    scores[flip] *= -1
+    return scores
+
+
+def _quantile_mcse(samples: np.ndarray, q: float) -> np.ndarray:
+    """
+    분위수 추정치의 Monte Carlo 표준오차 (열별).
+
+    분포 무관 순서통계량 구간: 표본 분위수 q의 ±1σ 구간은 대략
+    x_(Nq ± √(Nq(1-q))) — 그 폭의 절반을 표준오차로 사용.
+    유효 표본이 없으면 NaN (수렴 판정에서 미수렴으로 처리).
+    """
+    x = np.sort(samples, axis=0)
+    n = len(x)
+    if n == 0:
+        return np.full(x.shape[1:], np.nan)
+    half = np.sqrt(n * q * (1 - q))
+    lo = int(np.clip(np.floor(n * q - half), 0, n - 1))
+    hi = int(np.clip(np.ceil(n * q + half), 0, n - 1))
+    return (x[hi] - x[lo]) / 2
+
+
 class BootstrapAnalyzer:
     """Block Bootstrap for loading stability and lag distribution."""
 
+    # 배치 경로에서 한 번에 처리할 bootstrap 표본 수
+    BATCH_SIZE = 128
+
     def __init__(
         self,
         n_bootstraps: int = BOOTSTRAP_CONFIG["n_bootstraps"],
         block_length: int = BOOTSTRAP_CONFIG["block_length"],
         confidence_level: float = BOOTSTRAP_CONFIG["confidence_level"],
+        max_slow_lag_samples: int = BOOTSTRAP_CONFIG["max_slow_lag_samples"],
+        adaptive: bool = BOOTSTRAP_CONFIG["adaptive"],
+        checkpoint_dir: str | Path | None = None,
     ):
         self.n_bootstraps = n_bootstraps
         self.block_length = block_length
         self.confidence_level = confidence_level
+        # 배치 경로가 없는 builder (ICA/DFM 등)의 lag_distribution 표본 상한
+        self.max_slow_lag_samples = max_slow_lag_samples
+        # adaptive: 배치 단위로 뽑다가 CI 끝점·nl_max_rate의 MC 표준오차가
+        # 허용치 이내면 중단 (BOOTSTRAP_SEQUENTIAL). checkpoint_dir가 있으면
+        # 배치마다 저장 → 중단된 실행을 이어서 진행
+        self.adaptive = adaptive
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
 
     def loading_stability(
         self,
@@ -57,16 +158,13 @@ class BootstrapAnalyzer:
 
         Returns:
             dict with mean_loadings, ci_lower, ci_upper,
-                  nl_always_max, ci_excludes_zero, samples
+                  nl_always_max, ci_excludes_zero, samples,
+                  n_bootstraps_used (+ adaptive: converged, mcse)
         """
         numeric_cols = z_matrix.select_dtypes(include=[np.number]).columns.tolist()
         X = z_matrix[numeric_cols].dropna()
-        n = len(X)
-        n_vars = len(numeric_cols)
 
         rng = np.random.default_rng(42)
-        loading_samples = np.zeros((self.n_bootstraps, n_vars))
-        nl_max_count = 0
 
         # Find NL column index
         nl_idx = next(
@@ -74,42 +172,51 @@ class BootstrapAnalyzer:
             0,
         )
 
-        for b in range(self.n_bootstraps):
-            boot_idx = _block_bootstrap_indices(n, self.block_length, rng)
-            z_boot = X.iloc[boot_idx].reset_index(drop=True)
-            z_boot.columns = numeric_cols
-
-            try:
-                builder = builder_class()
-                result = builder.build(z_boot)
-                loadings = [result["loadings"].get(c, 0.0) for c in numeric_cols]
-
-                # Sign correction: NL loading should be positive
-                if loadings[nl_idx] < 0:
-                    loadings = [-l for l in loadings]
-
-                loading_samples[b] = loadings
+        alpha = 1 - self.confidence_level
+        lo_pct = alpha / 2 * 100
+        hi_pct = (1 - alpha / 2) * 100
 
-                # Check if NL has max |loading|
-                if np.argmax(np.abs(loadings)) == nl_idx:
-                    nl_max_count += 1
+        def draw(size):
+            return self._loading_batch(X, numeric_cols, builder_class, nl_idx, rng, size)
+
+        if self.adaptive:
+            ci_tol = BOOTSTRAP_SEQUENTIAL["ci_mcse_tol"]
+            rate_tol = BOOTSTRAP_SEQUENTIAL["rate_mcse_tol"]
+
+            def monitor(loadings, nl_max):
+                valid = ~np.any(np.isnan(loadings), axis=1)
+                s = loadings[valid]
+                rate = nl_max[valid].mean() if len(s) else np.nan
+                se_lo = _quantile_mcse(s, lo_pct / 100)
+                se_hi = _quantile_mcse(s, hi_pct / 100)
+                mcse = {}
+                for i, c in enumerate(numeric_cols):
+                    mcse[f"ci_lower.{c}"] = (float(se_lo[i]), ci_tol)
+                    mcse[f"ci_upper.{c}"] = (float(se_hi[i]), ci_tol)
+                mcse["nl_max_rate"] = (
+                    float(np.sqrt(rate * (1 - rate) / len(s))) if len(s) else np.nan,
+                    rate_tol,
+                )
+                return mcse
 
-            except Exception:
-                loading_samples[b] = np.nan
+            (loading_samples, nl_max), run_info = self._sequential(
+                "loadings", [X], builder_class, draw, monitor, rng,
+                budget=BOOTSTRAP_SEQUENTIAL["max_bootstraps"],
+            )
+        else:
+            loading_samples, nl_max = draw(self.n_bootstraps)
+            run_info = {"n_bootstraps_used": self.n_bootstraps}
 
         # Remove failed bootstraps
         valid = ~np.any(np.isnan(loading_samples), axis=1)
         samples = loading_samples[valid]
+        nl_max_count = int(nl_max[valid].sum())
         n_valid = len(samples)
 
         if n_valid < 10:
             logger.warning("Only %d valid bootstrap samples", n_valid)
             return {"error": "Insufficient valid samples"}
 
-        alpha = 1 - self.confidence_level
-        lo_pct = alpha / 2 * 100
-        hi_pct = (1 - alpha / 2) * 100
-
         mean_loadings = {c: float(np.mean(samples[:, i]))
                          for i, c in enumerate(numeric_cols)}
         ci_lower = {c: float(np.percentile(samples[:, i], lo_pct))
@@ -135,9 +242,65 @@ class BootstrapAnalyzer:
             "nl_max_rate": float(nl_max_count / n_valid),
             "ci_excludes_zero": ci_excludes_zero,
             "n_valid": n_valid,
+            **run_info,
             "samples": samples,
         }
 
+    def _loading_batch(
+        self,
+        X: pd.DataFrame,
+        numeric_cols: list[str],
+        builder_class: type,
+        nl_idx: int,
+        rng: np.random.Generator,
+        size: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        bootstrap 표본 size개의 (loadings (size × p), NL 최대 |loading| 여부 (size,)).
+
+        실패한 표본은 loadings NaN 행. rng 스트림은 size로 나눠 불러도
+        한 번에 불렀을 때와 같다.
+        """
+        n = len(X)
+
+        if hasattr(builder_class, "build_from_moments"):
+            # PCA: 배치 (인덱스 행렬 → einsum 공분산 → batched eigh)
+            boot_idx = _block_bootstrap_index_matrix(n, self.block_length, rng, size)
+            loading_samples = _pc1_loadings_batch(X.values.astype(float), boot_idx)
+
+            # Sign correction: NL loading should be positive
+            loading_samples *= np.where(loading_samples[:, nl_idx] < 0, -1.0, 1.0)[:, None]
+
+            # Check if NL has max |loading|
+            nl_max = np.argmax(np.abs(loading_samples), axis=1) == nl_idx
+            return loading_samples, nl_max
+
+        loading_samples = np.zeros((size, len(numeric_cols)))
+        nl_max = np.zeros(size, dtype=bool)
+        for b in range(size):
+            boot_idx = _block_bootstrap_indices(n, self.block_length, rng)
+            z_boot = X.iloc[boot_idx].reset_index(drop=True)
+            z_boot.columns = numeric_cols
+
+            try:
+                builder = builder_class()
+                result = builder.build(z_boot)
+                loadings = [result["loadings"].get(c, 0.0) for c in numeric_cols]
+
+                # Sign correction: NL loading should be positive
+                if loadings[nl_idx] < 0:
+                    loadings = [-l for l in loadings]
+
+                loading_samples[b] = loadings
+
+                # Check if NL has max |loading|
+                nl_max[b] = np.argmax(np.abs(loadings)) == nl_idx
+
+            except Exception:
+                loading_samples[b] = np.nan
+
+        return loading_samples, nl_max
+
     def lag_distribution(
         self,
         z_matrix: pd.DataFrame,
@@ -153,12 +316,108 @@ class BootstrapAnalyzer:
         """
         numeric_cols = z_matrix.select_dtypes(include=[np.number]).columns.tolist()
         X = z_matrix[numeric_cols].dropna()
-        n = len(X)
 
         rng = np.random.default_rng(42)
-        lag_samples = []
+        alpha = 1 - self.confidence_level
+
+        fast = (hasattr(builder_class, "build_from_moments")
+                and hasattr(scorer, "lag_profile_batch"))
+        budget = (BOOTSTRAP_SEQUENTIAL["max_bootstraps"]
+                  if self.adaptive else self.n_bootstraps)
+        if not fast and budget > self.max_slow_lag_samples:
+            logger.warning(
+                "lag_distribution: %s has no batched path, "
+                "using %d of %d bootstrap samples",
+                builder_class.__name__, self.max_slow_lag_samples, budget,
+            )
+            budget = self.max_slow_lag_samples
+
+        def draw(size):
+            return (self._lag_batch(
+                X, numeric_cols, target, builder_class, scorer, rng, size, fast,
+            ),)
+
+        if self.adaptive:
+            lag_tol = BOOTSTRAP_SEQUENTIAL["lag_mcse_tol"]
+
+            def monitor(lags):
+                s = lags[~np.isnan(lags)]
+                return {
+                    "ci_lower": (float(_quantile_mcse(s, alpha / 2)), lag_tol),
+                    "ci_upper": (float(_quantile_mcse(s, 1 - alpha / 2)), lag_tol),
+                }
+
+            (lag_samples,), run_info = self._sequential(
+                "lags", [X, target], builder_class, draw, monitor, rng,
+                budget=budget,
+            )
+        else:
+            (lag_samples,) = draw(budget)
+            run_info = {"n_bootstraps_used": budget}
+
+        lag_samples = lag_samples[~np.isnan(lag_samples)]
+        if len(lag_samples) < 10:
+            return {"error": "Insufficient valid samples"}
+
+        lags = lag_samples.astype(int)
+
+        return {
+            "mean_lag": float(np.mean(lags)),
+            "median_lag": float(np.median(lags)),
+            "mode_lag": int(pd.Series(lags).mode().iloc[0]),
+            "ci_lower": float(np.percentile(lags, alpha / 2 * 100)),
+            "ci_upper": float(np.percentile(lags, (1 - alpha / 2) * 100)),
+            "n_samples": len(lags),
+            **run_info,
+            "distribution": lags,
+        }
 
-        for b in range(min(self.n_bootstraps, 200)):  # Limit for speed
+    def _lag_batch(
+        self,
+        X: pd.DataFrame,
+        numeric_cols: list[str],
+        target: pd.Series,
+        builder_class: type,
+        scorer,
+        rng: np.random.Generator,
+        size: int,
+        fast: bool,
+    ) -> np.ndarray:
+        """bootstrap 표본 size개의 최적 lag (size,) — 실패한 표본은 NaN"""
+        n = len(X)
+        max_lag = 15
+        out = np.full(size, np.nan)
+
+        if fast:
+            # PCA + CWS: 표본 묶음마다 index 배치 계산 → lag profile 한 번에
+            nl_idx = next(
+                (i for i, c in enumerate(numeric_cols) if "NL" in c.upper()),
+                0,
+            )
+            x = X.values.astype(float)
+            tgt = target.iloc[:n].values.astype(float)
+            boot_idx = _block_bootstrap_index_matrix(n, self.block_length, rng, size)
+            for s in range(0, size, self.BATCH_SIZE):
+                chunk = boot_idx[s:s + self.BATCH_SIZE]
+                index = _pc1_scores_batch(x, chunk, nl_idx)
+                t_boot = tgt[chunk]
+                ok = ~np.isnan(t_boot).any(axis=1)
+
+                profile = np.full((len(chunk), max_lag + 1), -np.inf)
+                if ok.any():
+                    profile[ok] = scorer.lag_profile_batch(index[ok], t_boot[ok], max_lag)
+                lags = np.argmax(profile, axis=1)
+
+                # target NaN 표본은 pandas 경로 (lag별 NaN 제거)
+                for b in np.flatnonzero(~ok):
+                    opt = scorer.optimal_lag(
+                        pd.Series(index[b]), pd.Series(t_boot[b]), max_lag=max_lag,
+                    )
+                    lags[b] = opt["optimal_lag"]
+                out[s:s + len(chunk)] = lags
+            return out
+
+        for b in range(size):
             boot_idx = _block_bootstrap_indices(n, self.block_length, rng)
             z_boot = X.iloc[boot_idx].reset_index(drop=True)
             z_boot.columns = numeric_cols
@@ -184,27 +443,112 @@ class BootstrapAnalyzer:
                 if corr_nl < 0:
                     index = -index
 
-                opt = scorer.optimal_lag(index, t_boot, max_lag=15)
-                lag_samples.append(opt["optimal_lag"])
+                opt = scorer.optimal_lag(index, t_boot, max_lag=max_lag)
+                out[b] = opt["optimal_lag"]
             except Exception:
                 continue
 
-        if len(lag_samples) < 10:
-            return {"error": "Insufficient valid samples"}
+        return out
 
-        lags = np.array(lag_samples)
-        alpha = 1 - self.confidence_level
+    def _sequential(
+        self,
+        kind: str,
+        data: list,
+        builder_class: type,
+        draw,
+        monitor,
+        rng: np.random.Generator,
+        budget: int,
+    ) -> tuple[tuple[np.ndarray, ...], dict]:
+        """
+        배치 단위 순차 bootstrap — 수렴 또는 예산 소진까지.
 
-        return {
-            "mean_lag": float(np.mean(lags)),
-            "median_lag": float(np.median(lags)),
-            "mode_lag": int(pd.Series(lags).mode().iloc[0]),
-            "ci_lower": float(np.percentile(lags, alpha / 2 * 100)),
-            "ci_upper": float(np.percentile(lags, (1 - alpha / 2) * 100)),
-            "n_samples": len(lag_samples),
-            "distribution": lags,
+        draw(size)는 배열 tuple (표본 축 0), monitor(*arrays)는
+        {이름: (MC 표준오차, 허용치)}. min_bootstraps 이후 모든 항목이
+        허용치 이내면 중단. checkpoint에는 표본과 rng 상태를 같이 저장해
+        재개 시 같은 난수 스트림을 이어간다 (완료되면 삭제).
+        """
+        cfg = BOOTSTRAP_SEQUENTIAL
+        path = self._checkpoint_path(kind, data, builder_class)
+
+        arrays, resumed = None, 0
+        if path is not None and path.exists():
+            with np.load(path) as ckpt:
+                arrays = tuple(ckpt[f"arr_{i}"] for i in range(int(ckpt["n_arrays"])))
+                rng.bit_generator.state = json.loads(str(ckpt["rng_state"]))
+            resumed = len(arrays[0])
+            logger.info("Bootstrap %s: resumed from checkpoint (%d samples)", kind, resumed)
+
+        converged, mcse = False, {}
+        while True:
+            n_drawn = len(arrays[0]) if arrays is not None else 0
+            if n_drawn >= min(cfg["min_bootstraps"], budget):
+                mcse = monitor(*arrays)
+                converged = all(se <= tol for se, tol in mcse.values())
+                if converged or n_drawn >= budget:
+                    break
+
+            batch = draw(min(cfg["batch_size"], budget - n_drawn))
+            arrays = batch if arrays is None else tuple(
+                np.concatenate([a, b]) for a, b in zip(arrays, batch)
+            )
+            if path is not None:
+                self._save_checkpoint(path, arrays, rng)
+
+        if path is not None and path.exists():
+            path.unlink()
+
+        n_used = len(arrays[0])
+        logger.info(
+            "Bootstrap %s: %d samples, converged=%s, max MCSE/tol=%.2f",
+            kind, n_used, converged,
+            max((se / tol if np.isfinite(se) else np.inf
+                 for se, tol in mcse.values()), default=0.0),
+        )
+        return arrays, {
+            "n_bootstraps_used": n_used,
+            "converged": converged,
+            "resumed_from": resumed,
+            "mcse": {k: se for k, (se, _) in mcse.items()},
         }
 
+    def _checkpoint_path(
+        self,
+        kind: str,
+        data: list,
+        builder_class: type,
+    ) -> Path | None:
+        """입력 데이터·설정 지문으로 checkpoint 파일 경로 결정 (다른 입력이면 다른 파일)"""
+        if self.checkpoint_dir is None:
+            return None
+        h = hashlib.sha1()
+        for d in data:
+            h.update(pd.util.hash_pandas_object(d, index=True).values.tobytes())
+            if isinstance(d, pd.DataFrame):
+                h.update(repr(list(d.columns)).encode())
+        h.update(repr((
+            kind, builder_class.__name__, self.block_length, self.confidence_level,
+            sorted(BOOTSTRAP_SEQUENTIAL.items()),
+        )).encode())
+        return self.checkpoint_dir / f"bootstrap_{kind}_{h.hexdigest()[:16]}.npz"
+
+    @staticmethod
+    def _save_checkpoint(
+        path: Path,
+        arrays: tuple[np.ndarray, ...],
+        rng: np.random.Generator,
+    ) -> None:
+        """checkpoint 원자적 저장 (임시 파일 → rename)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f, *arrays,
+                n_arrays=len(arrays),
+                rng_state=json.dumps(rng.bit_generator.state),
+            )
+        os.replace(tmp, path)
+
     @staticmethod
     def mda_significance(
         mda_value: float,
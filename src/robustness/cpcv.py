@@ -5,7 +5,10 @@ v1.0 Walk-Forward (9 paths) 대비 5x more robust.
 """
 
 import logging
+import multiprocessing as mp
+import time
 from itertools import combinations
+from multiprocessing import shared_memory
 
 import numpy as np
 import pandas as pd
@@ -14,6 +17,45 @@ from config.constants import CPCV_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# 병렬 worker 상태 — X/target은 공유 메모리 view (split마다 복사·pickle 없음)
+_SPLIT_STATE: dict = {}
+
+
+def _attach_shared(name: str, shape: tuple, dtype: str):
+    """공유 메모리 블록 → (SharedMemory, ndarray view)"""
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_split_worker(spec: dict) -> None:
+    """Pool initializer — 공유 메모리에 연결하고 DataFrame/Series를 1회 구성"""
+    shm_x, x = _attach_shared(spec["x_name"], spec["x_shape"], spec["dtype"])
+    shm_t, t = _attach_shared(spec["t_name"], spec["t_shape"], spec["dtype"])
+    _SPLIT_STATE.clear()
+    _SPLIT_STATE.update({
+        "shm": (shm_x, shm_t),
+        "X": pd.DataFrame(x, index=spec["index"], columns=spec["columns"], copy=False),
+        "tgt": pd.Series(t, index=spec["index"], copy=False),
+        "splits": spec["splits"],
+        "builder_class": spec["builder_class"],
+        "scorer": spec["scorer"],
+        "prefix": spec["prefix"],
+    })
+
+
+def _run_split_task(i: int) -> tuple[int, dict | None, str | None]:
+    """split i 평가 → (i, 결과, 오류 메시지)"""
+    st = _SPLIT_STATE
+    train_idx, test_idx = st["splits"][i]
+    try:
+        result = CPCVValidator._run_split(
+            st["X"], st["tgt"], train_idx, test_idx,
+            st["builder_class"], st["scorer"], st["prefix"],
+        )
+        return i, result, None
+    except Exception as e:
+        return i, None, f"{type(e).__name__}: {e}"
+
 
 class CPCVValidator:
     """CPCV: Combinatorial Purged Cross-Validation."""
@@ -24,11 +66,17 @@ class CPCVValidator:
         n_test_folds: int = CPCV_CONFIG["n_test_folds"],
         purge_threshold: int = CPCV_CONFIG["purge_threshold"],
         embargo: int = CPCV_CONFIG["embargo"],
+        workers: int = CPCV_CONFIG["workers"],
+        fast_pca: bool = CPCV_CONFIG["fast_pca"],
     ):
         self.n_folds = n_folds
         self.n_test_folds = n_test_folds
         self.purge = purge_threshold
         self.embargo = embargo
+        # split 병렬 프로세스 수 (1 = 직렬). split 순서대로 수집 → 직렬과 동일 결과
+        self.workers = max(1, workers or 1)
+        # build_from_moments 지원 builder (PCA): 행 prefix sum으로 train 공분산 조립
+        self.fast_pca = fast_pca
 
     def _generate_splits(
         self,
@@ -114,59 +162,46 @@ class CPCVValidator:
         if not splits:
             return {"error": "No valid splits generated"}
 
+        prefix = None
+        if self.fast_pca and hasattr(builder_class, "build_from_moments"):
+            prefix = self._row_prefix(X.values)
+
+        t0 = time.perf_counter()
+        if self.workers > 1 and len(splits) > 1:
+            outcomes = self._run_parallel(X, tgt, splits, builder_class, scorer, prefix)
+        else:
+            outcomes = []
+            for i, (train_idx, test_idx) in enumerate(splits):
+                try:
+                    outcomes.append((i, self._run_split(
+                        X, tgt, train_idx, test_idx, builder_class, scorer, prefix,
+                    ), None))
+                except Exception as e:
+                    outcomes.append((i, None, f"{type(e).__name__}: {e}"))
+        elapsed = time.perf_counter() - t0
+
         results = []
-        for train_idx, test_idx in splits:
-            try:
-                # Build index on train set
-                z_train = X.iloc[train_idx].copy()
-                z_train.columns = numeric_cols
-                builder = builder_class()
-                build_result = builder.build(z_train)
-
-                # Transform test set
-                z_test = X.iloc[test_idx].copy()
-                z_test.columns = numeric_cols
-                index_oos = builder.transform(z_test)
-
-                # Sign correction using NL
-                nl_col = next(
-                    (c for c in numeric_cols if "NL" in c.upper()),
-                    numeric_cols[0],
-                )
-                nl_train = z_train[nl_col]
-                train_index = build_result["index"]
-                corr_nl = np.corrcoef(
-                    train_index.values[:len(nl_train)],
-                    nl_train.values[:len(train_index)],
-                )[0, 1]
-                if corr_nl < 0:
-                    index_oos = -index_oos
-
-                # Score OOS
-                target_oos = tgt.iloc[test_idx]
-                cws_result = scorer.optimal_lag(index_oos, target_oos,
-                                                max_lag=12)
-
-                # Also get pearson r at optimal lag
-                from .._compat import pearson_at_lag
-                r = pearson_at_lag(index_oos, target_oos,
-                                   cws_result["optimal_lag"])
-
-                results.append({
-                    "cws": cws_result["best_cws"],
-                    "optimal_lag": cws_result["optimal_lag"],
-                    "mda": cws_result["profile"].iloc[
-                        cws_result["optimal_lag"]
-                    ]["mda"] if "mda" in cws_result["profile"].columns else None,
-                    "pearson_r": r,
-                })
-
-            except Exception as e:
-                logger.debug("CPCV split failed: %s", e)
+        failures = []
+        for i, res, err in outcomes:
+            if err is not None:
+                logger.warning("CPCV split %d failed: %s", i, err)
+                failures.append({"split": i, "error": err})
                 continue
+            res["split"] = i
+            results.append(res)
+
+        timings = self._timing_summary(results, elapsed)
+        logger.info(
+            "CPCV: %d/%d splits ok, %d failed, %.2fs (workers=%d)",
+            len(results), len(splits), len(failures), elapsed, self.workers,
+        )
 
         if len(results) < 5:
-            return {"error": f"Only {len(results)} valid paths"}
+            return {
+                "error": f"Only {len(results)} valid paths",
+                "n_failed": len(failures),
+                "failures": failures,
+            }
 
         df = pd.DataFrame(results)
 
@@ -186,4 +221,173 @@ class CPCVValidator:
             if len(r_values) > 0 else None,
             "worst_path": results[int(np.argmin(cws_values))],
             "best_path": results[int(np.argmax(cws_values))],
+            "n_failed": len(failures),
+            "failures": failures,
+            "timings": timings,
+            "workers": self.workers,
+        }
+
+    @staticmethod
+    def _run_split(
+        X: pd.DataFrame,
+        tgt: pd.Series,
+        train_idx: np.ndarray,
+        test_idx: np.ndarray,
+        builder_class: type,
+        scorer,
+        prefix: dict | None = None,
+    ) -> dict:
+        """
+        단일 split: train에서 index 구성 → test 변환 → OOS 점수 (+ 단계별 시간).
+        prefix가 있으면 train 충분통계량으로 build_from_moments (DataFrame 복사 없음).
+        """
+        from .._compat import pearson_at_lag
+
+        numeric_cols = X.columns.tolist()
+        nl_col = next(
+            (c for c in numeric_cols if "NL" in c.upper()),
+            numeric_cols[0],
+        )
+        t0 = time.perf_counter()
+
+        # Build index on train set
+        builder = builder_class()
+        if prefix is not None:
+            n, mean, scatter = CPCVValidator._subset_moments(prefix, train_idx)
+            builder.build_from_moments(n, mean, scatter, numeric_cols)
+            # corr(PC1_train, NL_train)의 부호 = sign(v · cov[:, NL])
+            j = numeric_cols.index(nl_col)
+            corr_nl = builder.pca.components_[0] @ scatter[:, j]
+        else:
+            z_train = X.iloc[train_idx].copy()
+            build_result = builder.build(z_train)
+
+            # Sign correction using NL
+            nl_train = z_train[nl_col]
+            train_index = build_result["index"]
+            corr_nl = np.corrcoef(
+                train_index.values[:len(nl_train)],
+                nl_train.values[:len(train_index)],
+            )[0, 1]
+        t_build = time.perf_counter()
+
+        # Transform test set
+        z_test = X.iloc[test_idx].copy()
+        index_oos = builder.transform(z_test)
+        if corr_nl < 0:
+            index_oos = -index_oos
+        t_transform = time.perf_counter()
+
+        # Score OOS
+        target_oos = tgt.iloc[test_idx]
+        cws_result = scorer.optimal_lag(index_oos, target_oos, max_lag=12)
+
+        # Also get pearson r at optimal lag
+        r = pearson_at_lag(index_oos, target_oos, cws_result["optimal_lag"])
+        t_score = time.perf_counter()
+
+        return {
+            "cws": cws_result["best_cws"],
+            "optimal_lag": cws_result["optimal_lag"],
+            "mda": cws_result["profile"].iloc[
+                cws_result["optimal_lag"]
+            ]["mda"] if "mda" in cws_result["profile"].columns else None,
+            "pearson_r": r,
+            "timing": {
+                "build": round(t_build - t0, 4),
+                "transform": round(t_transform - t_build, 4),
+                "score": round(t_score - t_transform, 4),
+                "total": round(t_score - t0, 4),
+            },
         }
+
+    def _run_parallel(
+        self,
+        X: pd.DataFrame,
+        tgt: pd.Series,
+        splits: list[tuple[np.ndarray, np.ndarray]],
+        builder_class: type,
+        scorer,
+        prefix: dict | None = None,
+    ) -> list[tuple[int, dict | None, str | None]]:
+        """
+        X/target을 공유 메모리에 한 번 올리고 split 인덱스만 worker에 전달.
+        pool.map은 입력 순서대로 결과를 돌려주므로 직렬 실행과 동일한 순서.
+        """
+        x = np.ascontiguousarray(X.values, dtype=np.float64)
+        t = np.ascontiguousarray(tgt.values, dtype=np.float64)
+        shm_x = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+        shm_t = shared_memory.SharedMemory(create=True, size=max(t.nbytes, 1))
+        try:
+            np.ndarray(x.shape, dtype=x.dtype, buffer=shm_x.buf)[:] = x
+            np.ndarray(t.shape, dtype=t.dtype, buffer=shm_t.buf)[:] = t
+
+            spec = {
+                "x_name": shm_x.name, "x_shape": x.shape,
+                "t_name": shm_t.name, "t_shape": t.shape,
+                "dtype": "float64",
+                "index": X.index, "columns": X.columns.tolist(),
+                "splits": splits,
+                "builder_class": builder_class,
+                "scorer": scorer,
+                "prefix": prefix,
+            }
+            method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+            workers = min(self.workers, len(splits))
+            with mp.get_context(method).Pool(
+                workers, initializer=_init_split_worker, initargs=(spec,),
+            ) as pool:
+                return pool.map(_run_split_task, range(len(splits)))
+        finally:
+            shm_x.close()
+            shm_x.unlink()
+            shm_t.close()
+            shm_t.unlink()
+
+    @staticmethod
+    def _row_prefix(x: np.ndarray) -> dict:
+        """행 방향 count / Σx / ΣxxT 누적합 (전역 평균으로 평행이동 — 정밀도)"""
+        shift = x.mean(axis=0)
+        xc = x - shift
+        n_rows, p = x.shape
+        P = {
+            "n": np.arange(n_rows + 1, dtype=float),
+            "s": np.zeros((n_rows + 1, p)),
+            "ss": np.zeros((n_rows + 1, p, p)),
+            "shift": shift,
+        }
+        np.cumsum(xc, axis=0, out=P["s"][1:])
+        np.cumsum(xc[:, :, None] * xc[:, None, :], axis=0, out=P["ss"][1:])
+        return P
+
+    @staticmethod
+    def _subset_moments(
+        prefix: dict,
+        idx: np.ndarray,
+    ) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        행 부분집합 idx의 (n, mean, 중심화 scatter).
+        train = 전체 - purge/embargo 구간 → 연속 구간 몇 개의 prefix 차이 합.
+        """
+        idx = np.asarray(idx)
+        cut = np.flatnonzero(np.diff(idx) != 1)
+        starts = idx[np.r_[0, cut + 1]]
+        stops = idx[np.r_[cut, len(idx) - 1]] + 1
+
+        n = float(np.sum(prefix["n"][stops] - prefix["n"][starts]))
+        s = np.sum(prefix["s"][stops] - prefix["s"][starts], axis=0)
+        ss = np.sum(prefix["ss"][stops] - prefix["ss"][starts], axis=0)
+        return int(n), s / n + prefix["shift"], ss - np.outer(s, s) / n
+
+    @staticmethod
+    def _timing_summary(results: list[dict], elapsed: float) -> dict:
+        """split별 단계 시간 → 합계/평균"""
+        per_split = [
+            {"split": r["split"], **r["timing"]} for r in results
+        ]
+        summary = {"wall_sec": round(elapsed, 4), "per_split": per_split}
+        for stage in ("build", "transform", "score", "total"):
+            vals = [r["timing"][stage] for r in results]
+            summary[f"{stage}_sum_sec"] = round(float(np.sum(vals)), 4) if vals else 0.0
+            summary[f"{stage}_mean_sec"] = round(float(np.mean(vals)), 4) if vals else 0.0
+        return summary
@@ -7,10 +7,12 @@ from .waveform_metrics import WaveformMetrics
 from .wavelet_coherence import WaveletCoherenceAnalyzer
 from .granger_test import GrangerCausalityTest
 from .composite_score import CompositeWaveformScore
+from .rolling_analysis import RollingLeadAnalyzer
 
 __all__ = [
     "WaveformMetrics",
     "WaveletCoherenceAnalyzer",
     "GrangerCausalityTest",
     "CompositeWaveformScore",
+    "RollingLeadAnalyzer",
 ]
@@ -10,7 +10,9 @@ import numpy as np
 import pandas as pd
 
 from config.constants import WAVEFORM_WEIGHTS, XCORR_CONFIG
-from .waveform_metrics import WaveformMetrics
+from .waveform_metrics import (
+    WaveformMetrics, _align, _target_lag_state, lag_metrics_multi,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,33 +42,67 @@ class CompositeWaveformScore:
             index, target, lag)
         tau, tau_p = self.metrics.kendall_tau(index, target, lag)
 
-        # Normalize components to [0, 1] range
-        # MDA: already 0~1
-        # SBD: 0~2, we use (1 - SBD/2) so 0->1, 2->0 — but design says (1-SBD)
-        sbd_norm = max(0.0, 1.0 - sbd) if not np.isnan(sbd) else 0.0
-        # CosSim: -1~1, map to 0~1: (cos_sim + 1) / 2
-        cos_norm = (cos_sim + 1) / 2 if not np.isnan(cos_sim) else 0.5
-        # Tau: -1~1, map to 0~1: (tau + 1) / 2
-        tau_norm = (tau + 1) / 2 if not np.isnan(tau) else 0.5
-        # MDA: 0~1 as-is
-        mda_val = mda if not np.isnan(mda) else 0.5
-
-        cws = (
+        cws = self.cws_from_metrics(
+            np.float64(mda), np.float64(sbd), np.float64(cos_sim), np.float64(tau),
+        )
+        return self._result_row(cws, mda, sbd, cos_sim, tau, tau_p, lag)
+
+    @staticmethod
+    def _result_row(cws, mda, sbd, cos_sim, tau, tau_p, lag) -> dict:
+        """calculate() / optimal_lag() profile 행 (NaN 메트릭은 None)"""
+        def opt(v):
+            return float(v) if not np.isnan(v) else None
+
+        return {
+            "cws": float(cws),
+            "mda": opt(mda),
+            "sbd": opt(sbd),
+            "cosine_sim": opt(cos_sim),
+            "kendall_tau": opt(tau),
+            "kendall_p": opt(tau_p),
+            "lag": int(lag),
+        }
+
+    def cws_from_metrics(
+        self,
+        mda: np.ndarray,
+        sbd: np.ndarray,
+        cos_sim: np.ndarray,
+        tau: np.ndarray,
+    ) -> np.ndarray:
+        """
+        메트릭 (배열) → CWS.
+
+        Normalize components to [0, 1] range:
+          MDA 0~1 as-is, SBD → max(0, 1 - SBD), CosSim/Tau -1~1 → (x + 1) / 2.
+        NaN 메트릭은 중립값 (SBD 0, 나머지 0.5).
+        """
+        sbd_norm = np.where(np.isnan(sbd), 0.0, np.maximum(0.0, 1.0 - sbd))
+        cos_norm = np.where(np.isnan(cos_sim), 0.5, (cos_sim + 1) / 2)
+        tau_norm = np.where(np.isnan(tau), 0.5, (tau + 1) / 2)
+        mda_val = np.where(np.isnan(mda), 0.5, mda)
+
+        return (
             self.weights["MDA"] * mda_val
             + self.weights["SBD"] * sbd_norm
             + self.weights["CosSim"] * cos_norm
             + self.weights["Tau"] * tau_norm
         )
 
-        return {
-            "cws": float(cws),
-            "mda": float(mda) if not np.isnan(mda) else None,
-            "sbd": float(sbd) if not np.isnan(sbd) else None,
-            "cosine_sim": float(cos_sim) if not np.isnan(cos_sim) else None,
-            "kendall_tau": float(tau) if not np.isnan(tau) else None,
-            "kendall_p": float(tau_p) if not np.isnan(tau_p) else None,
-            "lag": lag,
-        }
+    def lag_profile_batch(
+        self,
+        index_batch: np.ndarray,
+        target_batch: np.ndarray,
+        max_lag: int = XCORR_CONFIG["max_lag"],
+    ) -> np.ndarray:
+        """
+        사전 정렬된 (B × n) index/target 묶음의 CWS lag profile (B × L).
+
+        optimal_lag()의 lag별 pandas 정렬 없이 NumPy 한 번에 계산
+        (bootstrap 표본처럼 같은 길이의 배열이 많을 때). NaN 없는 입력 전제.
+        """
+        m = lag_metrics_multi(index_batch, target_batch, max_lag)
+        return self.cws_from_metrics(m["mda"], m["sbd"], m["cosine_sim"], m["kendall_tau"])
 
     def optimal_lag(
         self,
@@ -80,12 +116,18 @@ class CompositeWaveformScore:
         Returns:
             dict with optimal_lag, best_cws, profile (DataFrame)
         """
-        results = []
-        for lag in range(max_lag + 1):
-            r = self.calculate(index, target, lag)
-            results.append(r)
-
-        profile = pd.DataFrame(results)
+        # lag별 calculate() 대신 single-pass 메트릭 profile
+        m = self.metrics.lag_profile(index, target, max_lag)
+        cws = self.cws_from_metrics(
+            m["mda"].values, m["sbd"].values,
+            m["cosine_sim"].values, m["kendall_tau"].values,
+        )
+        profile = pd.DataFrame([
+            self._result_row(c, *row)
+            for c, row in zip(cws, m[[
+                "mda", "sbd", "cosine_sim", "kendall_tau", "kendall_p", "lag",
+            ]].itertuples(index=False))
+        ])
         best_idx = profile["cws"].idxmax()
         best_row = profile.loc[best_idx]
 
@@ -101,6 +143,67 @@ class CompositeWaveformScore:
             "profile": profile,
         }
 
+    def optimal_lag_batch(
+        self,
+        indices: np.ndarray | pd.DataFrame,
+        target: np.ndarray | pd.Series,
+        max_lag: int = XCORR_CONFIG["max_lag"],
+    ) -> dict:
+        """
+        K개 candidate index를 같은 target에 대해 한 번에 채점.
+
+        clip_map 변형, SparsePCA alpha, bootstrap replicate처럼 수백 개
+        index를 같은 log_btc에 맞출 때 — target 쪽 차분·부호·정규화 FFT·순위는
+        한 번만 계산하고 전체 (candidate, lag)를 벡터화 (lag_metrics_multi).
+
+        Args:
+            indices: (K × n) 배열 (target과 같은 위치로 정렬) 또는
+                     DataFrame (열 = candidate, target과 날짜 index로 정렬)
+            target: (n,) 배열 또는 Series
+
+        Returns:
+            dict with cws (K × L), optimal_lag (K,), best_cws (K,),
+            names (DataFrame 입력 시 열 이름)
+        """
+        names = None
+        if isinstance(indices, pd.DataFrame):
+            names = list(indices.columns)
+            cols = [_align(indices[c], target) for c in names]
+            x = np.array([c[0] for c in cols])
+            y = cols[0][1] if cols else np.empty(0)
+        else:
+            x = np.atleast_2d(np.asarray(indices, dtype=float))
+            y = np.asarray(target, dtype=float)
+            if x.shape[1] != len(y):
+                raise ValueError(
+                    f"indices length {x.shape[1]} != target length {len(y)}")
+
+        # target NaN 시점은 모든 candidate에서 제외 (lag 전 정렬 — _align_and_shift와
+        # 다르므로 NaN 있는 target은 candidate별 optimal_lag로)
+        n_lags = max_lag + 1
+        cws = np.empty((len(x), n_lags))
+        clean = ~np.isnan(x).any(axis=1)
+        if np.isnan(y).any():
+            clean[:] = False
+
+        if clean.any():
+            state = _target_lag_state(y, max_lag)
+            m = lag_metrics_multi(x[clean], y, max_lag, state=state)
+            cws[clean] = self.cws_from_metrics(
+                m["mda"], m["sbd"], m["cosine_sim"], m["kendall_tau"])
+
+        for k in np.flatnonzero(~clean):
+            r = self.optimal_lag(pd.Series(x[k]), pd.Series(y), max_lag)
+            cws[k] = r["profile"]["cws"].values
+
+        best = np.argmax(cws, axis=1)
+        return {
+            "cws": cws,
+            "optimal_lag": best,
+            "best_cws": cws[np.arange(len(cws)), best],
+            "names": names,
+        }
+
     def compare_methods(
         self,
         indices: dict[str, pd.Series],
@@ -121,7 +224,7 @@ class CompositeWaveformScore:
         rows = []
         for method_name, idx_series in indices.items():
             result = self.optimal_lag(idx_series, target, max_lag)
-            best = self.calculate(idx_series, target, result["optimal_lag"])
+            best = result["profile"].loc[result["optimal_lag"]]
             rows.append({
                 "method": method_name,
                 "optimal_lag": result["optimal_lag"],
@@ -4,19 +4,154 @@ Index -> BTC: 유의해야 함 (Index가 BTC를 예측)
 BTC -> Index: 기각되어야 함 (역방향 인과 없음)
 """
 
+import inspect
 import logging
 import numpy as np
 import pandas as pd
+from scipy.stats import f as f_dist
 from statsmodels.tsa.stattools import grangercausalitytests, adfuller
 
 from config.constants import GRANGER_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# statsmodels < 0.15는 verbose 기본값이 True (stdout 출력), 0.15는 인자 자체가 없음
+_GRANGER_KWARGS = (
+    {"verbose": False}
+    if "verbose" in inspect.signature(grangercausalitytests).parameters
+    else {}
+)
+
+
+def _lag_matrix(a: np.ndarray, max_lag: int) -> np.ndarray:
+    """(B × T) → (B × T × max_lag), [..., t, j-1] = a[..., t-j] (t < j는 0 — 미사용)"""
+    out = np.zeros(a.shape + (max_lag,))
+    for j in range(1, max_lag + 1):
+        out[:, j:, j - 1] = a[:, :-j]
+    return out
+
+
+def _ols_ssr(design: np.ndarray, rhs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    배치 OLS 잔차제곱합 — design (B × n × k), rhs (B × n × r) → (ssr (B × r), rank (B,)).
+
+    QR 1회로 여러 종속변수 처리. rank 부족 표본은 lstsq (statsmodels pinv와
+    같은 최소제곱 해, df는 rank 기준).
+    """
+    q, r = np.linalg.qr(design)
+    diag = np.abs(np.diagonal(r, axis1=-2, axis2=-1))
+    n, k = design.shape[-2:]
+    full = diag.min(axis=-1) > diag.max(axis=-1) * max(n, k) * np.finfo(float).eps
+
+    resid = rhs - q @ (np.swapaxes(q, -2, -1) @ rhs)
+    ssr = np.sum(resid ** 2, axis=-2)
+    rank = np.full(len(design), k)
+    for b in np.flatnonzero(~full):
+        coef, *_ = np.linalg.lstsq(design[b], rhs[b], rcond=None)
+        ssr[b] = np.sum((rhs[b] - design[b] @ coef) ** 2, axis=0)
+        rank[b] = np.linalg.matrix_rank(design[b])
+    return ssr, rank
+
+
+def granger_bidirectional_ftests(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_lag: int,
+) -> dict:
+    """
+    양방향 Granger ssr F-test, lag 1..max_lag 전체를 한 번에 (B개 표본 배치).
+
+    statsmodels grangercausalitytests의 "ssr_ftest"와 같은 정의:
+    lag p 모형은 t = p..T-1 (nobs = T - p) 구간, 상수항 포함.
+      - lag 설계행렬은 max_lag로 한 번 생성 → lag p는 앞 p개 열·p행 이후 slice
+      - 비제약 모형 [y lags, x lags, 1]은 두 방향이 같은 설계 → QR 1회로
+        y_t, x_t 두 종속변수를 동시에 처리 (lag당 QR 3회, statsmodels는 4회 OLS)
+      - 제약 모형: x→y는 [y lags, 1], y→x는 [x lags, 1]
+
+    lag마다 표본 구간이 달라 (T - p) 공통 구간 nested QR은 쓰지 않음 —
+    statsmodels와 같은 p-value를 유지.
+
+    Args:
+        x, y: (T,) 또는 (B × T) — NaN/inf 없음
+        max_lag: 최대 lag
+
+    Returns:
+        {"x_to_y", "y_to_x"} 각각 {"f_stat", "p_value" (B × max_lag),
+        "df_denom" (B × max_lag), "feasible" (B,)} — statsmodels가
+        InfeasibleTestError를 낼 표본(상수 열, 완전 적합)은 feasible=False, 값 NaN
+
+    Raises:
+        ValueError: NaN/inf 또는 관측치 부족 (T <= 3·max_lag + 1)
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("x contains NaN or inf values.")
+    n_batch, n_obs = x.shape
+    if n_obs <= 3 * max_lag + 1:
+        raise ValueError(
+            "Insufficient observations. Maximum allowable lag is "
+            f"{int((n_obs - 1) / 3) - 1}"
+        )
+
+    lx = _lag_matrix(x, max_lag)
+    ly = _lag_matrix(y, max_lag)
+    out = {
+        d: {
+            "f_stat": np.full((n_batch, max_lag), np.nan),
+            "p_value": np.full((n_batch, max_lag), np.nan),
+            "df_denom": np.zeros((n_batch, max_lag), dtype=int),
+            "feasible": np.ones(n_batch, dtype=bool),
+        }
+        for d in ("x_to_y", "y_to_x")
+    }
+
+    for p in range(1, max_lag + 1):
+        nobs = n_obs - p
+        y_lags = ly[:, p:, :p]
+        x_lags = lx[:, p:, :p]
+        const = np.ones((n_batch, nobs, 1))
+        yt = y[:, p:]
+        xt = x[:, p:]
+
+        joint = np.concatenate([y_lags, x_lags, const], axis=-1)
+        const_col = (joint[..., :-1].max(axis=1) == joint[..., :-1].min(axis=1)).any(axis=-1)
+
+        ssr_u, rank_u = _ols_ssr(joint, np.stack([yt, xt], axis=-1))
+        ssr_ry, _ = _ols_ssr(np.concatenate([y_lags, const], axis=-1), yt[..., None])
+        ssr_rx, _ = _ols_ssr(np.concatenate([x_lags, const], axis=-1), xt[..., None])
+        df = nobs - rank_u
+
+        for d, ssr_r, su, dep in (
+            ("x_to_y", ssr_ry[:, 0], ssr_u[:, 0], yt),
+            ("y_to_x", ssr_rx[:, 0], ssr_u[:, 1], xt),
+        ):
+            tss = np.sum((dep - dep.mean(axis=1, keepdims=True)) ** 2, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                perfect = (tss == 0) | (su == 0) | (su / tss < np.finfo(float).eps)
+                fgc = (ssr_r - su) / su / p * df
+            res = out[d]
+            res["feasible"] &= ~(const_col | perfect)
+            res["f_stat"][:, p - 1] = fgc
+            res["p_value"][:, p - 1] = f_dist.sf(fgc, p, df)
+            res["df_denom"][:, p - 1] = df
+
+    for res in out.values():
+        res["f_stat"][~res["feasible"]] = np.nan
+        res["p_value"][~res["feasible"]] = np.nan
+    return out
+
 
 class GrangerCausalityTest:
     """Bidirectional Granger causality testing."""
 
+    def __init__(self, engine: str = GRANGER_CONFIG["engine"]):
+        # "batch": granger_bidirectional_ftests (양방향 1회)
+        # "statsmodels": grangercausalitytests 방향별 호출
+        if engine not in ("batch", "statsmodels"):
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
+
     def test_bidirectional(
         self,
         index: pd.Series,
@@ -48,15 +183,20 @@ class GrangerCausalityTest:
                 "unidirectional": False,
             }
 
-        # Forward: Index -> BTC (target ~ f(target_lags, index_lags))
-        forward = self._run_granger(
-            idx.values, tgt.values, max_lag, alpha, "Index->BTC"
-        )
+        if self.engine == "batch":
+            forward, reverse = self._run_granger_batch(
+                idx.values, tgt.values, max_lag, alpha,
+            )
+        else:
+            # Forward: Index -> BTC (target ~ f(target_lags, index_lags))
+            forward = self._run_granger(
+                idx.values, tgt.values, max_lag, alpha, "Index->BTC"
+            )
 
-        # Reverse: BTC -> Index
-        reverse = self._run_granger(
-            tgt.values, idx.values, max_lag, alpha, "BTC->Index"
-        )
+            # Reverse: BTC -> Index
+            reverse = self._run_granger(
+                tgt.values, idx.values, max_lag, alpha, "BTC->Index"
+            )
 
         unidirectional = forward["significant"] and not reverse["significant"]
 
@@ -86,9 +226,7 @@ class GrangerCausalityTest:
         data = np.column_stack([effect, cause])
 
         try:
-            results = grangercausalitytests(
-                data, maxlag=max_lag, verbose=False
-            )
+            results = grangercausalitytests(data, maxlag=max_lag, **_GRANGER_KWARGS)
         except Exception as e:
             logger.warning("Granger test failed (%s): %s", label, e)
             return {
@@ -119,6 +257,53 @@ class GrangerCausalityTest:
             "significant": best_p < alpha,
         }
 
+    def _run_granger_batch(
+        self,
+        index: np.ndarray,
+        target: np.ndarray,
+        max_lag: int,
+        alpha: float,
+    ) -> tuple[dict, dict]:
+        """양방향을 granger_bidirectional_ftests 1회로 — (forward, reverse)"""
+        try:
+            res = granger_bidirectional_ftests(index, target, max_lag)
+        except ValueError as e:
+            logger.warning("Granger test failed: %s", e)
+            err = {"significant": False, "error": str(e)}
+            return err, dict(err)
+
+        return (
+            self._summarize(res["x_to_y"], max_lag, alpha, "Index->BTC"),
+            self._summarize(res["y_to_x"], max_lag, alpha, "BTC->Index"),
+        )
+
+    @staticmethod
+    def _summarize(direction: dict, max_lag: int, alpha: float, label: str) -> dict:
+        """엔진 결과 (표본 0) → _run_granger와 같은 dict"""
+        if not direction["feasible"][0]:
+            msg = "The Granger causality test statistic cannot be computed."
+            logger.warning("Granger test failed (%s): %s", label, msg)
+            return {"significant": False, "error": msg}
+
+        lag_results = {}
+        best_p = 1.0
+        best_lag = 1
+
+        for lag in range(1, max_lag + 1):
+            p_value = direction["p_value"][0, lag - 1]
+            lag_results[lag] = float(p_value)
+
+            if p_value < best_p:
+                best_p = p_value
+                best_lag = lag
+
+        return {
+            "lag_results": lag_results,
+            "best_lag": best_lag,
+            "best_p_value": float(best_p),
+            "significant": best_p < alpha,
+        }
+
     @staticmethod
     def stationarity_check(series: pd.Series) -> dict:
         """
@@ -0,0 +1,300 @@
+"""Rolling-window 선행성 분석 — Granger p-value, CWS 최적 lag, MDA의 시간 변화.
+
+N개월 윈도우를 한 달씩 밀면서 각 종료 시점마다:
+  - Granger 양방향 ssr F-test (granger_bidirectional_ftests와 같은 정의)
+  - CWS 최적 lag / best CWS / 해당 lag의 MDA (optimal_lag와 같은 정의)
+
+윈도우마다 처음부터 다시 적합하지 않고 충분통계량을 갱신:
+  - Granger: lag 차수별 Gram 행렬 [lags, 1, y_t, x_t]ᵀ[...] 에 새 행 더하고
+    빠지는 행 빼기 → SSR은 중심화된 부분 Gram의 Schur complement
+  - MDA / CosSim: lag별 부호 일치 수·내적·제곱합 누적기
+  - SBD / Kendall tau: 한 항씩 갱신 불가 (FFT 정규화, 전체 쌍 비교) →
+    모든 윈도우를 쌓아 lag_metrics_multi (행별 target) 한 번에
+누적 오차는 refresh_every 스텝마다 정확 재계산으로 제거.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import f as f_dist
+
+from config.constants import GRANGER_CONFIG, ROLLING_CONFIG, XCORR_CONFIG
+from config.settings import VALIDATION_DIR
+from .composite_score import CompositeWaveformScore
+from .waveform_metrics import lag_metrics_multi
+
+logger = logging.getLogger(__name__)
+
+
+class RollingLeadAnalyzer:
+    """Sliding-window Granger / CWS lead-lag report with incremental updates."""
+
+    # SBD/Kendall 배치 메모리 상한 — lag_metrics_multi (행별 target) 실측 peak는
+    # 윈도우당 ≈ 180 B × n × L (Kendall 정렬 키 ~55%, lag 윈도우·FFT ~45%;
+    # n=60, L=16에서 167 KiB). 윈도우당 시간은 64개 이상이면 배치 크기와 무관.
+    BATCH_BYTES = 64 * 2**20
+    BYTES_PER_WINDOW_POINT = 180
+
+    def __init__(
+        self,
+        window: int = ROLLING_CONFIG["window"],
+        granger_max_lag: int = GRANGER_CONFIG["max_lag"],
+        cws_max_lag: int = XCORR_CONFIG["max_lag"],
+        alpha: float = GRANGER_CONFIG["alpha"],
+        refresh_every: int = ROLLING_CONFIG["refresh_every"],
+    ):
+        if window <= 3 * granger_max_lag + 1:
+            raise ValueError(
+                f"window {window} too short for Granger max_lag {granger_max_lag} "
+                f"(need > {3 * granger_max_lag + 1})"
+            )
+        if window - cws_max_lag < 3:
+            raise ValueError(
+                f"window {window} too short for CWS max_lag {cws_max_lag}")
+        self.window = window
+        self.granger_max_lag = granger_max_lag
+        self.cws_max_lag = cws_max_lag
+        self.alpha = alpha
+        self.refresh_every = max(1, refresh_every)
+        self.cws = CompositeWaveformScore()
+
+    def analyze(self, index: pd.Series, target: pd.Series) -> pd.DataFrame:
+        """
+        Rolling 분석.
+
+        Args:
+            index: liquidity index (날짜 index)
+            target: log10(BTC)
+
+        Returns:
+            DataFrame (index = 윈도우 종료일) with granger_forward_p,
+            granger_forward_lag, granger_reverse_p, granger_reverse_lag,
+            unidirectional, cws_lag, best_cws, mda.
+            Granger 통계량을 계산할 수 없는 윈도우(상수 구간 등)는 p-value NaN.
+        """
+        # test_bidirectional과 같은 정렬·NaN 제거
+        common = index.index.intersection(target.index)
+        idx = index.loc[common].sort_index().dropna()
+        tgt = target.loc[common].sort_index().dropna()
+        common2 = idx.index.intersection(tgt.index)
+        x = idx.loc[common2].values.astype(float)
+        y = tgt.loc[common2].values.astype(float)
+        dates = common2
+
+        n_windows = len(x) - self.window + 1
+        if n_windows < 1:
+            logger.warning(
+                "Insufficient data for rolling analysis: %d points (window=%d)",
+                len(x), self.window,
+            )
+            return pd.DataFrame(columns=[
+                "granger_forward_p", "granger_forward_lag",
+                "granger_reverse_p", "granger_reverse_lag",
+                "unidirectional", "cws_lag", "best_cws", "mda",
+            ])
+
+        fwd_p, rev_p = self._rolling_granger(x, y)
+        cws, mda = self._rolling_cws(x, y)
+
+        f_p, f_lag = self._best_lag(fwd_p)
+        r_p, r_lag = self._best_lag(rev_p)
+        cws_lag = np.argmax(cws, axis=1)
+        rows = np.arange(n_windows)
+
+        result = pd.DataFrame({
+            "granger_forward_p": f_p,
+            "granger_forward_lag": f_lag,
+            "granger_reverse_p": r_p,
+            "granger_reverse_lag": r_lag,
+            "unidirectional": (f_p < self.alpha) & ~(r_p < self.alpha),
+            "cws_lag": cws_lag,
+            "best_cws": cws[rows, cws_lag],
+            "mda": mda[rows, cws_lag],
+        }, index=pd.Index(dates[self.window - 1:], name="date"))
+
+        logger.info(
+            "Rolling (window=%d): %d windows, unidirectional %.0f%%, "
+            "CWS lag median=%d",
+            self.window, n_windows, 100 * result["unidirectional"].mean(),
+            int(np.median(cws_lag)),
+        )
+        return result
+
+    @staticmethod
+    def _best_lag(p: np.ndarray) -> tuple[np.ndarray, pd.arrays.IntegerArray]:
+        """(W × L) p-value → (최소 p, 해당 lag) — 계산 불가 윈도우는 NaN / <NA>"""
+        ok = ~np.isnan(p).all(axis=1)
+        filled = np.where(np.isnan(p), np.inf, p)
+        lag = np.argmin(filled, axis=1) + 1
+        best_p = np.where(ok, filled.min(axis=1), np.nan)
+        return best_p, pd.Series(lag).where(ok).astype("Int64").values
+
+    # ── Granger: lag 차수별 Gram 슬라이딩 ──
+
+    def _rolling_granger(
+        self, x: np.ndarray, y: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(forward p (W × L), reverse p (W × L)) — forward = x→y (Index→BTC)"""
+        n_lag = self.granger_max_lag
+        n_obs = self.window
+        n_windows = len(x) - n_obs + 1
+
+        # F 통계량은 위치·척도 불변 → 전체 표준화로 Gram 조건수 완화
+        xs = (x - x.mean()) / (x.std() or 1.0)
+        ys = (y - y.mean()) / (y.std() or 1.0)
+
+        # 행 t: [y_{t-1..t-L}, x_{t-1..t-L}, 1, y_t, x_t]  (t < j 인 lag는 0 — 미사용)
+        rows = np.zeros((len(x), 2 * n_lag + 3))
+        for j in range(1, n_lag + 1):
+            rows[j:, j - 1] = ys[:-j]
+            rows[j:, n_lag + j - 1] = xs[:-j]
+        rows[:, 2 * n_lag] = 1.0
+        rows[:, 2 * n_lag + 1] = ys
+        rows[:, 2 * n_lag + 2] = xs
+        c_const, c_y, c_x = 2 * n_lag, 2 * n_lag + 1, 2 * n_lag + 2
+
+        # 윈도우별 Gram — 슬라이딩 갱신 (새 행 +, lag p별로 빠지는 행 t = s-1+p −)
+        offsets = np.arange(1, n_lag + 1)
+        grams = np.empty((n_windows, n_lag) + (rows.shape[1],) * 2)
+        for s in range(n_windows):
+            e = s + n_obs - 1
+            if s % self.refresh_every == 0:
+                # lag p 모형은 윈도우 내 t = s+p..e
+                grams[s] = np.stack([rows[s + p:e + 1].T @ rows[s + p:e + 1] for p in offsets])
+            else:
+                old = rows[s - 1 + offsets]
+                grams[s] = (
+                    grams[s - 1]
+                    + np.outer(rows[e], rows[e])[None]
+                    - np.einsum("pi,pj->pij", old, old)
+                )
+
+        # 상수항 열의 Schur complement → 중심화 교차곱 (W × L × d × d)
+        sums = grams[..., c_const, :]
+        cov = grams - sums[..., :, None] * sums[..., None, :] / grams[..., c_const, c_const, None, None]
+
+        fwd = np.full((n_windows, n_lag), np.nan)
+        rev = np.full((n_windows, n_lag), np.nan)
+        for p in offsets:
+            c = cov[:, p - 1]
+            y_lags = list(range(p))
+            x_lags = list(range(n_lag, n_lag + p))
+            ssr_u, ok_u = self._ssr(c, y_lags + x_lags, [c_y, c_x])
+            ssr_ry, ok_ry = self._ssr(c, y_lags, [c_y])
+            ssr_rx, ok_rx = self._ssr(c, x_lags, [c_x])
+            feasible = ok_u & ok_ry & ok_rx
+
+            df = n_obs - p - (2 * p + 1)
+            tss = np.stack([c[:, c_y, c_y], c[:, c_x, c_x]], axis=1)
+            ssr_r = np.concatenate([ssr_ry, ssr_rx], axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                perfect = (tss <= 0) | (ssr_u <= 0) | (ssr_u / tss < np.finfo(float).eps)
+                fgc = (ssr_r - ssr_u) / ssr_u / p * df
+            pv = np.where(perfect | ~feasible[:, None], np.nan, f_dist.sf(fgc, p, df))
+            fwd[:, p - 1], rev[:, p - 1] = pv[:, 0], pv[:, 1]
+
+        # granger_bidirectional_ftests와 같이 한 lag라도 불가능하면 윈도우 전체 NaN
+        for res in (fwd, rev):
+            res[np.isnan(res).any(axis=1)] = np.nan
+        return fwd, rev
+
+    @staticmethod
+    def _ssr(
+        cov: np.ndarray, regs: list[int], deps: list[int],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        중심화 교차곱 (W × d × d) → [regs, 1] 위 deps 회귀 SSR (W × len(deps)).
+
+        상수 regressor / 특이 행렬 윈도우는 feasible=False (InfeasibleTestError 대응).
+        """
+        a = cov[:, regs][:, :, regs]
+        b = cov[:, regs][:, :, deps]
+        diag = np.diagonal(a, axis1=1, axis2=2)
+        scale = np.maximum(np.trace(cov, axis1=1, axis2=2), 1.0)
+        ok = ~(diag <= 1e-10 * scale[:, None]).any(axis=1)
+        a = np.where(ok[:, None, None], a, np.eye(len(regs)))
+
+        try:
+            coef = np.linalg.solve(a, b)
+        except np.linalg.LinAlgError:
+            coef = np.zeros_like(b)
+            for w in range(len(a)):
+                try:
+                    coef[w] = np.linalg.solve(a[w], b[w])
+                except np.linalg.LinAlgError:
+                    ok[w] = False
+        dd = np.diagonal(cov[:, deps][:, :, deps], axis1=1, axis2=2)
+        return dd - np.sum(b * coef, axis=1), ok
+
+    # ── CWS: MDA/CosSim 누적기 + SBD/Kendall 배치 ──
+
+    def _rolling_cws(
+        self, x: np.ndarray, y: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(cws (W × K), mda (W × K)) — lag 0..cws_max_lag"""
+        n = self.window
+        n_windows = len(x) - n + 1
+        lags = np.arange(self.cws_max_lag + 1)
+        n_lags = len(lags)
+
+        dx = np.diff(x)
+        dy = np.diff(y)
+        sx = np.sign(dx)
+        sy = np.sign(dy)
+
+        # lag k 항 i: (dx[i], dy[i+k]), 윈도우 [s, e]에서 i ∈ [s, e-k-1]
+        def term(i, k):
+            return (
+                (sx[i] == sy[i + k]).astype(float),
+                dx[i] * dy[i + k],
+                dx[i] ** 2,
+                dy[i + k] ** 2,
+            )
+
+        mda = np.full((n_windows, n_lags), np.nan)
+        cos = np.full((n_windows, n_lags), np.nan)
+        acc = np.zeros((4, n_lags))
+        count = n - 1 - lags  # 윈도우당 항 수 (= 유효 포인트 - 1)
+        valid = count + 1 >= 3
+
+        for s in range(n_windows):
+            e = s + n - 1
+            if s % self.refresh_every == 0:
+                for k in lags:
+                    i = np.arange(s, e - k)
+                    acc[:, k] = [t.sum() for t in term(i, k)]
+            else:
+                acc += np.array(term(e - lags - 1, lags))
+                acc -= np.array(term(np.full(n_lags, s - 1), lags))
+
+            agree, dot, sxx, syy = acc
+            mda[s] = np.where(valid, agree / count, np.nan)
+            nx = np.sqrt(np.maximum(sxx, 0.0))
+            ny = np.sqrt(np.maximum(syy, 0.0))
+            ok = (nx >= 1e-10) & (ny >= 1e-10)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cos[s] = np.where(valid, np.where(ok, dot / (nx * ny), 0.0), np.nan)
+
+        # SBD / Kendall: 윈도우 (W × n)을 쌓아 배치 계산
+        xw = np.lib.stride_tricks.sliding_window_view(x, n)
+        yw = np.lib.stride_tricks.sliding_window_view(y, n)
+        sbd = np.empty((n_windows, n_lags))
+        tau = np.empty((n_windows, n_lags))
+        batch = max(1, self.BATCH_BYTES // (self.BYTES_PER_WINDOW_POINT * n * n_lags))
+        for b0 in range(0, n_windows, batch):
+            b1 = min(b0 + batch, n_windows)
+            m = lag_metrics_multi(xw[b0:b1], yw[b0:b1], self.cws_max_lag)
+            sbd[b0:b1] = m["sbd"]
+            tau[b0:b1] = m["kendall_tau"]
+
+        return self.cws.cws_from_metrics(mda, sbd, cos, tau), mda
+
+    def export(self, result: pd.DataFrame, path: str | Path | None = None) -> Path:
+        """Rolling 결과 CSV 저장 (기본: VALIDATION_DIR/rolling_lead.csv)"""
+        path = Path(path) if path else Path(VALIDATION_DIR) / "rolling_lead.csv"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        result.to_csv(path)
+        logger.info("Rolling lead report saved → %s", path)
+        return path
@@ -6,25 +6,29 @@ Stage 2: 인덱스와 log10(BTC)의 방향 일치도를 다각도로 측정.
 import logging
 import numpy as np
 import pandas as pd
+from scipy.special import ndtr
 from scipy.stats import kendalltau
 
 logger = logging.getLogger(__name__)
 
 
-def _align_and_shift(
+def _align(
     index: pd.Series,
     target: pd.Series,
-    lag: int,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Align two series and apply lag shift, return numpy arrays."""
-    # Align on common dates first
+    """Align two series on common dates, return numpy arrays (NaN kept)."""
     common = index.index.intersection(target.index)
     idx = index.loc[common].sort_index()
     tgt = target.loc[common].sort_index()
+    return idx.values.astype(float), tgt.values.astype(float)
 
-    idx_vals = idx.values.astype(float)
-    tgt_vals = tgt.values.astype(float)
 
+def _shift(
+    idx_vals: np.ndarray,
+    tgt_vals: np.ndarray,
+    lag: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Apply lag shift to aligned arrays and drop NaN pairs."""
     if lag > 0:
         # index leads target by `lag` periods
         idx_vals = idx_vals[:-lag]
@@ -38,6 +42,474 @@ def _align_and_shift(
     return idx_vals[mask], tgt_vals[mask]
 
 
+def _align_and_shift(
+    index: pd.Series,
+    target: pd.Series,
+    lag: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Align two series and apply lag shift, return numpy arrays."""
+    return _shift(*_align(index, target), lag)
+
+
+def _lagged_windows(a: np.ndarray, n_lags: int, fill: float = 0.0) -> np.ndarray:
+    """
+    (n_lags × len(a)) 행렬 — k행 = a[k:] 뒤를 fill로 채운 것.
+    a가 (K × n)이면 행별로 (K × n_lags × n).
+
+    x[:n-k]와 a[k:]의 쌍별 연산을 전체 lag에 대해 한 번에 하기 위한 view.
+    """
+    n = a.shape[-1]
+    padded = np.concatenate([a, np.full(a.shape[:-1] + (n_lags - 1,), fill)], axis=-1)
+    return np.lib.stride_tricks.sliding_window_view(padded, n, axis=-1)[..., :n_lags, :]
+
+
+def _lag_dot(a: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """(K × n) a · lag 윈도우 → (K × L) — windows는 공통 (L × n) 또는 행별 (K × L × n)"""
+    if windows.ndim == 2:
+        return a @ windows.T
+    return np.einsum("ki,kli->kl", a, windows)
+
+
+def _window_sums(a: np.ndarray, n_lags: int, head: bool) -> np.ndarray:
+    """lag k별 합 (마지막 축): head=True면 sum(a[..., :n-k]), False면 sum(a[..., k:])"""
+    c = np.concatenate([np.zeros(a.shape[:-1] + (1,)), np.cumsum(a, axis=-1)], axis=-1)
+    n = a.shape[-1]
+    k = np.minimum(np.arange(n_lags), n)
+    return c[..., n - k] if head else c[..., [n]] - c[..., k]
+
+
+def _normalize_windows(a: np.ndarray, m: np.ndarray, inside: np.ndarray) -> np.ndarray:
+    """
+    앞쪽 정렬·0 패딩된 (... × L × n) lag 윈도우를 WaveformMetrics.sbd와 같이
+    zero mean / unit energy로 정규화 (패딩 위치는 0 유지).
+    """
+    a = np.where(inside, a - (a.sum(axis=-1) / m)[..., None], 0.0)
+    norm = np.sqrt(np.sum(a ** 2, axis=-1, keepdims=True))
+    return np.where(norm < 1e-10, a, a / np.where(norm < 1e-10, 1.0, norm))
+
+
+def _target_lag_state(y: np.ndarray, max_lag: int) -> dict:
+    """
+    lag=0..max_lag 메트릭의 target 쪽 사전 계산 — candidate가 몇 개든 1회.
+
+    lag k의 target 윈도우 y[k:]에 대해 차분·부호 윈도우, 차분 norm,
+    SBD용 정규화 윈도우의 FFT, Kendall용 dense rank.
+    y가 (K × n)이면 (bootstrap 표본, rolling 윈도우처럼 candidate마다
+    target이 다를 때) 모든 항목에 행 축이 붙는다.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.shape[-1]
+    n_lags = max_lag + 1
+    m = n - np.arange(n_lags)
+    m_safe = np.maximum(m, 1).astype(float)
+    inside = np.arange(n)[None, :] < m[:, None]
+
+    dy = np.diff(y, axis=-1)
+    fft_size = 2 ** int(np.ceil(np.log2(max(2 * n - 1, 1))))
+    yw = np.where(inside, _lagged_windows(y, n_lags), 0.0)
+    return {
+        "y": y,
+        "n": n,
+        "max_lag": max_lag,
+        "m": m,
+        "m_safe": m_safe,
+        "valid": m >= 3,
+        "inside": inside,
+        "dy_windows": _lagged_windows(dy, n_lags),
+        "sign_windows": _lagged_windows(np.sign(dy), n_lags, fill=np.nan),
+        "dy_norm": np.sqrt(np.maximum(_window_sums(dy ** 2, n_lags, head=False), 0.0)),
+        "fft_size": fft_size,
+        "fft_conj": np.conj(np.fft.rfft(
+            _normalize_windows(yw, m_safe, inside), fft_size, axis=-1)),
+        "ranks": _dense_rank(y),
+    }
+
+
+def lag_metrics_multi(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_lag: int,
+    state: dict | None = None,
+    with_tau: bool = True,
+) -> dict[str, np.ndarray]:
+    """
+    K개 candidate index × target의 lag=0..max_lag MDA/SBD/CosSim/Kendall tau.
+
+    WaveformMetrics의 lag별 정의와 같음 (x[:, :n-k] vs y[k:]). target 쪽
+    차분·부호·정규화 FFT·순위는 _target_lag_state로 한 번만 계산하고,
+    candidate 쪽은 lag 윈도우 행렬곱 / 누적합 / 배치 rfft로 전체 lag를 한 번에.
+    target은 공통 1개 (n,) 또는 행별 (K × n) — 후자는 사전 정렬된
+    (index, target) 쌍 묶음 (bootstrap 표본, rolling 윈도우).
+
+    Args:
+        x: (K × n) candidate index 값 — NaN 없음, y와 같은 위치로 정렬
+        y: (n,) 공통 target 또는 (K × n) 행별 target — NaN 없음
+        max_lag: 최대 lag
+        state: 같은 y·max_lag로 만든 _target_lag_state (반복 호출 시 재사용)
+        with_tau: False면 kendall_tau 생략 (NaN)
+
+    Returns:
+        {"mda", "sbd", "cosine_sim", "kendall_tau"} — 각 (K × L),
+        유효 포인트 3개 미만인 lag는 NaN
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    st = state if state is not None else _target_lag_state(y, max_lag)
+    n_cand, n = x.shape
+    n_lags = max_lag + 1
+    per_row = st["y"].ndim == 2
+    if per_row and st["y"].shape != x.shape:
+        raise ValueError(f"target shape {st['y'].shape} != index shape {x.shape}")
+    keys = ("mda", "sbd", "cosine_sim", "kendall_tau")
+    if n < 3:
+        return {k: np.full((n_cand, n_lags), np.nan) for k in keys}
+    m, valid = st["m"], st["valid"]
+
+    # MDA: 부호 일치 수 = Σ_s 1[sign dx = s] · 1[sign dy = s] (lag 윈도우 행렬곱)
+    dx = np.diff(x, axis=1)
+    sdx = np.sign(dx)
+    eq = sum(
+        _lag_dot((sdx == s).astype(float), (st["sign_windows"] == s).astype(float))
+        for s in (-1.0, 0.0, 1.0)
+    )
+    mda = eq / np.maximum(m - 1, 1)
+
+    # CosSim on derivatives
+    dot = _lag_dot(dx, st["dy_windows"])
+    ndx = np.sqrt(np.maximum(_window_sums(dx ** 2, n_lags, head=True), 0.0))
+    ndy = st["dy_norm"]
+    flat = (ndx < 1e-10) | (ndy < 1e-10)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos = np.where(flat, 0.0, dot / (ndx * ndy))
+
+    # SBD: candidate 윈도우 (K × L × n) 정규화 → rfft, target FFT는 재사용
+    # FFT 크기 ≥ 2n-1이면 선형 상호상관이므로 모든 lag를 한 크기로 처리
+    inside = st["inside"]
+    sbd = np.empty((n_cand, n_lags))
+    chunk = max(1, 4_000_000 // (n_lags * st["fft_size"]))
+    for s in range(0, n_cand, chunk):
+        xw = np.where(inside, x[s:s + chunk, None, :], 0.0)
+        fx = np.fft.rfft(
+            _normalize_windows(xw, st["m_safe"], inside), st["fft_size"], axis=-1)
+        fy = st["fft_conj"][s:s + chunk] if per_row else st["fft_conj"]
+        cc = np.fft.irfft(fx * fy, st["fft_size"], axis=-1)
+        sbd[s:s + chunk] = 1.0 - np.max(cc, axis=-1)
+
+    if not with_tau:
+        tau = np.full((n_cand, n_lags), np.nan)
+    elif n <= KENDALL_BATCH_MAX_N:
+        tau = _kendall_tau_b(_kendall_counts(_dense_rank(x), st["ranks"], max_lag))
+    else:
+        ys = st["y"] if per_row else np.broadcast_to(st["y"], x.shape)
+        tau = np.array([kendall_tau_lags(xr, yr, max_lag)[0] for xr, yr in zip(x, ys)])
+
+    out = {"mda": mda, "sbd": sbd, "cosine_sim": cos, "kendall_tau": tau}
+    for k in keys:
+        out[k] = np.where(valid, out[k], np.nan)
+    return out
+
+
+def lag_profile_arrays(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_lag: int,
+) -> dict[str, np.ndarray]:
+    """
+    정렬된 index/target 배열 1쌍의 lag=0..max_lag 전체 메트릭 (single pass).
+
+    정렬·차분은 한 번만, Pearson은 누적합 + lag 윈도우 행렬곱,
+    MDA/SBD/CosSim/Kendall은 lag_metrics_multi (K=1), Kendall p-value는
+    kendall_tau_lags. NaN이 있으면 lag마다 NaN 쌍 제거 후 차분해야 하므로
+    lag별로 계산 (_align_and_shift와 동일 정의).
+
+    Returns:
+        {"pearson_r", "mda", "sbd", "cosine_sim", "kendall_tau", "kendall_p"}
+        — 각 (max_lag + 1,), 유효 포인트 3개 미만인 lag는 NaN
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n_lags = max_lag + 1
+    keys = ("pearson_r", "mda", "sbd", "cosine_sim", "kendall_tau", "kendall_p")
+
+    if np.isnan(x).any() or np.isnan(y).any():
+        out = {k: np.full(n_lags, np.nan) for k in keys}
+        for lag in range(n_lags):
+            r = lag_profile_arrays(*_shift(x, y, lag), 0)
+            for k in keys:
+                out[k][lag] = r[k][0]
+        return out
+
+    n = len(x)
+    m = n - np.arange(n_lags)                  # lag별 포인트 수
+    valid = m >= 3
+    if not valid.any():
+        return {k: np.full(n_lags, np.nan) for k in keys}
+    m_safe = np.maximum(m, 1).astype(float)
+
+    # Pearson: 윈도우 합·제곱합(누적합) + 교차곱(lag 윈도우 행렬 1회)
+    xc = x - x.mean()
+    yc = y - y.mean()
+    sx = _window_sums(xc, n_lags, head=True)
+    sy = _window_sums(yc, n_lags, head=False)
+    vx = _window_sums(xc ** 2, n_lags, head=True) - sx ** 2 / m_safe
+    vy = _window_sums(yc ** 2, n_lags, head=False) - sy ** 2 / m_safe
+    cov = _lagged_windows(yc, n_lags) @ xc - sx * sy / m_safe
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pearson = cov / np.sqrt(vx * vy)
+
+    multi = lag_metrics_multi(x[None, :], y, max_lag, with_tau=False)
+    tau, tau_p = kendall_tau_lags(x, y, max_lag)
+
+    out = {
+        "pearson_r": pearson,
+        "mda": multi["mda"][0],
+        "sbd": multi["sbd"][0],
+        "cosine_sim": multi["cosine_sim"][0],
+        "kendall_tau": tau,
+        "kendall_p": tau_p,
+    }
+    for k in keys:
+        out[k] = np.where(valid, out[k], np.nan)
+    return out
+
+
+def _dense_rank(a: np.ndarray) -> np.ndarray:
+    """마지막 축 기준 dense rank (0부터) — 정렬 1회, lag 윈도우 순서 비교에 재사용"""
+    a = np.asarray(a)
+    order = np.argsort(a, axis=-1, kind="stable")
+    srt = np.take_along_axis(a, order, axis=-1)
+    steps = np.concatenate(
+        [np.zeros(a.shape[:-1] + (1,), dtype=np.int64),
+         np.cumsum(srt[..., 1:] != srt[..., :-1], axis=-1)],
+        axis=-1,
+    )
+    ranks = np.empty(a.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, steps, axis=-1)
+    return ranks
+
+
+def _segment_inversions(
+    seq: np.ndarray,
+    seg: np.ndarray,
+    pos: np.ndarray,
+    n_segments: int,
+) -> np.ndarray:
+    """
+    구간별 역전 쌍 수 — i < j, seq[i] > seq[j] (strict).
+
+    Bottom-up merge sort를 모든 구간에 동시에: 폭 w마다 (구간, 블록, 값,
+    run) 키를 정렬해 두 run을 병합 (같은 값이면 왼쪽 run이 앞). 병합 순서에서
+    오른쪽 원소 뒤에 오는 왼쪽 원소 수 = 그보다 큰 왼쪽 값의 수.
+    패스 log2(n)회, 패스당 O(N log N).
+    """
+    seq = seq.astype(np.int64)
+    n_vals = int(seq.max()) + 1 if len(seq) else 1
+    max_len = int(pos.max()) + 1 if len(pos) else 0
+    inv = np.zeros(n_segments, dtype=np.int64)
+    if max_len < 2:
+        return inv
+
+    # 구간은 연속 배치 — 원소별 구간 시작/마지막 전역 위치
+    start = np.arange(len(pos)) - pos
+    bounds = np.flatnonzero(pos == 0)
+    lens = np.diff(np.r_[bounds, len(pos)])
+    last = np.repeat(bounds + lens - 1, lens)
+    present = seg[bounds]
+
+    w = 1
+    while w < max_len:
+        half = pos % (2 * w) >= w
+        block_start = start + pos - pos % (2 * w)
+        # 최하위 비트 = 오른쪽 run 여부 → 같은 값이면 왼쪽 run이 앞
+        key = ((block_start * n_vals + seq) << 1) | half
+        key.sort()                              # 값 정렬이라 stable 불필요 (SIMD quicksort)
+
+        is_left = (key & 1) == 0
+        left_cum = np.cumsum(is_left)
+        # 병합 후 오른쪽 원소 뒤에 있는 같은 블록의 왼쪽 원소 수
+        block_last = np.minimum(block_start + 2 * w - 1, last)
+        behind = np.where(is_left, 0, left_cum[block_last] - left_cum)
+        inv[present] += np.add.reduceat(behind, bounds)
+
+        seq = (key >> 1) - block_start * n_vals
+        w *= 2
+    return inv
+
+
+def _tie_stats(counts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(... × V) 동점 그룹 크기 → (tie 쌍 수, Σc(c-1)(c-2), Σc(c-1)(2c+5))"""
+    c = counts.astype(np.int64)
+    return (
+        (c * (c - 1) // 2).sum(axis=-1),
+        (c * (c - 1) * (c - 2)).sum(axis=-1),
+        (c * (c - 1) * (2 * c + 5)).sum(axis=-1),
+    )
+
+
+def _kendall_counts(rx: np.ndarray, ry: np.ndarray, max_lag: int) -> dict:
+    """
+    Kendall tau 충분통계량 — K개 x 순위 × lag=0..max_lag, 윈도우 x[:n-k] vs y[k:].
+
+    모든 (candidate, lag) 윈도우를 이어 붙여 (구간, x rank, y rank) 키 하나로
+    정렬 (x 오름차순, x 동점 내 y 오름차순 — scipy와 같은 순서) 후
+    구간별 merge-sort 역전 수 = discordant 쌍.
+
+    Args:
+        rx: (K × n) candidate별 dense rank
+        ry: (n,) 공통 target dense rank, 또는 (K × n) candidate별 target rank
+
+    Returns:
+        m (L,), dis/ntie/xtie/x0/x1 (K × L),
+        ytie/y0/y1 (L,) — ry가 (K × n)이면 (K × L)
+    """
+    n_cand, n = rx.shape
+    n_lags = max_lag + 1
+    m = np.maximum(n - np.arange(n_lags), 0)
+    lags = np.flatnonzero(m > 0)
+    vx = int(rx.max()) + 1 if rx.size else 1
+    vy = int(ry.max()) + 1 if ry.size else 1
+    per_cand_y = ry.ndim == 2
+
+    # candidate 1개분 윈도우 배치: lag, 윈도우 내 위치
+    lag_of = np.repeat(lags, m[lags])
+    pos1 = np.arange(len(lag_of)) - np.repeat(np.cumsum(m[lags]) - m[lags], m[lags])
+
+    n_seg = n_cand * n_lags
+    seg = (np.arange(n_cand)[:, None] * n_lags + lag_of[None, :]).ravel()
+    pos = np.tile(pos1, n_cand)
+    wx = rx[:, pos1].ravel()
+    if per_cand_y:
+        wy = ry[:, pos1 + lag_of].ravel()
+    else:
+        wy1 = ry[pos1 + lag_of]
+        wy = np.tile(wy1, n_cand)
+
+    key = (seg * vx + wx) * vy + wy
+    order = np.argsort(key, kind="stable")
+    dis = _segment_inversions(wy[order], seg, pos, n_seg)
+
+    key = key[order]
+    run_start = np.r_[True, key[1:] != key[:-1]]
+    run_len = np.diff(np.r_[np.flatnonzero(run_start), len(key)])
+    ntie = np.bincount(
+        seg[run_start], weights=run_len * (run_len - 1) // 2, minlength=n_seg,
+    ).astype(np.int64)
+
+    xtie, x0, x1 = _tie_stats(
+        np.bincount(seg * vx + wx, minlength=n_seg * vx).reshape(n_seg, vx))
+    shape = (n_cand, n_lags)
+    if per_cand_y:
+        ytie, y0, y1 = (a.reshape(shape) for a in _tie_stats(
+            np.bincount(seg * vy + wy, minlength=n_seg * vy).reshape(n_seg, vy)))
+    else:
+        ytie, y0, y1 = _tie_stats(
+            np.bincount(lag_of * vy + wy1, minlength=n_lags * vy).reshape(n_lags, vy))
+
+    return {
+        "m": m,
+        "dis": dis.reshape(shape),
+        "ntie": ntie.reshape(shape),
+        "xtie": xtie.reshape(shape),
+        "x0": x0.reshape(shape),
+        "x1": x1.reshape(shape),
+        "ytie": ytie,
+        "y0": y0,
+        "y1": y1,
+    }
+
+
+def _kendall_tau_b(c: dict) -> np.ndarray:
+    """_kendall_counts → tau-b (K × L), scipy와 같은 산술·예외 (전부 동점이면 NaN)"""
+    m = c["m"]
+    tot = m * (m - 1) // 2
+    undefined = (c["xtie"] == tot) | (c["ytie"] == tot)
+    con_minus_dis = tot - c["xtie"] - c["ytie"] + c["ntie"] - 2 * c["dis"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = con_minus_dis / np.sqrt(tot - c["xtie"]) / np.sqrt(tot - c["ytie"])
+    return np.where(undefined, np.nan, np.clip(tau, -1.0, 1.0))
+
+
+# kendall_tau_lags(method="auto"): 이보다 길면 scipy lag별 호출이 더 빠름
+# (scripts/bench_kendall.py, max_lag=15: n=500 1.8x, n=700 1.2x, n=900 0.9x,
+#  n=2600 0.5x — scipy의 컴파일된 merge-sort가 lag마다 O(n log n))
+KENDALL_BATCH_MAX_N = 700
+
+
+def kendall_tau_lags(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_lag: int,
+    method: str = "auto",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    lag=0..max_lag 전체의 Kendall tau-b와 p-value — x[:n-k] vs y[k:].
+
+    scipy.stats.kendalltau를 lag마다 부르는 것과 같은 값:
+      - 정렬: x, y 각각 전체 dense rank 1회 → 모든 lag의 윈도우를
+        (lag, x rank, y rank) 키 하나로 한 번에 정렬
+      - discordant 쌍: 모든 lag 동시 merge-sort 역전 수 (_segment_inversions)
+      - 동점 통계: (lag × rank) bincount
+      - p-value: scipy와 같은 분기·식 (동점 없고 n ≤ 33 등 exact 조건이면
+        해당 lag만 scipy 호출)
+
+    lag 간에는 쌍 자체가 바뀌므로 (x_i, y_{i+k}) 증분 갱신은 불가 — 공유하는
+    것은 순위 구조와 한 번의 배치 처리. 호출 오버헤드가 지배하는 월간 길이
+    (n ≤ KENDALL_BATCH_MAX_N)에서만 유리하다. 일간 길이 (~2,500)는
+    method="auto"에서 기존과 같은 scipy lag별 호출 — 이 함수로 빨라지지 않는다.
+
+    Args:
+        x, y: 같은 길이의 정렬된 배열 — NaN 없음
+        method: "auto" | "batch" | "scipy"
+
+    Returns:
+        (tau, p) — 각 (max_lag + 1,), 계산 불가 lag는 NaN
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    n_lags = max_lag + 1
+    tau = np.full(n_lags, np.nan)
+    tau_p = np.full(n_lags, np.nan)
+
+    m = np.maximum(n - np.arange(n_lags), 0)
+    lags = np.flatnonzero(m > 0)
+    if len(lags) == 0:
+        return tau, tau_p
+
+    if method == "auto":
+        method = "batch" if n <= KENDALL_BATCH_MAX_N else "scipy"
+    if method == "scipy":
+        for lag in lags:
+            tau[lag], tau_p[lag] = kendalltau(x[:m[lag]], y[lag:])
+        return tau, tau_p
+    if method != "batch":
+        raise ValueError(f"Unknown method: {method}")
+
+    c = _kendall_counts(_dense_rank(x)[None, :], _dense_rank(y), max_lag)
+    tau = _kendall_tau_b(c)[0]
+
+    for lag in lags:
+        size = int(m[lag])
+        if np.isnan(tau[lag]):
+            continue
+        # scipy와 같은 산술 (Python int → 큰 곱에서도 동일한 반올림)
+        xt, yt, d = int(c["xtie"][0, lag]), int(c["ytie"][lag]), int(c["dis"][0, lag])
+        tot = size * (size - 1) // 2
+        con_minus_dis = tot - xt - yt + int(c["ntie"][0, lag]) - 2 * d
+
+        if xt == 0 and yt == 0 and (size <= 33 or min(d, tot - d) <= 1):
+            tau_p[lag] = kendalltau(x[:size], y[lag:lag + size]).pvalue
+            continue
+
+        mm = size * (size - 1.)
+        var = ((mm * (2 * size + 5) - int(c["x1"][0, lag]) - int(c["y1"][lag])) / 18
+               + (2 * xt * yt) / mm
+               + int(c["x0"][0, lag]) * int(c["y0"][lag]) / (9 * mm * (size - 2)))
+        z = con_minus_dis / np.sqrt(var)
+        tau_p[lag] = 2 * ndtr(-abs(z))
+
+    return tau, tau_p
+
+
 class WaveformMetrics:
     """Computes direction-matching metrics between index and BTC."""
 
@@ -169,6 +641,22 @@ class WaveformMetrics:
 
         return float(np.corrcoef(idx_vals, tgt_vals)[0, 1])
 
+    def lag_profile(
+        self,
+        index: pd.Series,
+        target: pd.Series,
+        max_lag: int = 15,
+    ) -> pd.DataFrame:
+        """
+        All metrics at lag=0..max_lag in a single pass (no logging).
+
+        Returns:
+            DataFrame[lag, pearson_r, mda, sbd, cosine_sim,
+                       kendall_tau, kendall_p]
+        """
+        m = lag_profile_arrays(*_align(index, target), max_lag)
+        return pd.DataFrame({"lag": np.arange(max_lag + 1), **m})
+
     def cross_correlation_profile(
         self,
         index: pd.Series,
@@ -182,21 +670,7 @@ class WaveformMetrics:
             DataFrame[lag, pearson_r, mda, sbd, cosine_sim,
                        kendall_tau, kendall_p]
         """
-        rows = []
-        for lag in range(max_lag + 1):
-            tau, tau_p = self.kendall_tau(index, target, lag)
-            rows.append({
-                "lag": lag,
-                "pearson_r": self.pearson_r(index, target, lag),
-                "mda": self.mda(index, target, lag),
-                "sbd": self.sbd(index, target, lag),
-                "cosine_sim": self.cosine_similarity_derivatives(
-                    index, target, lag),
-                "kendall_tau": tau,
-                "kendall_p": tau_p,
-            })
-
-        profile = pd.DataFrame(rows)
+        profile = self.lag_profile(index, target, max_lag)
 
         # Check success criteria
         all_positive = bool((profile["pearson_r"] > 0).all())
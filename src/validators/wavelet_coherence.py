@@ -1,18 +1,46 @@
 """Wavelet Coherence — 시간-주파수 방향 분석.
 
 "어떤 주기(frequency)에서 선행(lead)하는가?" 분석.
+
+engine="cached": PCA/ICA/SparsePCA/DFM·clip 변형을 같은 log_btc와 비교할 때
+target 쪽 CWT 계수·평활 power·AR(1)은 (정렬된 target, scale 파라미터) 키로
+캐시하고 index 쪽 CWT만 새로 계산. Monte Carlo 유의수준은 (AR(1) 구간, scale
+집합)당 1회. 결과는 pycwt.wct와 같음.
 """
 
+import hashlib
 import logging
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
+from config.constants import WAVELET_CONFIG
+
 logger = logging.getLogger(__name__)
 
 
 class WaveletCoherenceAnalyzer:
     """Wavelet coherence analysis between index and BTC."""
 
+    # 프로세스 공유 캐시 (Stage 2는 method마다 새 인스턴스 생성)
+    _target_cache: OrderedDict = OrderedDict()
+    _significance_cache: dict = {}
+
+    def __init__(
+        self,
+        engine: str = WAVELET_CONFIG["engine"],
+        dj: float = WAVELET_CONFIG["dj"],
+        significance_level: float = WAVELET_CONFIG["significance_level"],
+        cache_size: int = WAVELET_CONFIG["cache_size"],
+    ):
+        if engine not in ("cached", "pycwt"):
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
+        self.dj = dj
+        self.significance_level = significance_level
+        self.cache_size = cache_size
+
     def analyze(
         self,
         index: pd.Series,
@@ -50,14 +78,18 @@ class WaveletCoherenceAnalyzer:
         y = (y - y.mean()) / y.std()
 
         try:
-            WCT, aWCT, coi, freqs, sig = pycwt.wct(
-                x, y, dt,
-                dj=1/12,
-                s0=-1,
-                J=-1,
-                significance_level=0.95,
-                normalize=True,
-            )
+            if self.engine == "cached":
+                WCT, aWCT, coi, freqs, sig = self._wct_cached(
+                    pycwt, x, y, dt, tgt.index)
+            else:
+                WCT, aWCT, coi, freqs, sig = pycwt.wct(
+                    x, y, dt,
+                    dj=self.dj,
+                    s0=-1,
+                    J=-1,
+                    significance_level=self.significance_level,
+                    normalize=True,
+                )
         except Exception as e:
             logger.error("Wavelet coherence computation failed: %s", e)
             return {"error": str(e), "available": True}
@@ -95,6 +127,92 @@ class WaveletCoherenceAnalyzer:
             "n_observations": len(x),
         }
 
+    def _wct_cached(
+        self,
+        pycwt,
+        x: np.ndarray,
+        y: np.ndarray,
+        dt: float,
+        dates: pd.Index,
+    ) -> tuple:
+        """
+        pycwt.wct(x, y, dt, normalize=True)와 같은 (WCT, aWCT, coi, freqs, sig).
+
+        target (y) 쪽 CWT 계수 W2, 평활 power S2, AR(1)은 캐시에서 재사용.
+        """
+        mother = pycwt.Morlet()
+        n = len(x)
+        s0 = 2 * dt / mother.flambda()
+        J = int(np.round(np.log2(n * dt / s0) / self.dj))
+        kwargs = dict(dj=self.dj, s0=s0, J=J, wavelet=mother)
+
+        key = (self._series_key(y, dates), dt, self.dj, J)
+        entry = self._target_cache.get(key)
+        if entry is None:
+            W2, sj, freqs, coi, _, _ = pycwt.cwt(self._normalize(y), dt, **kwargs)
+            scales = np.ones([1, n]) * sj[:, None]
+            entry = {
+                "W": W2,
+                "sj": sj,
+                "freqs": freqs,
+                "coi": coi,
+                "S": mother.smooth(np.abs(W2) ** 2 / scales, dt, self.dj, sj),
+                "ar1": pycwt.ar1(y)[0],
+            }
+            self._target_cache[key] = entry
+            while len(self._target_cache) > self.cache_size:
+                self._target_cache.popitem(last=False)
+        else:
+            self._target_cache.move_to_end(key)
+            logger.debug("Wavelet: target CWT cache hit (n=%d, J=%d)", n, J)
+
+        sj = entry["sj"]
+        W1, _, _, _, _, _ = pycwt.cwt(self._normalize(x), dt, **kwargs)
+        scales = np.ones([1, n]) * sj[:, None]
+        S1 = mother.smooth(np.abs(W1) ** 2 / scales, dt, self.dj, sj)
+
+        W12 = W1 * entry["W"].conj()
+        S12 = mother.smooth(W12 / scales, dt, self.dj, sj)
+        WCT = np.abs(S12) ** 2 / (S1 * entry["S"])
+        aWCT = np.angle(W12)
+
+        sig = self._significance(
+            pycwt, pycwt.ar1(x)[0], entry["ar1"], dt, s0, J, mother)
+        return WCT, aWCT, entry["coi"], entry["freqs"], sig
+
+    def _significance(self, pycwt, al1, al2, dt, s0, J, mother) -> np.ndarray:
+        """
+        wct_significance 메모이즈 — pycwt 디스크 캐시와 같은 AR(1) 구간 키
+        (round(arctanh(4a))) + scale 집합 + 유의수준.
+        """
+        with np.errstate(invalid="ignore"):
+            aa = np.round(np.arctanh(np.array([al1, al2]) * 4))
+        aa = np.abs(aa) + 0.5 * (aa < 0)
+        # |4a| >= 1 이면 pycwt 키도 nan (같은 캐시 파일 공유) — dict 키로는 None
+        key = (
+            *(None if np.isnan(v) else float(v) for v in aa),
+            self.dj, s0 / dt, J, mother.name, self.significance_level,
+        )
+        if key not in self._significance_cache:
+            self._significance_cache[key] = pycwt.wct_significance(
+                al1, al2, dt=dt, dj=self.dj, s0=s0, J=J,
+                significance_level=self.significance_level,
+                wavelet=mother,
+            )
+        return self._significance_cache[key]
+
+    @staticmethod
+    def _normalize(a: np.ndarray) -> np.ndarray:
+        """wct(normalize=True)의 입력 정규화"""
+        return (a - a.mean()) / a.std()
+
+    @staticmethod
+    def _series_key(values: np.ndarray, dates: pd.Index) -> str:
+        """정렬된 target 값 + 날짜 → 캐시 키"""
+        h = hashlib.sha1(np.ascontiguousarray(values).tobytes())
+        h.update(pd.util.hash_pandas_object(pd.Index(dates), index=False).values.tobytes())
+        return h.hexdigest()
+
     def plot_coherence(
         self,
         result: dict,
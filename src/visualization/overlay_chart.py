@@ -198,3 +198,70 @@ def plot_index_vs_btc(
         logger.info(f"Index vs BTC chart saved → {default_path}")
 
     plt.close()
+
+
+def plot_rolling_lead(
+    rolling: pd.DataFrame,
+    alpha: float = 0.05,
+    title: str = "Rolling Lead-Lag (Granger / CWS)",
+    save_path: str | None = None,
+) -> None:
+    """
+    RollingLeadAnalyzer.analyze() 결과 — plot_index_vs_btc와 같은 날짜 축.
+
+    - 상단: Granger 최소 p-value (forward Index→BTC / reverse BTC→Index, log scale)
+    - 하단: CWS 최적 lag (좌축) + 해당 lag의 MDA (우축)
+    """
+    fig, (ax1, ax3) = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
+    dates = rolling.index
+
+    # Granger p-values
+    ax1.plot(dates, rolling["granger_forward_p"], color="#2196F3",
+             linewidth=1.5, label="Index→BTC p")
+    ax1.plot(dates, rolling["granger_reverse_p"], color="#F44336",
+             linewidth=1.5, label="BTC→Index p", alpha=0.8)
+    ax1.axhline(y=alpha, color="gray", linestyle="--", alpha=0.5,
+                label=f"α = {alpha}")
+    ax1.set_yscale("log")
+    ax1.set_ylabel("Granger p-value (min over lags)")
+    ax1.legend(loc="upper left")
+    ax1.grid(True, alpha=0.3)
+
+    # CWS optimal lag + MDA
+    color_lag = "#4CAF50"
+    ax3.step(dates, rolling["cws_lag"], where="post", color=color_lag,
+             linewidth=1.5, label="CWS optimal lag")
+    ax3.set_ylabel("Optimal lag (months)", color=color_lag)
+    ax3.tick_params(axis="y", labelcolor=color_lag)
+
+    ax4 = ax3.twinx()
+    color_mda = "#FF9800"
+    ax4.plot(dates, rolling["mda"], color=color_mda, linewidth=1.5,
+             label="MDA", alpha=0.9)
+    ax4.axhline(y=0.5, color="gray", linestyle="--", alpha=0.3)
+    ax4.set_ylabel("MDA", color=color_mda)
+    ax4.tick_params(axis="y", labelcolor=color_mda)
+
+    lines1, labels1 = ax3.get_legend_handles_labels()
+    lines2, labels2 = ax4.get_legend_handles_labels()
+    ax3.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
+
+    # Format
+    if len(dates) and hasattr(dates[0], 'strftime'):
+        ax3.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
+        ax3.xaxis.set_major_locator(mdates.MonthLocator(interval=6))
+        plt.setp(ax3.get_xticklabels(), rotation=45)
+
+    fig.suptitle(title, fontsize=14, fontweight="bold")
+    fig.tight_layout()
+
+    if save_path:
+        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        logger.info(f"Rolling lead chart saved → {save_path}")
+    else:
+        default_path = CHARTS_DIR / "rolling_lead.png"
+        default_path.parent.mkdir(parents=True, exist_ok=True)
+        plt.savefig(default_path, dpi=150, bbox_inches="tight")
+        logger.info(f"Rolling lead chart saved → {default_path}")
+
+    plt.close()
@@ -0,0 +1,208 @@
+"""공용 fixture — FRED / Treasury / Yahoo 응답을 흉내 내는 로컬 http.server.
+
+실제 API 대신 127.0.0.1 임시 포트의 stand-in 서버로 fetcher를 연결:
+  - FRED:     Fred.root_url → {url}/fred (XML observations, fredapi 파서 그대로)
+  - Treasury: TREASURY_TGA_ENDPOINT → {url}/treasury (JSON data + meta 페이지)
+  - Yahoo:    market_fetcher.yf → Ticker.history()가 {url}/yahoo/{ticker} 호출
+raw 저장소는 테스트별 임시 SQLite, source별 token bucket도 테스트마다 새로 생성.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.fetchers import market_fetcher, raw_store, scheduler, treasury_fetcher  # noqa: E402
+
+
+class StandInAPI:
+    """
+    FRED / Treasury / Yahoo stand-in.
+
+    requests: 받은 요청 (route, id, query, 수신 시각) — 중복 제거·rate 검증용
+    delay:    route별 응답 지연 (초) — 지연 통계·동시 실행 검증용
+    fail:     오류로 응답할 FRED 시리즈 / Yahoo 티커 id
+    empty:    빈 history를 반환할 Yahoo 티커 (신규 거래 없음)
+    """
+
+    def __init__(self):
+        self.requests: list[tuple[str, str, dict, float]] = []
+        self.delay: dict[str, float] = {}
+        self.fail: set[str] = set()
+        self.empty: set[str] = set()
+        self._lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                api._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def calls(self, route: str, ident: str | None = None) -> list[tuple]:
+        with self._lock:
+            return [
+                r for r in self.requests
+                if r[0] == route and (ident is None or r[1] == ident)
+            ]
+
+    # ── 요청 처리 ──
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(handler.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        parts = parsed.path.strip("/").split("/")
+        route = parts[0]
+        if route == "fred":
+            ident = query.get("series_id", "")
+        elif route == "yahoo":
+            ident = parts[-1]
+        else:
+            ident = query.get("filter", "").split(",")[0]
+        with self._lock:
+            self.requests.append((route, ident, query, time.monotonic()))
+
+        time.sleep(self.delay.get(route, 0.0))
+        if route == "fred":
+            status, ctype, body = self._fred(ident, query)
+        elif route == "treasury":
+            status, ctype, body = self._treasury(query)
+        elif route == "yahoo":
+            status, ctype, body = self._yahoo(ident, query)
+        else:
+            status, ctype, body = 404, "text/plain", b"not found"
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", ctype)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _fred(self, series_id: str, query: dict) -> tuple[int, str, bytes]:
+        if series_id in self.fail:
+            return 400, "text/xml", (
+                '<error code="400" message="Bad Request. '
+                'The series does not exist."/>'
+            ).encode()
+        dates = pd.date_range(query["observation_start"], query["observation_end"], freq="MS")
+        rows = "".join(
+            f'<observation date="{d:%Y-%m-%d}" value="{100.0 + i}"/>'
+            for i, d in enumerate(dates)
+        )
+        return 200, "text/xml", f"<observations>{rows}</observations>".encode()
+
+    def _treasury(self, query: dict) -> tuple[int, str, bytes]:
+        parts = query["filter"].split(",")
+        account = parts[0].split(":eq:")[1]
+        start = parts[1].split(":gte:")[1]
+        end = parts[2].split(":lte:")[1]
+        dates = pd.bdate_range(start, end)
+        size = int(query["page[size]"])
+        page = int(query["page[number]"])
+        chunk = dates[(page - 1) * size: page * size]
+        payload = {
+            "data": [
+                {
+                    "record_date": f"{d:%Y-%m-%d}",
+                    "open_today_bal": f"{700000 + d.day * 1000:,}",
+                    "account_type": account,
+                }
+                for d in chunk
+            ],
+            "meta": {"total-pages": max(1, -(-len(dates) // size))},
+        }
+        return 200, "application/json", json.dumps(payload).encode()
+
+    def _yahoo(self, ticker: str, query: dict) -> tuple[int, str, bytes]:
+        if ticker in self.fail:
+            return 500, "application/json", b'{"error": "upstream"}'
+        dates = pd.date_range(query["start"], query["end"], freq="D", inclusive="left")
+        if ticker in self.empty:
+            dates = dates[:0]
+        close = [20000.0 + i for i in range(len(dates))]
+        payload = {
+            "date": [f"{d:%Y-%m-%d}" for d in dates],
+            "open": close, "high": close, "low": close, "close": close,
+            "volume": [1.0e6] * len(dates),
+        }
+        return 200, "application/json", json.dumps(payload).encode()
+
+
+class _StandInTicker:
+    """yfinance.Ticker 대체 — history()가 stand-in 서버의 Yahoo 경로 호출"""
+
+    def __init__(self, base_url: str, ticker: str):
+        self._url = f"{base_url}/yahoo/{ticker}"
+
+    def history(self, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        resp = requests.get(
+            self._url, params={"start": start, "end": end, "interval": interval}, timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        # yfinance와 같은 형태: tz-aware DatetimeIndex "Date" + 대문자 OHLCV 열
+        index = pd.DatetimeIndex(pd.to_datetime(data["date"]), name="Date").tz_localize(
+            "America/New_York"
+        )
+        return pd.DataFrame(
+            {
+                "Open": data["open"], "High": data["high"], "Low": data["low"],
+                "Close": data["close"], "Volume": data["volume"],
+            },
+            index=index,
+        )
+
+
+class _StandInYFinance:
+    def __init__(self, base_url: str):
+        self._base_url = base_url
+
+    def Ticker(self, ticker: str) -> _StandInTicker:  # noqa: N802 — yfinance API 이름
+        return _StandInTicker(self._base_url, ticker)
+
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    """stand-in 서버 + fetcher 연결 (임시 raw 저장소, 새 token bucket)"""
+    server = StandInAPI()
+    monkeypatch.setattr(raw_store, "RAW_STORE_PATH", tmp_path / "raw_store.db")
+    monkeypatch.setattr(raw_store, "RAW_DIR", tmp_path / "raw")
+    monkeypatch.setattr(scheduler, "_LIMITERS", {})
+    monkeypatch.setattr(
+        treasury_fetcher, "TREASURY_TGA_ENDPOINT", f"{server.url}/treasury"
+    )
+    monkeypatch.setattr(market_fetcher, "yf", _StandInYFinance(server.url))
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def fred_fetcher(api):
+    """stand-in 서버를 쓰는 FredFetcher"""
+    from src.fetchers.fred_fetcher import FredFetcher
+
+    fetcher = FredFetcher(api_key="test-key")
+    fetcher.fred.root_url = f"{api.url}/fred"
+    return fetcher
@@ -0,0 +1,60 @@
+"""증분(delta) 수집 — 만료된 캐시 재요청 구간과 메타데이터 갱신."""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.fetchers.market_fetcher import MarketFetcher
+
+START, END = "2020-01-01", "2020-12-31"
+
+
+def _expire(store, series: str, hours: float = 48) -> None:
+    """fetched_at을 과거로 — 캐시 만료 상태 재현"""
+    meta = store.meta(series)
+    meta["fetched_at"] = (datetime.now() - timedelta(hours=hours)).isoformat()
+    store.write(series, meta["source"], store.read(series), meta)
+
+
+def test_expired_ticker_requests_only_revision_window(api):
+    market = MarketFetcher()
+    full = market.fetch_ticker("BTC-USD", START, END, cache_name="btc_spot")
+    _expire(market.store, "market_btc_spot")
+
+    again = MarketFetcher().fetch_ticker("BTC-USD", START, END, cache_name="btc_spot")
+    calls = api.calls("yahoo", "BTC-USD")
+
+    assert len(calls) == 2
+    assert calls[1][2]["start"] == "2020-12-23"   # last_date - 7일 (yahoo 수정 구간)
+    assert len(again) == len(full)
+
+
+def test_empty_yahoo_delta_refreshes_fetched_at(api):
+    market = MarketFetcher()
+    market.fetch_ticker("BTC-USD", START, END, cache_name="btc_spot")
+    _expire(market.store, "market_btc_spot")
+    before = market.store.meta("market_btc_spot")
+
+    api.empty.add("BTC-USD")
+    stale = MarketFetcher().fetch_ticker("BTC-USD", START, END, cache_name="btc_spot")
+    after = market.store.meta("market_btc_spot")
+
+    assert len(stale) == before["n_rows"]
+    assert after["fetched_at"] > before["fetched_at"]
+    assert after["full_fetched_at"] == before["full_fetched_at"]
+    assert after["last_date"] == before["last_date"]
+
+    # 갱신된 fetched_at → 다음 호출은 캐시 hit (재요청 없음)
+    MarketFetcher().fetch_ticker("BTC-USD", START, END, cache_name="btc_spot")
+    assert len(api.calls("yahoo", "BTC-USD")) == 2
+
+
+def test_cache_hit_reads_requested_period_only(api, fred_fetcher):
+    fred_fetcher.fetch_series("WALCL", START, END)
+    tail = fred_fetcher.fetch_series("WALCL", "2020-07-01", END)
+
+    assert len(api.calls("fred", "WALCL")) == 1
+    assert tail["date"].min() == pd.Timestamp("2020-07-01")
+    assert len(tail) == 6
+    # 저장소에는 전체 이력 유지
+    assert fred_fetcher.store.meta("fred_WALCL")["n_rows"] == 12
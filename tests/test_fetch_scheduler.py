@@ -0,0 +1,173 @@
+"""FetchScheduler / TokenBucket / fetcher 중복 제거 — stand-in 서버 (conftest.api) 기반."""
+
+import threading
+import time
+
+import pytest
+
+from config.constants import TREASURY_TGA_FILTER_NEW, TREASURY_TGA_FILTER_OLD
+from src.fetchers import scheduler, treasury_fetcher
+from src.fetchers.market_fetcher import MarketFetcher
+from src.fetchers.scheduler import FetchScheduler, TokenBucket
+from src.fetchers.treasury_fetcher import TreasuryFetcher
+
+START, END = "2020-01-01", "2020-12-31"
+
+
+# ── TokenBucket ──
+
+def test_token_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(rate_per_min=600, burst=2)   # 10 req/s
+    t0 = time.monotonic()
+    waits = [bucket.acquire() for _ in range(6)]
+    elapsed = time.monotonic() - t0
+
+    assert waits[:2] == [0.0, 0.0]
+    assert all(w > 0 for w in waits[2:])
+    # burst 2개 이후 4개는 0.1s 간격
+    assert elapsed >= 0.35
+
+
+def test_token_bucket_is_shared_across_threads():
+    bucket = TokenBucket(rate_per_min=1200, burst=1)  # 20 req/s
+    stamps, lock = [], threading.Lock()
+
+    def worker():
+        for _ in range(3):
+            bucket.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    t0 = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 12회 = 첫 토큰 + 11회 충전 (스레드 수와 무관)
+    assert len(stamps) == 12
+    assert max(stamps) - t0 >= 11 / 20 - 0.05
+
+
+def test_fred_requests_respect_rate_limit(api, fred_fetcher, monkeypatch):
+    monkeypatch.setitem(
+        scheduler.FETCH_CONFIG["rate_limits"], "fred", {"per_min": 600, "burst": 1},
+    )
+    series = ["WALCL", "RRPONTSYD", "WTREGEN", "M2SL"]
+    with FetchScheduler(max_workers=4) as pool:
+        futures = [
+            pool.submit("fred", s, fred_fetcher.fetch_series, s, START, END, use_cache=False)
+            for s in series
+        ]
+        for f in futures:
+            f.result()
+
+    stamps = sorted(r[3] for r in api.calls("fred"))
+    assert len(stamps) == 4
+    # 동시 제출이어도 서버 도착은 ~0.1s 간격 (10 req/s, burst 1)
+    assert stamps[-1] - stamps[0] >= 0.25
+
+
+# ── 중복 제거 ──
+
+def test_scheduler_dedups_same_source_and_key(api, fred_fetcher):
+    with FetchScheduler(max_workers=4) as pool:
+        first = pool.submit("fred", "WALCL", fred_fetcher.fetch_series, "WALCL", START, END)
+        second = pool.submit("fred", "WALCL", fred_fetcher.fetch_series, "WALCL", START, END)
+        other = pool.submit("treasury", "WALCL", lambda: "different source")
+        assert first is second
+        assert other is not first
+        df = first.result()
+        other.result()
+    stats = pool.report()
+
+    assert len(df) == 12
+    assert len(api.calls("fred", "WALCL")) == 1
+    assert stats["fred"]["calls"] == 1
+    assert stats["fred"]["deduplicated"] == 1
+    assert stats["treasury"]["calls"] == 1
+
+
+def test_market_fetcher_dedups_ticker_across_scheduler_keys(api):
+    api.delay["yahoo"] = 0.2   # 두 요청이 겹치도록
+    market = MarketFetcher()
+    with FetchScheduler(max_workers=4) as pool:
+        spot = pool.submit("yahoo", "btc_spot", market.fetch_btc_spot, START, END)
+        daily = pool.submit("yahoo", "btc_daily", market.fetch_btc_daily, START, END)
+        spot_df, daily_df = spot.result(), daily.result()
+    stats = pool.report()
+
+    # 스케줄러 키는 다르지만 같은 티커 → Yahoo 요청 1회
+    assert len(api.calls("yahoo", "BTC-USD")) == 1
+    assert stats["yahoo"]["calls"] == 2
+    assert stats["yahoo"]["deduplicated"] == 0
+    assert len(daily_df) == 365
+    assert len(spot_df) == 12
+    assert daily_df["btc_spot"].iloc[-1] == spot_df["btc_spot"].iloc[-1]
+
+
+def test_treasury_fetches_both_account_filters_with_paging(api, monkeypatch):
+    monkeypatch.setattr(treasury_fetcher, "TREASURY_PAGE_SIZE", 10)
+    df = TreasuryFetcher().fetch_tga("2021-09-01", "2021-10-31")
+
+    old = api.calls("treasury", f"account_type:eq:{TREASURY_TGA_FILTER_OLD.split(':eq:')[1]}")
+    new = api.calls("treasury", f"account_type:eq:{TREASURY_TGA_FILTER_NEW.split(':eq:')[1]}")
+    assert len(old) == 3    # 9월 영업일 22개 / 10개씩
+    assert len(new) == 3    # 10월 영업일 21개
+    assert len(df) == 43
+    assert df["date"].is_monotonic_increasing
+
+
+# ── 오류 집계 ──
+
+def test_scheduler_counts_errors_and_propagates(api, fred_fetcher):
+    api.fail.add("BOGUS")
+    with FetchScheduler(max_workers=2) as pool:
+        bad = pool.submit("fred", "BOGUS", fred_fetcher.fetch_series, "BOGUS", START, END)
+        good = pool.submit("fred", "WALCL", fred_fetcher.fetch_series, "WALCL", START, END)
+        with pytest.raises(ValueError, match="does not exist"):
+            bad.result()
+        good.result()
+    stats = pool.report()
+
+    assert stats["fred"]["calls"] == 2
+    assert stats["fred"]["errors"] == 1
+
+
+def test_market_fetcher_error_is_shared_with_waiting_callers(api):
+    api.fail.add("BTC-USD")
+    api.delay["yahoo"] = 0.2
+    market = MarketFetcher()
+    with FetchScheduler(max_workers=4) as pool:
+        spot = pool.submit("yahoo", "btc_spot", market.fetch_btc_spot, START, END)
+        daily = pool.submit("yahoo", "btc_daily", market.fetch_btc_daily, START, END)
+        for f in (spot, daily):
+            with pytest.raises(Exception):
+                f.result()
+    stats = pool.report()
+
+    assert len(api.calls("yahoo", "BTC-USD")) == 1
+    assert stats["yahoo"]["errors"] == 2
+
+
+# ── 지연 통계 ──
+
+def test_report_latency_stats(api, fred_fetcher):
+    api.delay["fred"] = 0.2
+    with FetchScheduler(max_workers=3) as pool:
+        futures = [
+            pool.submit("fred", s, fred_fetcher.fetch_series, s, START, END)
+            for s in ("WALCL", "RRPONTSYD", "WTREGEN")
+        ]
+        for f in futures:
+            f.result()
+    stats = pool.report()
+
+    fred = stats["fred"]
+    assert fred["calls"] == 3
+    assert fred["errors"] == 0
+    assert 0.2 <= fred["mean_s"] <= fred["max_s"]
+    assert fred["total_s"] == pytest.approx(3 * fred["mean_s"], abs=0.01)
+    # 동시 실행: wall time < 개별 지연 합
+    assert stats["wall_s"] < fred["total_s"]
@@ -0,0 +1,90 @@
+"""GridSearchOptimizer 엔진 일치 — loop / batch / moments, 직렬 / 병렬, 예산 탐색."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.optimizers.grid_search import GridSearchOptimizer
+
+VARS = ["NL_level", "GM2_resid", "HY_level", "CME_basis"]
+
+# 4변수 × 5단계 = 625 조합 (0 포함 — 전부 0인 조합은 제외됨), lag 0-4
+CONFIG = {
+    "NL_level":   {"min": 0.0, "max": 2.0, "step": 0.5},
+    "GM2_resid":  {"min": -1.0, "max": 1.0, "step": 0.5},
+    "HY_level":   {"min": -2.0, "max": 0.0, "step": 0.5},
+    "CME_basis":  {"min": 0.0, "max": 2.0, "step": 0.5},
+    "lag_months": {"min": 0, "max": 4, "step": 1},
+}
+
+
+@pytest.fixture(scope="module")
+def data():
+    """합성 z_matrix (CME 초기 구간·중간 행 NaN) + lag 2의 log BTC"""
+    rng = np.random.default_rng(7)
+    n = 90
+    z = pd.DataFrame(rng.normal(size=(n, len(VARS))), columns=VARS)
+    z.loc[:11, "CME_basis"] = np.nan      # 상장 이전
+    z.loc[40:42, "GM2_resid"] = np.nan    # 결측 행
+    signal = (1.5 * z["NL_level"] + 0.5 * z["GM2_resid"].fillna(0)
+              - 1.0 * z["HY_level"]).to_numpy()
+    target = np.r_[np.zeros(2), signal[:-2]] + rng.normal(scale=0.8, size=n)
+    return z, pd.Series(np.cumsum(target) * 0.01 + target, name="log_btc")
+
+
+def _run(data, **kw):
+    z, btc = data
+    opt = GridSearchOptimizer(search_config=CONFIG, progress=False, **kw)
+    return opt.optimize(z, btc, variable_names=VARS)
+
+
+def _key(result):
+    return [
+        (tuple(r["weights"][v] for v in VARS), r["lag"], round(r["correlation"], 10))
+        for r in result["top_50"]
+    ]
+
+
+@pytest.fixture(scope="module")
+def reference(data):
+    return _run(data, engine="loop")
+
+
+@pytest.mark.parametrize("engine", ["batch", "moments"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_engines_match_loop(data, reference, engine, workers):
+    result = _run(data, engine=engine, batch_size=64, workers=workers)
+
+    assert result["weights"] == reference["weights"]
+    assert result["optimal_lag"] == reference["optimal_lag"]
+    assert result["correlation"] == pytest.approx(reference["correlation"], abs=1e-12)
+    assert _key(result) == _key(reference)
+    assert result["lag_distribution"] == reference["lag_distribution"]
+    assert result["total_evaluated"] == reference["total_evaluated"]
+
+
+def test_reference_recovers_planted_lag(reference):
+    assert reference["optimal_lag"] == 2
+    assert len(reference["top_50"]) == 50
+
+
+def test_budgeted_search_with_full_budget_matches_exhaustive(data, reference):
+    z, btc = data
+    opt = GridSearchOptimizer(search_config=CONFIG, progress=False, batch_size=64)
+    result = opt.optimize_budgeted(
+        z, btc, variable_names=VARS, max_evals=625, reference=reference,
+    )
+
+    assert result["weights"] == reference["weights"]
+    assert result["optimal_lag"] == reference["optimal_lag"]
+    assert result["exhaustive_gap"]["correlation_gap"] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_budgeted_search_respects_budget(data):
+    z, btc = data
+    opt = GridSearchOptimizer(search_config=CONFIG, progress=False, batch_size=64)
+    result = opt.optimize_budgeted(z, btc, variable_names=VARS, max_evals=100)
+
+    assert result["n_evaluated"] <= 100
+    assert result["grid_size"] == 625
+    assert result["top_50"]
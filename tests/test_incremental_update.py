@@ -0,0 +1,197 @@
+"""update 모드 증분 처리 — 꼬리 재계산 + 저장된 직교화 로그·zscore_params 고정 적용."""
+
+import json
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fetchers import raw_store
+from src.optimizers.orthogonalize import apply_orthogonalization
+from src.pipeline import runner as runner_module
+from src.pipeline.runner import PipelineRunner
+from src.utils.date_utils import resample_to_monthly
+
+START = "2016-01-01"
+END, EXTENDED_END = "2024-06-15", "2024-07-20"   # 한 달 추가
+
+
+def _raw_data(end: str) -> dict:
+    """_fetch_all과 같은 형태의 합성 raw (시드 고정 — end만 늘리면 앞 구간 동일)"""
+    daily = pd.date_range(START, end, freq="D")
+    weekly = pd.date_range("2016-01-06", end, freq="W-WED")
+    monthly = pd.date_range(START, end, freq="MS")
+
+    def walk(dates, base, vol, seed):
+        steps = np.random.default_rng(seed).normal(0, vol, len(dates))
+        return pd.DataFrame({"date": dates, "value": base + np.cumsum(steps)})
+
+    cn = walk(monthly, 150000, 500, 5)
+    eu = walk(monthly, 12000, 50, 6)
+    walcl = walk(weekly, 4_000_000, 20000, 1)
+    # HY 스프레드가 연준 자산과 역상관 → HY_level이 NL_level 기준으로 직교화됨
+    hy = walcl.set_index("date")["value"].reindex(daily, method="ffill").bfill()
+    hy_noise = np.random.default_rng(9).normal(0, 0.05, len(daily))
+    fred = {
+        "WALCL": walcl,
+        "RRP": walk(daily, 500, 5, 2).assign(value=lambda d: d["value"].abs()),
+        "SOFR": walk(daily[daily >= "2018-04-02"], 2, 0.02, 3),
+        "IORB": walk(daily[daily >= "2021-07-29"], 2, 0.01, 4),
+        "US_M2": walk(monthly, 15000, 50, 7),
+        "EU_M2": eu[eu["date"] <= "2023-11-01"],
+        "CN_M2": cn[cn["date"] <= "2019-08-01"],
+        "JP_M2": walk(monthly, 9000, 20, 8),
+        "HY_SPREAD": pd.DataFrame({"date": daily, "value": 10 - hy.to_numpy() / 1e6 + hy_noise}),
+    }
+    tga = pd.DataFrame({
+        "date": daily,
+        "tga_balance": 0.5 + np.abs(np.cumsum(
+            np.random.default_rng(10).normal(0, 0.01, len(daily)))),
+    })
+    price = np.exp(8 + np.cumsum(np.random.default_rng(11).normal(0, 0.03, len(daily))))
+    btc_daily = pd.DataFrame({"date": daily, "btc_spot": price})
+    basis = np.random.default_rng(12).normal(0.005, 0.003, len(daily))
+    cme_daily = pd.DataFrame({"date": daily, "cme_futures": price * (1 + basis)})
+    return {
+        "fred": fred,
+        "tga": tga,
+        "dxy": pd.DataFrame(),
+        "btc_spot": resample_to_monthly(btc_daily, "btc_spot"),
+        "cme_futures_monthly": pd.DataFrame(),
+        "btc_daily": btc_daily,
+        "cme_daily": cme_daily[cme_daily["date"] >= "2017-12-18"].reset_index(drop=True),
+    }
+
+
+class _Runner(PipelineRunner):
+    """수집은 합성 raw, Step 5-6은 고정 결과 (Steps 1-4와 상태 저장만 실제 코드)"""
+
+    raw: dict = {}
+
+    def _fetch_stage(self, start, end, use_cache):
+        return self.raw
+
+    def _optimize(self, z_matrix, log_btc):
+        return {
+            "weights": {"NL_level": 0.5, "GM2_resid": 0.3, "HY_level": -0.2},
+            "optimal_lag": 3,
+            "correlation": 0.5,
+        }
+
+    def _walk_forward(self, *args):
+        return {}
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    """임시 상태 파일·raw 저장소 + 최적화 결과를 JSON 왕복으로 돌려주는 storage"""
+    monkeypatch.setattr(runner_module, "UPDATE_STATE_PATH", tmp_path / "update_state.pkl")
+    monkeypatch.setattr(raw_store, "RAW_STORE_PATH", tmp_path / "raw_store.db")
+    monkeypatch.setattr(raw_store, "RAW_DIR", tmp_path / "raw")
+
+    store = mock.MagicMock()
+    saved = {}
+
+    def save_optimization_result(result):
+        saved["opt"] = json.loads(json.dumps(result, default=float))
+
+    store.save_optimization_result.side_effect = save_optimization_result
+    store.load_latest_optimization.side_effect = lambda: saved.get("opt")
+    monkeypatch.setattr(runner_module, "StorageManager", lambda: store)
+    return saved
+
+
+def _run(mode: str, end: str) -> tuple[PipelineRunner, list[int]]:
+    """runner 실행 → (runner, _calculate_all에 들어간 TGA 행 수)"""
+    _Runner.raw = _raw_data(end)
+    calc_rows = []
+    calculate_all = PipelineRunner._calculate_all
+
+    def counting(self, raw):
+        calc_rows.append(len(raw["tga"]))
+        return calculate_all(self, raw)
+
+    runner = _Runner(mode=mode, use_stage_cache=False)
+    with mock.patch.object(PipelineRunner, "_calculate_all", counting):
+        runner.run(START, end)
+    return runner, calc_rows
+
+
+@pytest.fixture
+def updated(storage):
+    """N개월 full 실행 → 한 달 추가 후 update 실행"""
+    full, _ = _run("full", END)
+    before = full._load_update_state()
+    runner, calc_rows = _run("update", EXTENDED_END)
+    return runner, before, runner._load_update_state(), calc_rows
+
+
+# 12m MA 등 누적 연산의 합산 순서 차이 (꼬리만 계산 vs 전체 이력) — 값 O(1)에서 ~1e-14
+ATOL = 1e-13
+
+
+def _assert_frames_close(a: pd.DataFrame, b: pd.DataFrame):
+    a, b = a.reset_index(drop=True), b.reset_index(drop=True)
+    assert list(a.columns) == list(b.columns)
+    assert (a["date"] == b["date"]).all()
+    for col in a.columns.drop("date"):
+        np.testing.assert_allclose(a[col], b[col], rtol=0, atol=ATOL, err_msg=col)
+
+
+def test_update_recomputes_only_the_tail(updated):
+    _, before, after, calc_rows = updated
+
+    full_rows = len(_raw_data(EXTENDED_END)["tga"])
+    assert len(calc_rows) == 1
+    assert calc_rows[0] < full_rows / 4     # MA 윈도우 + 여유 구간만
+    assert len(after["variables"]) == len(before["variables"]) + 1
+
+
+def test_update_variables_match_full_reprocess(updated):
+    runner, _, after, _ = updated
+    variables, log_btc, *_ = runner._process_all(START, EXTENDED_END, True)
+
+    _assert_frames_close(after["variables"], variables)
+    np.testing.assert_allclose(after["log_btc"], log_btc, rtol=0, atol=ATOL)
+
+
+def test_new_rows_use_saved_ortho_log_and_zscore_params(updated, storage):
+    runner, before, after, _ = updated
+
+    assert before["ortho_log"]              # 직교화가 실제로 적용된 데이터
+    assert after["ortho_log"] == before["ortho_log"]
+    assert after["z_params"] == storage["opt"]["zscore_params"]
+
+    # 전체 이력에 저장된 β·α / mean·std를 적용한 결과와 같음 (재추정 없음)
+    variables = after["variables"]
+    expected = apply_orthogonalization(
+        {c: variables[c] for c in variables.columns.drop("date")}, before["ortho_log"])
+    for entry in before["ortho_log"]:
+        col = entry["target"]
+        np.testing.assert_allclose(
+            after["ortho_vars"][col], expected[col], rtol=0, atol=ATOL, err_msg=col)
+    z_expected, _ = runner._zscore_all(after["ortho_vars"], before["z_params"])
+    _assert_frames_close(after["z_matrix"], z_expected)
+
+    # 새로 적합했다면 마지막 달 값이 달라짐
+    refit_z, _ = runner._zscore_all(runner._orthogonalize(variables)[0])
+    assert not np.isclose(
+        refit_z["NL_level"].iloc[-1], after["z_matrix"]["NL_level"].iloc[-1])
+
+
+def test_changed_digest_falls_back_to_full_processing(storage, monkeypatch):
+    _run("full", END)
+    monkeypatch.setattr(PipelineRunner, "_update_digest", lambda self: "changed")
+    _, calc_rows = _run("update", EXTENDED_END)
+
+    assert calc_rows == [len(_raw_data(EXTENDED_END)["tga"])]
+
+
+def test_changed_zscore_params_fall_back_to_full_processing(storage):
+    _run("full", END)
+    storage["opt"]["zscore_params"]["NL_level"]["std"] *= 2
+    runner, calc_rows = _run("update", EXTENDED_END)
+
+    assert calc_rows == [len(_raw_data(EXTENDED_END)["tga"])]
+    assert runner._load_update_state()["z_params"] == storage["opt"]["zscore_params"]
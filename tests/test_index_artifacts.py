@@ -0,0 +1,103 @@
+"""Stage 1 artifact — 새 달이 추가된 입력은 최신 artifact transform (재적합 없음)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.index_builders import artifact_store
+from src.index_builders.artifact_store import ModelArtifactStore
+from src.index_builders.pca_builder import PCAIndexBuilder
+from src.pipeline import runner_v2
+from src.pipeline.runner_v2 import PipelineRunnerV2
+
+VARS = ["NL_level", "GM2_resid", "HY_level", "CME_basis"]
+
+
+def _z_matrix(n: int) -> pd.DataFrame:
+    """
+    같은 합성 이력의 앞 n개월 — HY 적재가 가장 커서 svd_flip 후 PC1이 HY와
+    양의 상관 → 적합 시 부호 보정 (sign = -1).
+    """
+    rng = np.random.default_rng(11)
+    size = 200
+    common = rng.normal(size=size)
+    z = pd.DataFrame({
+        "NL_level": common + 0.3 * rng.normal(size=size),
+        "GM2_resid": 0.5 * common + 0.5 * rng.normal(size=size),
+        "HY_level": -1.5 * common + 0.3 * rng.normal(size=size),
+        "CME_basis": 0.8 * rng.normal(size=size),
+    })
+    z.loc[3, "NL_level"] = 4.0   # winsorize 대상 (NL ±3)
+    return z.iloc[:n]
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    monkeypatch.setattr(runner_v2, "INDICES_DIR", tmp_path / "indices")
+    r = PipelineRunnerV2(method="pca", use_artifacts=False)
+    r.artifacts = ModelArtifactStore(tmp_path / "models")
+    return r
+
+
+@pytest.fixture
+def fits(monkeypatch):
+    """PCAIndexBuilder.build 호출 수"""
+    calls = []
+    build = PCAIndexBuilder.build
+
+    def counting_build(self, z_matrix):
+        calls.append(len(z_matrix))
+        return build(self, z_matrix)
+
+    monkeypatch.setattr(PCAIndexBuilder, "build", counting_build)
+    return calls
+
+
+def test_appended_month_transforms_with_latest_artifact(runner, fits):
+    base = runner.run_stage1(_z_matrix(120))
+    assert fits == [120]
+    meta = runner.artifacts._list("pca")[0][1]
+    assert meta["sign"] == -1.0       # 적합 시 부호 보정 적용됨
+
+    extended = _z_matrix(121)
+    result = runner.run_stage1(extended, reuse_latest=True)
+
+    assert fits == [120]              # 재적합 없음
+    assert len(runner.artifacts._list("pca")) == 1
+    assert result["n_observations"] == 121
+    # 기존 구간은 적합 당시 index와 동일, 새 달은 저장된 부호로 transform
+    pd.testing.assert_series_equal(result["index"].iloc[:120], base["index"])
+    builder, _ = runner.artifacts.load("pca", runner.clip_map)
+    expected = -builder.transform(runner._winsorize(extended))
+    assert result["index"].iloc[-1] == pytest.approx(expected.iloc[-1], abs=1e-12)
+
+
+def test_transform_latest_matches_stage1_reuse(runner, fits):
+    runner.run_stage1(_z_matrix(120))
+    extended = _z_matrix(121)
+
+    direct = runner.transform_latest(extended)
+    via_stage1 = runner.run_stage1(extended, reuse_latest=True)
+
+    assert fits == [120]
+    pd.testing.assert_series_equal(direct["index"], via_stage1["index"])
+
+
+def test_without_reuse_appended_month_refits(runner, fits):
+    runner.run_stage1(_z_matrix(120))
+    runner.run_stage1(_z_matrix(121))
+
+    assert fits == [120, 121]
+    assert len(runner.artifacts._list("pca")) == 2
+
+
+def test_changed_builder_digest_is_not_reused(runner, fits, monkeypatch):
+    runner.run_stage1(_z_matrix(120))
+    monkeypatch.setattr(
+        artifact_store.ModelArtifactStore, "builder_digest",
+        staticmethod(lambda method: "changed"),
+    )
+
+    assert runner.transform_latest(_z_matrix(121)) is None
+    runner.run_stage1(_z_matrix(121), reuse_latest=True)
+    assert fits == [120, 121]